@@ -0,0 +1,83 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+import argparse
+from threading import Event
+from time import perf_counter, sleep
+
+from pytdlib import Client
+from .tdjson import FakeTdJson, config, update_new_message
+
+
+def run(mode: dict, count: int, workers: int, rate: int = None) -> dict:
+    tdjson = FakeTdJson()
+    client = Client(tdjson=tdjson, profile="bench", config=config())
+    latencies = []
+    done = Event()
+
+    def handler(update):
+        latencies.append(perf_counter() - tdjson.stamps[update.message.id])
+
+        if len(latencies) == count:
+            done.set()
+
+    client.set_update_handler(handler)
+    client.start(workers=workers, **mode)
+    client.logged_in = True
+
+    events = [(i, update_new_message(i)) for i in range(count)]
+    start = perf_counter()
+
+    if rate is None:
+        tdjson.feed(events)
+    else:
+        for i, event in enumerate(events):
+            tdjson.feed([event])
+            sleep(max(0.0, start + (i + 1) / rate - perf_counter()))
+
+    done.wait()
+    elapsed = perf_counter() - start
+    client.stop()
+
+    latencies.sort()
+
+    return {
+        "updates/s": count / elapsed,
+        "p50 ms": latencies[len(latencies) // 2] * 1000,
+        "p99 ms": latencies[int(len(latencies) * 0.99)] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Update dispatch latency and throughput")
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--rate", type=int, default=500, help="updates/s fed for the latency run")
+    args = parser.parse_args()
+
+    modes = (("pipeline", {}), ("single-stage", {"single_stage": True}), ("sharded", {"sharded": True}))
+
+    for name, mode in modes:
+        burst = run(mode, args.count, args.workers)
+        paced = run(mode, args.count // 4, args.workers, args.rate)
+        print("{:<14}burst updates/s: {:.0f}  paced p50 ms: {:.3f}  paced p99 ms: {:.3f}".format(
+            name, burst["updates/s"], paced["p50 ms"], paced["p99 ms"]))
+
+
+if "__main__" == __name__:
+    main()
@@ -0,0 +1,55 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+import gc
+import argparse
+import resource
+from json import loads
+from time import perf_counter
+
+from pytdlib.api.util import Object
+from .tdjson import dumps, message
+
+
+def rss() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory held by decoded message objects")
+    parser.add_argument("--count", type=int, default=1000000)
+    parser.add_argument("--lazy", action="store_true")
+    args = parser.parse_args()
+
+    data = dumps(message(1))
+    read = Object.read_lazy if args.lazy else Object.read
+    gc.collect()
+    before = rss()
+
+    start = perf_counter()
+    messages = [read(loads(data)) for _ in range(args.count)]
+    elapsed = perf_counter() - start
+    after = rss()
+
+    print("{} {} messages: {:.1f} MiB RSS, {:.0f} bytes/message, {:.2f} s".format(
+        args.count, "lazy" if args.lazy else "eager", (after - before) / 2 ** 20,
+        (after - before) / len(messages), elapsed))
+
+
+if "__main__" == __name__:
+    main()
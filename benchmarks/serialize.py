@@ -0,0 +1,95 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+import argparse
+from collections import OrderedDict
+from json import JSONEncoder, dumps
+from timeit import timeit
+
+from pytdlib.api.util import Object
+from pytdlib.api.util.codec import codecs
+from pytdlib.api.functions import sendMessage
+from pytdlib.api.types import (inputMessageText, formattedText, textEntity, textEntityTypeBold,
+                               replyMarkupInlineKeyboard, inlineKeyboardButton, inlineKeyboardButtonTypeCallback)
+
+
+class DictEncoder(JSONEncoder):
+    def default(self, o: object):
+        return OrderedDict(
+            [("@type", o.ID), ("@extra", o.extra)]
+            + [(i, getattr(o, i)) for i in o.fields()]
+        )
+
+
+def generic(value):
+    # Object.to_dict applied all the way down, as before the generated serializers
+    if isinstance(value, Object):
+        content = {"@type": value.ID}
+
+        for k in value.fields():
+            content[k] = generic(getattr(value, k))
+
+        if value.extra is not None:
+            content["@extra"] = value.extra
+
+        return content
+    elif isinstance(value, list):
+        return [generic(i) for i in value]
+    return value
+
+
+def request(entities: int) -> sendMessage:
+    request = sendMessage(
+        1, 0, False, False,
+        replyMarkupInlineKeyboard([
+            [inlineKeyboardButton("button", inlineKeyboardButtonTypeCallback("")) for _ in range(3)]
+        ]),
+        inputMessageText(
+            formattedText("x" * entities * 2, [textEntity(i * 2, 1, textEntityTypeBold()) for i in range(entities)]),
+            False,
+            True
+        )
+    )
+    request.extra = 1
+    return request
+
+
+def main():
+    parser = argparse.ArgumentParser(description="sendMessage serialization cost")
+    parser.add_argument("--entities", type=int, default=20)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    data = request(args.entities)
+    cases = [
+        ("JSONEncoder.default", lambda: dumps(data, cls=DictEncoder).encode('utf-8')),
+        ("generic to_dict", lambda: generic(data)),
+        ("generated to_dict", data.to_dict),
+        ("to_json", data.to_json),
+    ]
+
+    for name, (codec, module) in codecs.items():
+        if module is not None:
+            cases.append(("to_json [{}]".format(name), lambda codec=codec: codec.dumps(data.to_dict())))
+
+    for name, case in cases:
+        print("{:<22}{:8.2f} us".format(name, timeit(case, number=args.number) / args.number * 1e6))
+
+
+if "__main__" == __name__:
+    main()
@@ -0,0 +1,89 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import subprocess
+from statistics import median
+from contextlib import redirect_stdout
+
+from generate.api import generator as api_generator
+from generate.error import generator as error_generator
+
+PROBE = """
+import json, resource, sys
+from time import perf_counter
+start = perf_counter()
+import pytdlib
+imported = perf_counter() - start
+from pytdlib.api.util import Object
+Object.read({"@type": "updateNewMessage", "message": %s, "disable_notification": False, "contains_mention": False})
+decoded = perf_counter() - start
+print(json.dumps({"import": imported, "first update": decoded, "modules": len(sys.modules),
+                  "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}))
+"""
+
+
+def build(layout: str, consolidated: bool) -> str:
+    root = tempfile.mkdtemp(prefix="pytdlib-{}-".format(layout))
+    shutil.copytree("pytdlib", os.path.join(root, "pytdlib"),
+                    ignore=shutil.ignore_patterns("__pycache__", "types", "functions", "exceptions"))
+
+    api_generator.DESTINATION = os.path.join(root, "pytdlib/api")
+    error_generator.dest = os.path.join(root, "pytdlib/api/errors/exceptions")
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        api_generator.start(consolidated=consolidated)
+        error_generator.start()
+
+    subprocess.check_call([sys.executable, "-m", "compileall", "-q", os.path.join(root, "pytdlib")])
+    return root
+
+
+def probe(root: str) -> dict:
+    from .tdjson import message
+
+    env = dict(os.environ, PYTHONPATH=root)
+    output = subprocess.check_output([sys.executable, "-c", PROBE % repr(message(1))], env=env, cwd=root)
+    return json.loads(output.decode("utf-8"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start time and RSS for both generated layouts")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    for layout, consolidated in (("modules", False), ("consolidated", True)):
+        root = build(layout, consolidated)
+        results = [probe(root) for _ in range(args.runs)]
+        shutil.rmtree(root)
+
+        print("{:<13} import: {:.1f} ms  first update: {:.1f} ms  modules: {}  max RSS: {:.1f} MiB".format(
+            layout,
+            median(i["import"] for i in results) * 1000,
+            median(i["first update"] for i in results) * 1000,
+            results[0]["modules"],
+            median(i["rss"] for i in results) / 1024))
+
+
+if "__main__" == __name__:
+    main()
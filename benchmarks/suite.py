@@ -0,0 +1,160 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+from statistics import median
+from time import perf_counter
+from timeit import timeit
+
+from pytdlib import Client
+from pytdlib.api.util import Object
+from pytdlib.api.functions import getMe
+from . import dispatch, serialize, startup
+from .tdjson import FakeTdJson, config, update_stream
+
+
+def decode(count: int, lazy: bool) -> float:
+    events = [event for key, event in update_stream(count)]
+    read = Object.read_lazy if lazy else Object.read
+    loads = Object.codec.loads
+
+    start = perf_counter()
+    for event in events:
+        read(loads(event))
+
+    return count / (perf_counter() - start)
+
+
+def to_json(number: int) -> float:
+    data = serialize.request(20)
+    return timeit(data.to_json, number=number) / number * 1e6
+
+
+def round_trip(number: int, batch: int = 0) -> float:
+    client = Client(tdjson=FakeTdJson(), profile="bench", config=config())
+    client.start()
+
+    try:
+        if batch:
+            start = perf_counter()
+            for _ in range(number // batch):
+                client.send_many([getMe() for _ in range(batch)])
+            return (perf_counter() - start) / (number // batch * batch) * 1e6
+
+        start = perf_counter()
+        for _ in range(number):
+            client.send(getMe())
+        return (perf_counter() - start) / number * 1e6
+    finally:
+        client.stop()
+
+
+def import_time() -> dict:
+    # The checked out tree as it is, without regenerating
+    return startup.probe(os.getcwd())
+
+
+# name: (unit, better, run(args) -> value)
+BENCHMARKS = {
+    "decode": ("updates/s", "higher", lambda args: decode(args.count, False)),
+    "decode lazy": ("updates/s", "higher", lambda args: decode(args.count, True)),
+    "to_json sendMessage": ("us", "lower", lambda args: to_json(args.count)),
+    "round trip": ("us", "lower", lambda args: round_trip(args.count // 10)),
+    "round trip send_many": ("us", "lower", lambda args: round_trip(args.count // 10, 100)),
+    "dispatch burst": ("updates/s", "higher",
+                       lambda args: dispatch.run({"single_stage": True}, args.count, 2)["updates/s"]),
+    "dispatch p50": ("ms", "lower",
+                     lambda args: dispatch.run({"single_stage": True}, args.count // 10, 2, 500)["p50 ms"]),
+    "dispatch p99": ("ms", "lower",
+                     lambda args: dispatch.run({"single_stage": True}, args.count // 10, 2, 500)["p99 ms"]),
+    "import": ("ms", "lower", lambda args: import_time()["import"] * 1000),
+    "first update": ("ms", "lower", lambda args: import_time()["first update"] * 1000),
+}
+
+
+def commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline: dict):
+    print("{:<22}{:>14}{:>14}{:>10}".format("benchmark", "baseline", "current", "change"))
+
+    for name, result in results["results"].items():
+        old = baseline["results"].get(name)
+
+        if old is None:
+            print("{:<22}{:>14}{:>14.3f}".format(name, "-", result["value"]))
+            continue
+
+        change = (result["value"] - old["value"]) / old["value"] * 100
+        better = change >= 0 if result["better"] == "higher" else change <= 0
+
+        print("{:<22}{:>14.3f}{:>14.3f}{:>9.1f}% {}".format(
+            name, old["value"], result["value"], change, "" if better else "(worse)"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pytdlib microbenchmarks against a fake libtdjson")
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark, the median is kept")
+    parser.add_argument("--only", nargs="*", choices=list(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare against")
+    args = parser.parse_args()
+
+    results = {
+        "meta": {
+            "commit": commit(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "codec": Object.codec.__name__,
+            "count": args.count,
+        },
+        "results": {},
+    }
+
+    for name in args.only or BENCHMARKS:
+        unit, better, run = BENCHMARKS[name]
+        value = median(run(args) for _ in range(args.repeat))
+        results["results"][name] = {"value": value, "unit": unit, "better": better}
+        print("{:<22}{:>14.3f} {}".format(name, value, unit), file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    elif not args.compare:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(results, json.load(f))
+
+
+if "__main__" == __name__:
+    main()
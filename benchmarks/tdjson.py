@@ -0,0 +1,187 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import json
+import random
+import tempfile
+from queue import Queue, Empty
+from time import perf_counter
+
+
+def dumps(data: dict) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+class Symbol:
+
+    def __init__(self, func: callable):
+        self.func = func
+        self.restype = None
+        self.argtypes = None
+
+    def __call__(self, *args):
+        return self.func(*args)
+
+
+class FakeTdJson:
+    """Stand-in for the ``td_json_client_*`` symbols :class:`pytdlib.actor.Actor` binds, pass it as ``Client(tdjson=...)``.
+
+    Requests are answered from ``responses``, a dict of request ``@type`` to a response dict or a
+    ``callable(request) -> dict``, anything else gets ``ok``. Updates are whatever is fed, as ``(key, event)`` pairs;
+    the time an event with a key is received lands in ``stamps[key]``.
+    """
+
+    def __init__(self, responses: dict = None):
+        self.events = Queue()
+        self.stamps = {}
+        self.responses = dict(RESPONSES, **(responses or {}))
+
+        self.td_json_client_create = Symbol(lambda: 1)
+        self.td_json_client_receive = Symbol(self.receive)
+        self.td_json_client_send = Symbol(self.send)
+        self.td_json_client_execute = Symbol(self.execute)
+        self.td_json_client_destroy = Symbol(lambda client_id: None)
+        self.td_set_log_file_path = Symbol(lambda path: 1)
+        self.td_set_log_max_file_size = Symbol(lambda size: None)
+        self.td_set_log_verbosity_level = Symbol(lambda level: None)
+        self.td_set_log_fatal_error_callback = Symbol(lambda callback: None)
+
+    def feed(self, events: list):
+        for event in events:
+            self.events.put(event)
+
+    def receive(self, client_id: int, timeout: float) -> bytes:
+        try:
+            key, event = self.events.get(timeout=min(timeout, 0.1))
+        except Empty:
+            return None
+
+        if key is not None:
+            self.stamps[key] = perf_counter()
+
+        return event
+
+    def respond(self, request: dict) -> dict:
+        response = self.responses.get(request["@type"])
+
+        if response is None:
+            return {"@type": "ok"}
+
+        return response(request) if callable(response) else dict(response)
+
+    def send(self, client_id: int, request: bytes):
+        request = json.loads(request.decode("utf-8"))
+
+        if request.get("@extra") is not None:
+            response = self.respond(request)
+            response["@extra"] = request["@extra"]
+            self.events.put((None, dumps(response)))
+
+    def execute(self, client_id: int, request: bytes) -> bytes:
+        return dumps(self.respond(json.loads(request.decode("utf-8"))))
+
+
+def config() -> str:
+    directory = tempfile.mkdtemp(prefix="pytdlib-bench-")
+
+    with open(os.path.join(directory, "config"), "w", encoding="utf-8") as f:
+        f.write('default_profile = "bench";\nbench = {{ config_directory = "{}"; }};\n'.format(directory))
+
+    return os.path.join(directory, "config")
+
+
+def message(message_id: int, chat_id: int = 1) -> dict:
+    return {
+        "@type": "message", "id": message_id, "sender_user_id": 1, "chat_id": chat_id,
+        "is_outgoing": False, "can_be_edited": False, "can_be_forwarded": True,
+        "can_be_deleted_only_for_self": True, "can_be_deleted_for_all_users": False,
+        "is_channel_post": False, "contains_unread_mention": False, "date": 1546300800, "edit_date": 0,
+        "reply_to_message_id": 0, "ttl": 0, "ttl_expires_in": 0.0, "via_bot_user_id": 0,
+        "author_signature": "", "views": 0, "media_album_id": "0",
+        "content": {
+            "@type": "messageText",
+            "text": {
+                "@type": "formattedText", "text": "ping",
+                "entities": [{"@type": "textEntity", "offset": 0, "length": 4,
+                              "type": {"@type": "textEntityTypeBold"}}]
+            }
+        }
+    }
+
+
+def update_new_message(message_id: int, chat_id: int = 1) -> bytes:
+    return dumps({
+        "@type": "updateNewMessage",
+        "message": message(message_id, chat_id),
+        "disable_notification": False,
+        "contains_mention": False
+    })
+
+
+def user(user_id: int) -> dict:
+    return {
+        "@type": "user", "id": user_id, "first_name": "Bench", "last_name": "", "username": "bench",
+        "phone_number": "", "status": {"@type": "userStatusOnline", "expires": 1546300800},
+        "outgoing_link": {"@type": "linkStateNone"}, "incoming_link": {"@type": "linkStateNone"},
+        "is_verified": False, "restriction_reason": "", "have_access": True, "type": {"@type": "userTypeRegular"},
+        "language_code": "en"
+    }
+
+
+RESPONSES = {
+    "getMe": lambda request: user(1),
+    "getUser": lambda request: user(request["user_id"]),
+    "getMessage": lambda request: message(request["message_id"], request["chat_id"]),
+}
+
+
+def update_user_status(user_id: int) -> bytes:
+    return dumps({"@type": "updateUserStatus", "user_id": user_id,
+                  "status": {"@type": "userStatusOnline", "expires": 1546300800}})
+
+
+def update_chat_read_inbox(chat_id: int, message_id: int) -> bytes:
+    return dumps({"@type": "updateChatReadInbox", "chat_id": chat_id, "last_read_inbox_message_id": message_id,
+                  "unread_count": 0})
+
+
+def update_message_edited(chat_id: int, message_id: int) -> bytes:
+    return dumps({"@type": "updateMessageEdited", "chat_id": chat_id, "message_id": message_id,
+                  "edit_date": 1546300801})
+
+
+def update_stream(count: int, chats: int = 100, seed: int = 0) -> list:
+    """A reproducible mix of updates as fed to :meth:`FakeTdJson.feed`, new messages are keyed by message id."""
+    rnd = random.Random(seed)
+    events = []
+
+    for i in range(count):
+        chat_id = rnd.randrange(1, chats + 1)
+        kind = rnd.random()
+
+        if kind < 0.6:
+            events.append((i, update_new_message(i, chat_id)))
+        elif kind < 0.8:
+            events.append((None, update_user_status(rnd.randrange(1, 1000))))
+        elif kind < 0.95:
+            events.append((None, update_chat_read_inbox(chat_id, i)))
+        else:
+            events.append((None, update_message_edited(chat_id, i)))
+
+    return events
@@ -18,6 +18,7 @@
 
 import os
 import re
+import sys
 import shutil
 
 HOME = "generate/api"
@@ -50,16 +51,28 @@ def snek(s: str):
     return re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', s).lower()
 
 
-def start():
+def module_name(name: str) -> str:
+    # Importing a submodule binds it on the package, the leading underscore keeps that from replacing a class of
+    # the same name (message.py would shadow the message class the lazy __getattr__ has put there)
+    return "_" + snek(name)
+
+
+def start(consolidated: bool = False):
     shutil.rmtree("{}/types/".format(DESTINATION), ignore_errors=True)
     shutil.rmtree("{}/functions/".format(DESTINATION), ignore_errors=True)
 
     with open('{}/source/td_api.tl'.format(HOME), encoding='utf-8') as f:
             scheme = f.read()
 
+    with open("{}/template/module.txt".format(HOME), encoding="utf-8") as f:
+        module_template = f.read()
+
     with open("{}/template/class.txt".format(HOME), encoding="utf-8") as f:
         template = f.read()
 
+    with open("{}/template/init.txt".format(HOME), encoding="utf-8") as f:
+        init_template = f.read()
+
     with open(notice_path, encoding="utf-8") as f:
         notice = "\n".join("# {}".format(line).strip() for line in f.readlines())
 
@@ -127,6 +140,7 @@ def start():
             )
         )
 
+    sections = {"types": [], "functions": []}
     total = len(combinators)
     current = 0
 
@@ -136,22 +150,17 @@ def start():
         ), end='                                        \r', flush=True)
         current += 1
 
-        path = "{}/{}/".format(DESTINATION, c.section)
-        os.makedirs(path, exist_ok=True)
-        init = "{}/__init__.py".format(path)
-
-        if not os.path.exists(init):
-            with open(init, "w", encoding="utf-8") as f:
-                f.write(notice + "\n\n")
-
-        with open(init, "a", encoding="utf-8") as f:
-            f.write("from .{} import {}\n".format(snek(c.name), c.name))
+        os.makedirs("{}/{}/".format(DESTINATION, c.section), exist_ok=True)
 
         doc_args = []
         read_args = []
+        read_lazy = []
+        lazy_fields = []
+        dump_args = []
         fields = []
 
-        extra, has_extra = (", extra=None", "self.extra = extra") if c.section == "types" else ("", "")
+        extra, has_extra = (", extra=None", "self.extra = extra") if c.section == "types" else ("", "self.extra = None")
+        slots = ["extra"]
 
         if c.is_class:
             doc_args = c.doc + "\n\n    No parameters required."
@@ -161,6 +170,10 @@ def start():
                 for i in c.args
             ])
 
+            read_lazy = "return Object.read_lazy(q)"
+            lazy_fields = ""
+            to_dict = "return Object.to_dict(self)"
+
             arguments = ""
             fields = "pass"
             return_arguments = ""
@@ -175,6 +188,7 @@ def start():
                     field_type = core_types[arg_type]
                     arg_type = "(:obj:`{}`)".format(core_types[arg_type])
                     arg_read = "q['{}']".format(arg_name)
+                    arg_dump = "self.{}".format(arg_name)
 
                 elif arg_type.startswith("vector"):
                     sub_type = arg_type.split("<", 1)[1][:-1]
@@ -185,24 +199,34 @@ def start():
                             arg_type = "(List of List of :obj:`{}`)".format(core_types[sub_type])
                             field_type = "list of List of {}".format(core_types[sub_type])
                             arg_read = "q['{}']".format(arg_name)
+                            arg_dump = "self.{}".format(arg_name)
 
                         else:
                             arg_type = "(List of List of :class:`pytdlib.api.types.{}`)".format(sub_type)
                             field_type = "list of list({})".format(sub_type)
                             arg_read = "[[Object.read(v) for v in i] for i in q['{}']]".format(arg_name)
+                            arg_dump = ("[[v.to_dict() for v in i] for i in self.{0}] "
+                                        "if self.{0} is not None else None").format(arg_name)
+                            lazy_fields.append(arg_name)
                     else:
                         if sub_type in core_types:
                             arg_type = "(List of :obj:`{}`)".format(core_types[sub_type])
                             field_type = "list of {}".format(core_types[sub_type])
                             arg_read = "q['{}']".format(arg_name)
+                            arg_dump = "self.{}".format(arg_name)
 
                         else:
                             arg_type = "(List of :class:`pytdlib.api.types.{}`)".format(sub_type)
                             field_type = "list of {}".format(sub_type)
                             arg_read = "[Object.read(i) for i in q['{}']]".format(arg_name)
+                            arg_dump = ("[i.to_dict() for i in self.{0}] "
+                                        "if self.{0} is not None else None").format(arg_name)
+                            lazy_fields.append(arg_name)
 
                 else:
-                    arg_read = "\"{0}\" in q and Object.read(q['{0}']) or \"\"".format(arg_name)
+                    arg_read = "Object.read(q['{0}']) if \"{0}\" in q else \"\"".format(arg_name)
+                    arg_dump = "self.{0} and self.{0}.to_dict()".format(arg_name)
+                    lazy_fields.append(arg_name)
                     field_type = arg_type
                     arg_type = "(:class:`pytdlib.api.types.{}`)".format(arg_type)
 
@@ -222,6 +246,13 @@ def start():
                     )
                 )
 
+                if arg_name not in lazy_fields:
+                    read_lazy.append("obj.{0} = q['{0}']".format(arg_name))
+
+                slots.append(arg_name)
+
+                dump_args.append("\"{}\": {},".format(arg_name, arg_dump))
+
             if doc_args:
                 doc_args = "Args:\n        " + "\n        ".join(
                     "{}:\n            {}".format(
@@ -254,28 +285,70 @@ def start():
 
             return_read = c.name
 
-        with open("{}/{}/{}.py".format(DESTINATION, c.section, snek(c.name)), "w+", encoding="utf-8") as f:
-            f.write(
-                template.format(
-                    notice=notice,
-                    extra=extra,
-                    has_extra=has_extra,
-                    docstring=doc_args,
-                    class_name=c.name,
-                    arguments=arguments,
-                    fields=fields,
-                    return_read=return_read,
-                    read=read_args,
-                    return_arguments=return_arguments
+            if lazy_fields:
+                read_lazy = "\n        ".join(
+                    ["obj = {0}.__new__({0})".format(c.name), "obj._raw = q", "obj.extra = None"]
+                    + read_lazy
+                    + ["return obj"]
                 )
+                lazy_fields = "\n    LAZY_FIELDS = ({},)".format(", ".join('"{}"'.format(i) for i in lazy_fields))
+                slots.append("_raw")
+            else:
+                read_lazy = "return {}.read(q)".format(c.name)
+                lazy_fields = ""
+
+            to_dict = "\n        ".join(
+                ["content = {{\n            \"@type\": \"{}\",".format(c.name)]
+                + ["    " + i for i in dump_args]
+                + ["}",
+                   "if self.extra is not None:",
+                   "    content[\"@extra\"] = self.extra",
+                   "return content"]
             )
+
+        code = template.format(
+            extra=extra,
+            has_extra=has_extra,
+            docstring=doc_args,
+            class_name=c.name,
+            slots=", ".join('"{}"'.format(i) for i in slots) + ",",
+            lazy_fields=lazy_fields,
+            arguments=arguments,
+            fields=fields,
+            return_read=return_read,
+            read=read_args,
+            read_lazy=read_lazy,
+            to_dict=to_dict,
+            return_arguments=return_arguments
+        )
+
+        if consolidated:
+            sections[c.section].append(code)
+            continue
+
+        with open("{}/{}/{}.py".format(DESTINATION, c.section, module_name(c.name)), "w+", encoding="utf-8") as f:
+            f.write(module_template.format(notice=notice) + code)
+
+    for section in ("types", "functions"):
+        with open("{}/{}/__init__.py".format(DESTINATION, section), "w", encoding="utf-8") as f:
+            if consolidated:
+                f.write(module_template.format(notice=notice) + "".join(sections[section]))
+                continue
+
+            f.write(notice + "\n\n")
+            f.write(init_template.format(
+                modules="\n".join(
+                    "    \"{}\": \"{}\",".format(c.name, module_name(c.name)) for c in combinators if c.section == section
+                )
+            ))
+
     with open("{}/util/all_types.py".format(DESTINATION), "w", encoding="utf-8") as f:
         f.write(notice + "\n\n")
         f.write("types = {")
 
         for c in combinators:
             if c.section == "types":
-                f.write("\n    \"{0}\": \"types.{1}\",".format(c.name, snek(c.name)))
+                f.write("\n    \"{0}\": \"{1}\",".format(c.name, "types" if consolidated else "types." + module_name(c.name)))
         f.write("\n}\n")
     print('Generating Apis  : [100%]               ')
 
@@ -283,4 +356,4 @@ if '__main__' == __name__:
     HOME = "."
     DESTINATION = "../../pytdlib/api"
     notice_path = "../../NOTICE"
-    start()
+    start(consolidated="--consolidated" in sys.argv)
@@ -52,6 +52,7 @@ def start():
         f_all.write("exceptions = {\n")
 
         count = 0
+        tables = []
 
         for i in files:
             code, name = re.search(r"(\d+)_([A-Z_]+)", i).groups()
@@ -67,6 +68,8 @@ def start():
             with open(init, "a", encoding="utf-8") as f_init:
                 f_init.write("from .{}_{} import *\n".format(name.lower(), code))
 
+            tables.append((code, "{}_{}".format(name.lower(), code), []))
+
             with open("{}/source/{}".format(home, i), encoding="utf-8") as f_csv, \
                     open("{}/{}_{}.py".format(dest, name.lower(), code), "w", encoding="utf-8") as f_class:
                 reader = csv.reader(f_csv, delimiter="\t")
@@ -92,6 +95,7 @@ def start():
                     f_all.write("        \"{}\": \"{}\",\n".format(id, sub_class))
 
                     sub_classes.append((sub_class, id, message))
+                    tables[-1][2].append((id, sub_class))
 
                 with open("{}/template/class.txt".format(home), "r", encoding="utf-8") as f_class_template:
                     class_template = f_class_template.read()
@@ -124,6 +128,25 @@ def start():
     with open("{}/all.py".format(dest), "w", encoding="utf-8") as f:
         f.write(re.sub("{count}", str(count), content))
 
+    # Class references resolved at import time, so raising a known error is a couple of dict lookups
+    with open("{}/table.py".format(dest), "w", encoding="utf-8") as f:
+        f.write(notice + "\n\n")
+
+        for code, module, _ in tables:
+            f.write("from .{} import *\n".format(module))
+
+        f.write("\ntable = {\n")
+
+        for code, _, rows in tables:
+            f.write("    {}: {{\n".format(code))
+
+            for id, sub_class in rows:
+                f.write("        \"{}\": {},\n".format(id, sub_class))
+
+            f.write("    },\n")
+
+        f.write("}\n")
+
     print("Generating Errors: [100%]")
 
 
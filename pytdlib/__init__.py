@@ -20,4 +20,7 @@ __copyright__ = "Copyright (C) 2018-2019 Naji <https://github.com/i-naji>"
 __license__ = "GNU Lesser General Public License v3 or later (LGPLv3+)"
 __version__ = "0.0.1"
 
-from .client import Client
+from .client import Client, AsyncClient, Scheduler, UpdateLanes, in_process
+from .session import SessionHub, RetryPolicy, Recorder, Replayer
+from .cache import EntityCache, MessageCache, ExecuteCache
+from .metrics import Metrics, Hooks, CostProfiler
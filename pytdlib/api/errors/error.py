@@ -17,8 +17,10 @@
 # along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
 
 import re
-from importlib import import_module
-from .exceptions.all import exceptions
+from .sink import sink
+
+# Generated by generate/error/generator.py, imported on first use since its classes subclass Error
+table = None
 
 
 class Error(Exception):
@@ -35,27 +37,54 @@ class Error(Exception):
 
         self.x = x
 
-        # TODO: Proper log unknown errors
         if self.CODE == 520 or self.CODE != code:
-            with open("unknown_errors.txt", "a", encoding="utf-8") as f:
-                f.write("{}\t{}\n".format(code, message))
+            sink.record(code, message)
+
+    def __reduce__(self):
+        # __init__ takes different arguments than the ones stored in args, so skip it when unpickling
+        return Error.restore, (type(self), self.args, self.__dict__)
+
+    @staticmethod
+    def restore(cls: type, args: tuple, state: dict):
+        error = cls.__new__(cls, *args)
+        error.args = args
+        error.__dict__.update(state)
+        return error
 
     @staticmethod
     def raise_it(code: int, message: str):
+        global table
+
+        if table is None:
+            from .exceptions.table import table
+
+        classes = table.get(code)
+
+        if classes is None:
+            raise UnknownError(code, message, code)
+
+        error = classes.get(message)
+
+        if error is not None:
+            raise error(None, message, code=code)
+
+        # ID with a trailing number, e.g. FLOOD_WAIT_X
+        head, _, x = message.rpartition("_")
+
+        if x.isdigit():
+            error = classes.get(head + "_X")
+
+            if error is not None:
+                raise error(x, message, code=code)
 
-        if code not in exceptions:
-            raise UnknownError(code, message)
+        # Number in the middle, e.g. FILE_PART_X_MISSING
+        error = classes.get(re.sub(r"_\d+", "_X", message))
 
-        id = re.sub(r"_\d+", "_X", message)
-        if id not in exceptions[code]:
+        if error is None:
             raise UnknownError(code, message, code)
 
         x = re.search(r"(\d+)", message)
-        x = x.group(1) if x is not None else x
-        raise getattr(
-            import_module("pytdlib.api.errors"),
-            exceptions[code][id]
-        )(x, message, code=code)
+        raise error(x.group(1) if x is not None else x, message, code=code)
 
 
 class UnknownError(Error):
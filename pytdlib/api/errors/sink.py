@@ -0,0 +1,91 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+import atexit
+from queue import Queue, Empty
+from threading import Thread, Lock
+
+
+class UnknownErrorSink:
+    """Records errors missing from the generated table without blocking the thread that raised them.
+
+    Each distinct ``(code, message)`` pair is queued once per process and appended to ``path`` in batches by a
+    background thread. Once ``max_entries`` distinct pairs have been seen new ones are dropped.
+    """
+
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(self, path: str = "unknown_errors.txt", max_entries: int = 10000):
+        self.path = path
+        self.max_entries = max_entries
+        self.seen = set()
+        self.queue = Queue()
+        self.lock = Lock()
+        self.thread = None
+
+    def record(self, code: int, message: str):
+        key = (code, message)
+
+        if key in self.seen or len(self.seen) >= self.max_entries:
+            return
+
+        self.seen.add(key)
+        self.queue.put_nowait(key)
+
+        if self.thread is None:
+            self.run()
+
+    def run(self):
+        with self.lock:
+            if self.thread is None:
+                self.thread = Thread(target=self.worker, name="UnknownErrorSink", daemon=True)
+                self.thread.start()
+                atexit.register(self.flush)
+
+    def worker(self):
+
+        while True:
+            try:
+                batch = [self.queue.get(timeout=self.FLUSH_INTERVAL)]
+            except Empty:
+                continue
+
+            self.write(batch)
+
+    def flush(self):
+        self.write([])
+
+    def write(self, batch: list):
+        with self.lock:
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except Empty:
+                    break
+
+            if not batch:
+                return
+
+            try:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.writelines("{}\t{}\n".format(code, message) for code, message in batch)
+            except OSError:
+                pass
+
+
+sink = UnknownErrorSink()
@@ -19,6 +19,16 @@
 from importlib import import_module
 from .all_types import types
 from .object import Object
+from .codec import get_codec
 
-for k, v in types.items():
-    Object.all[k] = getattr(import_module("pytdlib.api." + v), k)
+__all__ = ["Object", "get_codec"]
+
+
+class Registry(dict):
+
+    def __missing__(self, key: str):
+        value = self[key] = getattr(import_module("pytdlib.api." + types[key].split(".")[0]), key)
+        return value
+
+
+Object.all = Registry()
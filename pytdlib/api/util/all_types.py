@@ -17,540 +17,540 @@
 # along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
 
 types = {
-    "error": "types.error",
-    "ok": "types.ok",
-    "tdlibParameters": "types.tdlib_parameters",
-    "authenticationCodeTypeTelegramMessage": "types.authentication_code_type_telegram_message",
-    "authenticationCodeTypeSms": "types.authentication_code_type_sms",
-    "authenticationCodeTypeCall": "types.authentication_code_type_call",
-    "authenticationCodeTypeFlashCall": "types.authentication_code_type_flash_call",
-    "authenticationCodeInfo": "types.authentication_code_info",
-    "authorizationStateWaitTdlibParameters": "types.authorization_state_wait_tdlib_parameters",
-    "authorizationStateWaitEncryptionKey": "types.authorization_state_wait_encryption_key",
-    "authorizationStateWaitPhoneNumber": "types.authorization_state_wait_phone_number",
-    "authorizationStateWaitCode": "types.authorization_state_wait_code",
-    "authorizationStateWaitPassword": "types.authorization_state_wait_password",
-    "authorizationStateReady": "types.authorization_state_ready",
-    "authorizationStateLoggingOut": "types.authorization_state_logging_out",
-    "authorizationStateClosing": "types.authorization_state_closing",
-    "authorizationStateClosed": "types.authorization_state_closed",
-    "passwordState": "types.password_state",
-    "passwordRecoveryInfo": "types.password_recovery_info",
-    "recoveryEmailAddress": "types.recovery_email_address",
-    "temporaryPasswordState": "types.temporary_password_state",
-    "localFile": "types.local_file",
-    "remoteFile": "types.remote_file",
-    "file": "types.file",
-    "inputFileId": "types.input_file_id",
-    "inputFileRemote": "types.input_file_remote",
-    "inputFileLocal": "types.input_file_local",
-    "inputFileGenerated": "types.input_file_generated",
-    "photoSize": "types.photo_size",
-    "maskPointForehead": "types.mask_point_forehead",
-    "maskPointEyes": "types.mask_point_eyes",
-    "maskPointMouth": "types.mask_point_mouth",
-    "maskPointChin": "types.mask_point_chin",
-    "maskPosition": "types.mask_position",
-    "textEntity": "types.text_entity",
-    "textEntities": "types.text_entities",
-    "formattedText": "types.formatted_text",
-    "animation": "types.animation",
-    "audio": "types.audio",
-    "document": "types.document",
-    "photo": "types.photo",
-    "sticker": "types.sticker",
-    "video": "types.video",
-    "videoNote": "types.video_note",
-    "voiceNote": "types.voice_note",
-    "contact": "types.contact",
-    "location": "types.location",
-    "venue": "types.venue",
-    "game": "types.game",
-    "profilePhoto": "types.profile_photo",
-    "chatPhoto": "types.chat_photo",
-    "linkStateNone": "types.link_state_none",
-    "linkStateKnowsPhoneNumber": "types.link_state_knows_phone_number",
-    "linkStateIsContact": "types.link_state_is_contact",
-    "userTypeRegular": "types.user_type_regular",
-    "userTypeDeleted": "types.user_type_deleted",
-    "userTypeBot": "types.user_type_bot",
-    "userTypeUnknown": "types.user_type_unknown",
-    "botCommand": "types.bot_command",
-    "botInfo": "types.bot_info",
-    "user": "types.user",
-    "userFullInfo": "types.user_full_info",
-    "userProfilePhotos": "types.user_profile_photos",
-    "users": "types.users",
-    "chatMemberStatusCreator": "types.chat_member_status_creator",
-    "chatMemberStatusAdministrator": "types.chat_member_status_administrator",
-    "chatMemberStatusMember": "types.chat_member_status_member",
-    "chatMemberStatusRestricted": "types.chat_member_status_restricted",
-    "chatMemberStatusLeft": "types.chat_member_status_left",
-    "chatMemberStatusBanned": "types.chat_member_status_banned",
-    "chatMember": "types.chat_member",
-    "chatMembers": "types.chat_members",
-    "supergroupMembersFilterRecent": "types.supergroup_members_filter_recent",
-    "supergroupMembersFilterAdministrators": "types.supergroup_members_filter_administrators",
-    "supergroupMembersFilterSearch": "types.supergroup_members_filter_search",
-    "supergroupMembersFilterRestricted": "types.supergroup_members_filter_restricted",
-    "supergroupMembersFilterBanned": "types.supergroup_members_filter_banned",
-    "supergroupMembersFilterBots": "types.supergroup_members_filter_bots",
-    "basicGroup": "types.basic_group",
-    "basicGroupFullInfo": "types.basic_group_full_info",
-    "supergroup": "types.supergroup",
-    "supergroupFullInfo": "types.supergroup_full_info",
-    "secretChatStatePending": "types.secret_chat_state_pending",
-    "secretChatStateReady": "types.secret_chat_state_ready",
-    "secretChatStateClosed": "types.secret_chat_state_closed",
-    "secretChat": "types.secret_chat",
-    "messageForwardedFromUser": "types.message_forwarded_from_user",
-    "messageForwardedPost": "types.message_forwarded_post",
-    "messageSendingStatePending": "types.message_sending_state_pending",
-    "messageSendingStateFailed": "types.message_sending_state_failed",
-    "message": "types.message",
-    "messages": "types.messages",
-    "foundMessages": "types.found_messages",
-    "notificationSettingsScopeChat": "types.notification_settings_scope_chat",
-    "notificationSettingsScopePrivateChats": "types.notification_settings_scope_private_chats",
-    "notificationSettingsScopeBasicGroupChats": "types.notification_settings_scope_basic_group_chats",
-    "notificationSettingsScopeAllChats": "types.notification_settings_scope_all_chats",
-    "notificationSettings": "types.notification_settings",
-    "draftMessage": "types.draft_message",
-    "chatTypePrivate": "types.chat_type_private",
-    "chatTypeBasicGroup": "types.chat_type_basic_group",
-    "chatTypeSupergroup": "types.chat_type_supergroup",
-    "chatTypeSecret": "types.chat_type_secret",
-    "chat": "types.chat",
-    "chats": "types.chats",
-    "chatInviteLink": "types.chat_invite_link",
-    "chatInviteLinkInfo": "types.chat_invite_link_info",
-    "keyboardButtonTypeText": "types.keyboard_button_type_text",
-    "keyboardButtonTypeRequestPhoneNumber": "types.keyboard_button_type_request_phone_number",
-    "keyboardButtonTypeRequestLocation": "types.keyboard_button_type_request_location",
-    "keyboardButton": "types.keyboard_button",
-    "inlineKeyboardButtonTypeUrl": "types.inline_keyboard_button_type_url",
-    "inlineKeyboardButtonTypeCallback": "types.inline_keyboard_button_type_callback",
-    "inlineKeyboardButtonTypeCallbackGame": "types.inline_keyboard_button_type_callback_game",
-    "inlineKeyboardButtonTypeSwitchInline": "types.inline_keyboard_button_type_switch_inline",
-    "inlineKeyboardButtonTypeBuy": "types.inline_keyboard_button_type_buy",
-    "inlineKeyboardButton": "types.inline_keyboard_button",
-    "replyMarkupRemoveKeyboard": "types.reply_markup_remove_keyboard",
-    "replyMarkupForceReply": "types.reply_markup_force_reply",
-    "replyMarkupShowKeyboard": "types.reply_markup_show_keyboard",
-    "replyMarkupInlineKeyboard": "types.reply_markup_inline_keyboard",
-    "richTextPlain": "types.rich_text_plain",
-    "richTextBold": "types.rich_text_bold",
-    "richTextItalic": "types.rich_text_italic",
-    "richTextUnderline": "types.rich_text_underline",
-    "richTextStrikethrough": "types.rich_text_strikethrough",
-    "richTextFixed": "types.rich_text_fixed",
-    "richTextUrl": "types.rich_text_url",
-    "richTextEmailAddress": "types.rich_text_email_address",
-    "richTexts": "types.rich_texts",
-    "pageBlockTitle": "types.page_block_title",
-    "pageBlockSubtitle": "types.page_block_subtitle",
-    "pageBlockAuthorDate": "types.page_block_author_date",
-    "pageBlockHeader": "types.page_block_header",
-    "pageBlockSubheader": "types.page_block_subheader",
-    "pageBlockParagraph": "types.page_block_paragraph",
-    "pageBlockPreformatted": "types.page_block_preformatted",
-    "pageBlockFooter": "types.page_block_footer",
-    "pageBlockDivider": "types.page_block_divider",
-    "pageBlockAnchor": "types.page_block_anchor",
-    "pageBlockList": "types.page_block_list",
-    "pageBlockBlockQuote": "types.page_block_block_quote",
-    "pageBlockPullQuote": "types.page_block_pull_quote",
-    "pageBlockAnimation": "types.page_block_animation",
-    "pageBlockAudio": "types.page_block_audio",
-    "pageBlockPhoto": "types.page_block_photo",
-    "pageBlockVideo": "types.page_block_video",
-    "pageBlockCover": "types.page_block_cover",
-    "pageBlockEmbedded": "types.page_block_embedded",
-    "pageBlockEmbeddedPost": "types.page_block_embedded_post",
-    "pageBlockCollage": "types.page_block_collage",
-    "pageBlockSlideshow": "types.page_block_slideshow",
-    "pageBlockChatLink": "types.page_block_chat_link",
-    "webPageInstantView": "types.web_page_instant_view",
-    "webPage": "types.web_page",
-    "labeledPricePart": "types.labeled_price_part",
-    "invoice": "types.invoice",
-    "shippingAddress": "types.shipping_address",
-    "orderInfo": "types.order_info",
-    "shippingOption": "types.shipping_option",
-    "savedCredentials": "types.saved_credentials",
-    "inputCredentialsSaved": "types.input_credentials_saved",
-    "inputCredentialsNew": "types.input_credentials_new",
-    "inputCredentialsAndroidPay": "types.input_credentials_android_pay",
-    "inputCredentialsApplePay": "types.input_credentials_apple_pay",
-    "paymentsProviderStripe": "types.payments_provider_stripe",
-    "paymentForm": "types.payment_form",
-    "validatedOrderInfo": "types.validated_order_info",
-    "paymentResult": "types.payment_result",
-    "paymentReceipt": "types.payment_receipt",
-    "messageText": "types.message_text",
-    "messageAnimation": "types.message_animation",
-    "messageAudio": "types.message_audio",
-    "messageDocument": "types.message_document",
-    "messagePhoto": "types.message_photo",
-    "messageExpiredPhoto": "types.message_expired_photo",
-    "messageSticker": "types.message_sticker",
-    "messageVideo": "types.message_video",
-    "messageExpiredVideo": "types.message_expired_video",
-    "messageVideoNote": "types.message_video_note",
-    "messageVoiceNote": "types.message_voice_note",
-    "messageLocation": "types.message_location",
-    "messageVenue": "types.message_venue",
-    "messageContact": "types.message_contact",
-    "messageGame": "types.message_game",
-    "messageInvoice": "types.message_invoice",
-    "messageCall": "types.message_call",
-    "messageBasicGroupChatCreate": "types.message_basic_group_chat_create",
-    "messageSupergroupChatCreate": "types.message_supergroup_chat_create",
-    "messageChatChangeTitle": "types.message_chat_change_title",
-    "messageChatChangePhoto": "types.message_chat_change_photo",
-    "messageChatDeletePhoto": "types.message_chat_delete_photo",
-    "messageChatAddMembers": "types.message_chat_add_members",
-    "messageChatJoinByLink": "types.message_chat_join_by_link",
-    "messageChatDeleteMember": "types.message_chat_delete_member",
-    "messageChatUpgradeTo": "types.message_chat_upgrade_to",
-    "messageChatUpgradeFrom": "types.message_chat_upgrade_from",
-    "messagePinMessage": "types.message_pin_message",
-    "messageScreenshotTaken": "types.message_screenshot_taken",
-    "messageChatSetTtl": "types.message_chat_set_ttl",
-    "messageCustomServiceAction": "types.message_custom_service_action",
-    "messageGameScore": "types.message_game_score",
-    "messagePaymentSuccessful": "types.message_payment_successful",
-    "messagePaymentSuccessfulBot": "types.message_payment_successful_bot",
-    "messageContactRegistered": "types.message_contact_registered",
-    "messageUnsupported": "types.message_unsupported",
-    "textEntityTypeMention": "types.text_entity_type_mention",
-    "textEntityTypeHashtag": "types.text_entity_type_hashtag",
-    "textEntityTypeBotCommand": "types.text_entity_type_bot_command",
-    "textEntityTypeUrl": "types.text_entity_type_url",
-    "textEntityTypeEmailAddress": "types.text_entity_type_email_address",
-    "textEntityTypeBold": "types.text_entity_type_bold",
-    "textEntityTypeItalic": "types.text_entity_type_italic",
-    "textEntityTypeCode": "types.text_entity_type_code",
-    "textEntityTypePre": "types.text_entity_type_pre",
-    "textEntityTypePreCode": "types.text_entity_type_pre_code",
-    "textEntityTypeTextUrl": "types.text_entity_type_text_url",
-    "textEntityTypeMentionName": "types.text_entity_type_mention_name",
-    "inputThumbnail": "types.input_thumbnail",
-    "inputMessageText": "types.input_message_text",
-    "inputMessageAnimation": "types.input_message_animation",
-    "inputMessageAudio": "types.input_message_audio",
-    "inputMessageDocument": "types.input_message_document",
-    "inputMessagePhoto": "types.input_message_photo",
-    "inputMessageSticker": "types.input_message_sticker",
-    "inputMessageVideo": "types.input_message_video",
-    "inputMessageVideoNote": "types.input_message_video_note",
-    "inputMessageVoiceNote": "types.input_message_voice_note",
-    "inputMessageLocation": "types.input_message_location",
-    "inputMessageVenue": "types.input_message_venue",
-    "inputMessageContact": "types.input_message_contact",
-    "inputMessageGame": "types.input_message_game",
-    "inputMessageInvoice": "types.input_message_invoice",
-    "inputMessageForwarded": "types.input_message_forwarded",
-    "searchMessagesFilterEmpty": "types.search_messages_filter_empty",
-    "searchMessagesFilterAnimation": "types.search_messages_filter_animation",
-    "searchMessagesFilterAudio": "types.search_messages_filter_audio",
-    "searchMessagesFilterDocument": "types.search_messages_filter_document",
-    "searchMessagesFilterPhoto": "types.search_messages_filter_photo",
-    "searchMessagesFilterVideo": "types.search_messages_filter_video",
-    "searchMessagesFilterVoiceNote": "types.search_messages_filter_voice_note",
-    "searchMessagesFilterPhotoAndVideo": "types.search_messages_filter_photo_and_video",
-    "searchMessagesFilterUrl": "types.search_messages_filter_url",
-    "searchMessagesFilterChatPhoto": "types.search_messages_filter_chat_photo",
-    "searchMessagesFilterCall": "types.search_messages_filter_call",
-    "searchMessagesFilterMissedCall": "types.search_messages_filter_missed_call",
-    "searchMessagesFilterVideoNote": "types.search_messages_filter_video_note",
-    "searchMessagesFilterVoiceAndVideoNote": "types.search_messages_filter_voice_and_video_note",
-    "searchMessagesFilterMention": "types.search_messages_filter_mention",
-    "searchMessagesFilterUnreadMention": "types.search_messages_filter_unread_mention",
-    "chatActionTyping": "types.chat_action_typing",
-    "chatActionRecordingVideo": "types.chat_action_recording_video",
-    "chatActionUploadingVideo": "types.chat_action_uploading_video",
-    "chatActionRecordingVoiceNote": "types.chat_action_recording_voice_note",
-    "chatActionUploadingVoiceNote": "types.chat_action_uploading_voice_note",
-    "chatActionUploadingPhoto": "types.chat_action_uploading_photo",
-    "chatActionUploadingDocument": "types.chat_action_uploading_document",
-    "chatActionChoosingLocation": "types.chat_action_choosing_location",
-    "chatActionChoosingContact": "types.chat_action_choosing_contact",
-    "chatActionStartPlayingGame": "types.chat_action_start_playing_game",
-    "chatActionRecordingVideoNote": "types.chat_action_recording_video_note",
-    "chatActionUploadingVideoNote": "types.chat_action_uploading_video_note",
-    "chatActionCancel": "types.chat_action_cancel",
-    "userStatusEmpty": "types.user_status_empty",
-    "userStatusOnline": "types.user_status_online",
-    "userStatusOffline": "types.user_status_offline",
-    "userStatusRecently": "types.user_status_recently",
-    "userStatusLastWeek": "types.user_status_last_week",
-    "userStatusLastMonth": "types.user_status_last_month",
-    "stickers": "types.stickers",
-    "stickerEmojis": "types.sticker_emojis",
-    "stickerSet": "types.sticker_set",
-    "stickerSetInfo": "types.sticker_set_info",
-    "stickerSets": "types.sticker_sets",
-    "callDiscardReasonEmpty": "types.call_discard_reason_empty",
-    "callDiscardReasonMissed": "types.call_discard_reason_missed",
-    "callDiscardReasonDeclined": "types.call_discard_reason_declined",
-    "callDiscardReasonDisconnected": "types.call_discard_reason_disconnected",
-    "callDiscardReasonHungUp": "types.call_discard_reason_hung_up",
-    "callProtocol": "types.call_protocol",
-    "callConnection": "types.call_connection",
-    "callId": "types.call_id",
-    "callStatePending": "types.call_state_pending",
-    "callStateExchangingKeys": "types.call_state_exchanging_keys",
-    "callStateReady": "types.call_state_ready",
-    "callStateHangingUp": "types.call_state_hanging_up",
-    "callStateDiscarded": "types.call_state_discarded",
-    "callStateError": "types.call_state_error",
-    "call": "types.call",
-    "animations": "types.animations",
-    "importedContacts": "types.imported_contacts",
-    "inputInlineQueryResultAnimatedGif": "types.input_inline_query_result_animated_gif",
-    "inputInlineQueryResultAnimatedMpeg4": "types.input_inline_query_result_animated_mpeg4",
-    "inputInlineQueryResultArticle": "types.input_inline_query_result_article",
-    "inputInlineQueryResultAudio": "types.input_inline_query_result_audio",
-    "inputInlineQueryResultContact": "types.input_inline_query_result_contact",
-    "inputInlineQueryResultDocument": "types.input_inline_query_result_document",
-    "inputInlineQueryResultGame": "types.input_inline_query_result_game",
-    "inputInlineQueryResultLocation": "types.input_inline_query_result_location",
-    "inputInlineQueryResultPhoto": "types.input_inline_query_result_photo",
-    "inputInlineQueryResultSticker": "types.input_inline_query_result_sticker",
-    "inputInlineQueryResultVenue": "types.input_inline_query_result_venue",
-    "inputInlineQueryResultVideo": "types.input_inline_query_result_video",
-    "inputInlineQueryResultVoiceNote": "types.input_inline_query_result_voice_note",
-    "inlineQueryResultArticle": "types.inline_query_result_article",
-    "inlineQueryResultContact": "types.inline_query_result_contact",
-    "inlineQueryResultLocation": "types.inline_query_result_location",
-    "inlineQueryResultVenue": "types.inline_query_result_venue",
-    "inlineQueryResultGame": "types.inline_query_result_game",
-    "inlineQueryResultAnimation": "types.inline_query_result_animation",
-    "inlineQueryResultAudio": "types.inline_query_result_audio",
-    "inlineQueryResultDocument": "types.inline_query_result_document",
-    "inlineQueryResultPhoto": "types.inline_query_result_photo",
-    "inlineQueryResultSticker": "types.inline_query_result_sticker",
-    "inlineQueryResultVideo": "types.inline_query_result_video",
-    "inlineQueryResultVoiceNote": "types.inline_query_result_voice_note",
-    "inlineQueryResults": "types.inline_query_results",
-    "callbackQueryPayloadData": "types.callback_query_payload_data",
-    "callbackQueryPayloadGame": "types.callback_query_payload_game",
-    "callbackQueryAnswer": "types.callback_query_answer",
-    "customRequestResult": "types.custom_request_result",
-    "gameHighScore": "types.game_high_score",
-    "gameHighScores": "types.game_high_scores",
-    "chatEventMessageEdited": "types.chat_event_message_edited",
-    "chatEventMessageDeleted": "types.chat_event_message_deleted",
-    "chatEventMessagePinned": "types.chat_event_message_pinned",
-    "chatEventMessageUnpinned": "types.chat_event_message_unpinned",
-    "chatEventMemberJoined": "types.chat_event_member_joined",
-    "chatEventMemberLeft": "types.chat_event_member_left",
-    "chatEventMemberInvited": "types.chat_event_member_invited",
-    "chatEventMemberPromoted": "types.chat_event_member_promoted",
-    "chatEventMemberRestricted": "types.chat_event_member_restricted",
-    "chatEventTitleChanged": "types.chat_event_title_changed",
-    "chatEventDescriptionChanged": "types.chat_event_description_changed",
-    "chatEventUsernameChanged": "types.chat_event_username_changed",
-    "chatEventPhotoChanged": "types.chat_event_photo_changed",
-    "chatEventInvitesToggled": "types.chat_event_invites_toggled",
-    "chatEventSignMessagesToggled": "types.chat_event_sign_messages_toggled",
-    "chatEventStickerSetChanged": "types.chat_event_sticker_set_changed",
-    "chatEventIsAllHistoryAvailableToggled": "types.chat_event_is_all_history_available_toggled",
-    "chatEvent": "types.chat_event",
-    "chatEvents": "types.chat_events",
-    "chatEventLogFilters": "types.chat_event_log_filters",
-    "deviceTokenGoogleCloudMessaging": "types.device_token_google_cloud_messaging",
-    "deviceTokenApplePush": "types.device_token_apple_push",
-    "deviceTokenApplePushVoIP": "types.device_token_apple_push_vo_ip",
-    "deviceTokenWindowsPush": "types.device_token_windows_push",
-    "deviceTokenMicrosoftPush": "types.device_token_microsoft_push",
-    "deviceTokenMicrosoftPushVoIP": "types.device_token_microsoft_push_vo_ip",
-    "deviceTokenWebPush": "types.device_token_web_push",
-    "deviceTokenSimplePush": "types.device_token_simple_push",
-    "deviceTokenUbuntuPush": "types.device_token_ubuntu_push",
-    "deviceTokenBlackberryPush": "types.device_token_blackberry_push",
-    "deviceTokenTizenPush": "types.device_token_tizen_push",
-    "wallpaper": "types.wallpaper",
-    "wallpapers": "types.wallpapers",
-    "hashtags": "types.hashtags",
-    "optionValueBoolean": "types.option_value_boolean",
-    "optionValueEmpty": "types.option_value_empty",
-    "optionValueInteger": "types.option_value_integer",
-    "optionValueString": "types.option_value_string",
-    "userPrivacySettingRuleAllowAll": "types.user_privacy_setting_rule_allow_all",
-    "userPrivacySettingRuleAllowContacts": "types.user_privacy_setting_rule_allow_contacts",
-    "userPrivacySettingRuleAllowUsers": "types.user_privacy_setting_rule_allow_users",
-    "userPrivacySettingRuleRestrictAll": "types.user_privacy_setting_rule_restrict_all",
-    "userPrivacySettingRuleRestrictContacts": "types.user_privacy_setting_rule_restrict_contacts",
-    "userPrivacySettingRuleRestrictUsers": "types.user_privacy_setting_rule_restrict_users",
-    "userPrivacySettingRules": "types.user_privacy_setting_rules",
-    "userPrivacySettingShowStatus": "types.user_privacy_setting_show_status",
-    "userPrivacySettingAllowChatInvites": "types.user_privacy_setting_allow_chat_invites",
-    "userPrivacySettingAllowCalls": "types.user_privacy_setting_allow_calls",
-    "accountTtl": "types.account_ttl",
-    "session": "types.session",
-    "sessions": "types.sessions",
-    "chatReportSpamState": "types.chat_report_spam_state",
-    "chatReportReasonSpam": "types.chat_report_reason_spam",
-    "chatReportReasonViolence": "types.chat_report_reason_violence",
-    "chatReportReasonPornography": "types.chat_report_reason_pornography",
-    "chatReportReasonCustom": "types.chat_report_reason_custom",
-    "publicMessageLink": "types.public_message_link",
-    "fileTypeNone": "types.file_type_none",
-    "fileTypeAnimation": "types.file_type_animation",
-    "fileTypeAudio": "types.file_type_audio",
-    "fileTypeDocument": "types.file_type_document",
-    "fileTypePhoto": "types.file_type_photo",
-    "fileTypeProfilePhoto": "types.file_type_profile_photo",
-    "fileTypeSecret": "types.file_type_secret",
-    "fileTypeSticker": "types.file_type_sticker",
-    "fileTypeThumbnail": "types.file_type_thumbnail",
-    "fileTypeUnknown": "types.file_type_unknown",
-    "fileTypeVideo": "types.file_type_video",
-    "fileTypeVideoNote": "types.file_type_video_note",
-    "fileTypeVoiceNote": "types.file_type_voice_note",
-    "fileTypeWallpaper": "types.file_type_wallpaper",
-    "fileTypeSecretThumbnail": "types.file_type_secret_thumbnail",
-    "storageStatisticsByFileType": "types.storage_statistics_by_file_type",
-    "storageStatisticsByChat": "types.storage_statistics_by_chat",
-    "storageStatistics": "types.storage_statistics",
-    "storageStatisticsFast": "types.storage_statistics_fast",
-    "networkTypeNone": "types.network_type_none",
-    "networkTypeMobile": "types.network_type_mobile",
-    "networkTypeMobileRoaming": "types.network_type_mobile_roaming",
-    "networkTypeWiFi": "types.network_type_wi_fi",
-    "networkTypeOther": "types.network_type_other",
-    "networkStatisticsEntryFile": "types.network_statistics_entry_file",
-    "networkStatisticsEntryCall": "types.network_statistics_entry_call",
-    "networkStatistics": "types.network_statistics",
-    "connectionStateWaitingForNetwork": "types.connection_state_waiting_for_network",
-    "connectionStateConnectingToProxy": "types.connection_state_connecting_to_proxy",
-    "connectionStateConnecting": "types.connection_state_connecting",
-    "connectionStateUpdating": "types.connection_state_updating",
-    "connectionStateReady": "types.connection_state_ready",
-    "topChatCategoryUsers": "types.top_chat_category_users",
-    "topChatCategoryBots": "types.top_chat_category_bots",
-    "topChatCategoryGroups": "types.top_chat_category_groups",
-    "topChatCategoryChannels": "types.top_chat_category_channels",
-    "topChatCategoryInlineBots": "types.top_chat_category_inline_bots",
-    "topChatCategoryCalls": "types.top_chat_category_calls",
-    "tMeUrlTypeUser": "types.t_me_url_type_user",
-    "tMeUrlTypeSupergroup": "types.t_me_url_type_supergroup",
-    "tMeUrlTypeChatInvite": "types.t_me_url_type_chat_invite",
-    "tMeUrlTypeStickerSet": "types.t_me_url_type_sticker_set",
-    "tMeUrl": "types.t_me_url",
-    "tMeUrls": "types.t_me_urls",
-    "count": "types.count",
-    "text": "types.text",
-    "textParseModeMarkdown": "types.text_parse_mode_markdown",
-    "textParseModeHTML": "types.text_parse_mode_html",
-    "proxyEmpty": "types.proxy_empty",
-    "proxySocks5": "types.proxy_socks5",
-    "inputSticker": "types.input_sticker",
-    "updateAuthorizationState": "types.update_authorization_state",
-    "updateNewMessage": "types.update_new_message",
-    "updateMessageSendAcknowledged": "types.update_message_send_acknowledged",
-    "updateMessageSendSucceeded": "types.update_message_send_succeeded",
-    "updateMessageSendFailed": "types.update_message_send_failed",
-    "updateMessageContent": "types.update_message_content",
-    "updateMessageEdited": "types.update_message_edited",
-    "updateMessageViews": "types.update_message_views",
-    "updateMessageContentOpened": "types.update_message_content_opened",
-    "updateMessageMentionRead": "types.update_message_mention_read",
-    "updateNewChat": "types.update_new_chat",
-    "updateChatTitle": "types.update_chat_title",
-    "updateChatPhoto": "types.update_chat_photo",
-    "updateChatLastMessage": "types.update_chat_last_message",
-    "updateChatOrder": "types.update_chat_order",
-    "updateChatIsPinned": "types.update_chat_is_pinned",
-    "updateChatReadInbox": "types.update_chat_read_inbox",
-    "updateChatReadOutbox": "types.update_chat_read_outbox",
-    "updateChatUnreadMentionCount": "types.update_chat_unread_mention_count",
-    "updateNotificationSettings": "types.update_notification_settings",
-    "updateChatReplyMarkup": "types.update_chat_reply_markup",
-    "updateChatDraftMessage": "types.update_chat_draft_message",
-    "updateDeleteMessages": "types.update_delete_messages",
-    "updateUserChatAction": "types.update_user_chat_action",
-    "updateUserStatus": "types.update_user_status",
-    "updateUser": "types.update_user",
-    "updateBasicGroup": "types.update_basic_group",
-    "updateSupergroup": "types.update_supergroup",
-    "updateSecretChat": "types.update_secret_chat",
-    "updateUserFullInfo": "types.update_user_full_info",
-    "updateBasicGroupFullInfo": "types.update_basic_group_full_info",
-    "updateSupergroupFullInfo": "types.update_supergroup_full_info",
-    "updateServiceNotification": "types.update_service_notification",
-    "updateFile": "types.update_file",
-    "updateFileGenerationStart": "types.update_file_generation_start",
-    "updateFileGenerationStop": "types.update_file_generation_stop",
-    "updateCall": "types.update_call",
-    "updateUserPrivacySettingRules": "types.update_user_privacy_setting_rules",
-    "updateOption": "types.update_option",
-    "updateInstalledStickerSets": "types.update_installed_sticker_sets",
-    "updateTrendingStickerSets": "types.update_trending_sticker_sets",
-    "updateRecentStickers": "types.update_recent_stickers",
-    "updateFavoriteStickers": "types.update_favorite_stickers",
-    "updateSavedAnimations": "types.update_saved_animations",
-    "updateConnectionState": "types.update_connection_state",
-    "updateNewInlineQuery": "types.update_new_inline_query",
-    "updateNewChosenInlineResult": "types.update_new_chosen_inline_result",
-    "updateNewCallbackQuery": "types.update_new_callback_query",
-    "updateNewInlineCallbackQuery": "types.update_new_inline_callback_query",
-    "updateNewShippingQuery": "types.update_new_shipping_query",
-    "updateNewPreCheckoutQuery": "types.update_new_pre_checkout_query",
-    "updateNewCustomEvent": "types.update_new_custom_event",
-    "updateNewCustomQuery": "types.update_new_custom_query",
-    "testInt": "types.test_int",
-    "testString": "types.test_string",
-    "testBytes": "types.test_bytes",
-    "testVectorInt": "types.test_vector_int",
-    "testVectorIntObject": "types.test_vector_int_object",
-    "testVectorString": "types.test_vector_string",
-    "testVectorStringObject": "types.test_vector_string_object",
-    "DeviceToken": "types.device_token",
-    "UserType": "types.user_type",
-    "NetworkType": "types.network_type",
-    "Update": "types.update",
-    "CallState": "types.call_state",
-    "AuthorizationState": "types.authorization_state",
-    "TopChatCategory": "types.top_chat_category",
-    "OptionValue": "types.option_value",
-    "MessageContent": "types.message_content",
-    "FileType": "types.file_type",
-    "ChatEventAction": "types.chat_event_action",
-    "MessageForwardInfo": "types.message_forward_info",
-    "LinkState": "types.link_state",
-    "InlineKeyboardButtonType": "types.inline_keyboard_button_type",
-    "ChatType": "types.chat_type",
-    "MaskPoint": "types.mask_point",
-    "InputCredentials": "types.input_credentials",
-    "AuthenticationCodeType": "types.authentication_code_type",
-    "TextEntityType": "types.text_entity_type",
-    "CallbackQueryPayload": "types.callback_query_payload",
-    "UserStatus": "types.user_status",
-    "InlineQueryResult": "types.inline_query_result",
-    "InputFile": "types.input_file",
-    "KeyboardButtonType": "types.keyboard_button_type",
-    "RichText": "types.rich_text",
-    "SupergroupMembersFilter": "types.supergroup_members_filter",
-    "TextParseMode": "types.text_parse_mode",
-    "ChatAction": "types.chat_action",
-    "NotificationSettingsScope": "types.notification_settings_scope",
-    "CallDiscardReason": "types.call_discard_reason",
-    "TMeUrlType": "types.t_me_url_type",
-    "PageBlock": "types.page_block",
-    "MessageSendingState": "types.message_sending_state",
-    "InputInlineQueryResult": "types.input_inline_query_result",
-    "UserPrivacySettingRule": "types.user_privacy_setting_rule",
-    "ConnectionState": "types.connection_state",
-    "ChatReportReason": "types.chat_report_reason",
-    "SearchMessagesFilter": "types.search_messages_filter",
-    "ChatMemberStatus": "types.chat_member_status",
-    "ReplyMarkup": "types.reply_markup",
-    "Proxy": "types.proxy",
-    "SecretChatState": "types.secret_chat_state",
-    "NetworkStatisticsEntry": "types.network_statistics_entry",
-    "UserPrivacySetting": "types.user_privacy_setting",
-    "InputMessageContent": "types.input_message_content",
+    "error": "types._error",
+    "ok": "types._ok",
+    "tdlibParameters": "types._tdlib_parameters",
+    "authenticationCodeTypeTelegramMessage": "types._authentication_code_type_telegram_message",
+    "authenticationCodeTypeSms": "types._authentication_code_type_sms",
+    "authenticationCodeTypeCall": "types._authentication_code_type_call",
+    "authenticationCodeTypeFlashCall": "types._authentication_code_type_flash_call",
+    "authenticationCodeInfo": "types._authentication_code_info",
+    "authorizationStateWaitTdlibParameters": "types._authorization_state_wait_tdlib_parameters",
+    "authorizationStateWaitEncryptionKey": "types._authorization_state_wait_encryption_key",
+    "authorizationStateWaitPhoneNumber": "types._authorization_state_wait_phone_number",
+    "authorizationStateWaitCode": "types._authorization_state_wait_code",
+    "authorizationStateWaitPassword": "types._authorization_state_wait_password",
+    "authorizationStateReady": "types._authorization_state_ready",
+    "authorizationStateLoggingOut": "types._authorization_state_logging_out",
+    "authorizationStateClosing": "types._authorization_state_closing",
+    "authorizationStateClosed": "types._authorization_state_closed",
+    "passwordState": "types._password_state",
+    "passwordRecoveryInfo": "types._password_recovery_info",
+    "recoveryEmailAddress": "types._recovery_email_address",
+    "temporaryPasswordState": "types._temporary_password_state",
+    "localFile": "types._local_file",
+    "remoteFile": "types._remote_file",
+    "file": "types._file",
+    "inputFileId": "types._input_file_id",
+    "inputFileRemote": "types._input_file_remote",
+    "inputFileLocal": "types._input_file_local",
+    "inputFileGenerated": "types._input_file_generated",
+    "photoSize": "types._photo_size",
+    "maskPointForehead": "types._mask_point_forehead",
+    "maskPointEyes": "types._mask_point_eyes",
+    "maskPointMouth": "types._mask_point_mouth",
+    "maskPointChin": "types._mask_point_chin",
+    "maskPosition": "types._mask_position",
+    "textEntity": "types._text_entity",
+    "textEntities": "types._text_entities",
+    "formattedText": "types._formatted_text",
+    "animation": "types._animation",
+    "audio": "types._audio",
+    "document": "types._document",
+    "photo": "types._photo",
+    "sticker": "types._sticker",
+    "video": "types._video",
+    "videoNote": "types._video_note",
+    "voiceNote": "types._voice_note",
+    "contact": "types._contact",
+    "location": "types._location",
+    "venue": "types._venue",
+    "game": "types._game",
+    "profilePhoto": "types._profile_photo",
+    "chatPhoto": "types._chat_photo",
+    "linkStateNone": "types._link_state_none",
+    "linkStateKnowsPhoneNumber": "types._link_state_knows_phone_number",
+    "linkStateIsContact": "types._link_state_is_contact",
+    "userTypeRegular": "types._user_type_regular",
+    "userTypeDeleted": "types._user_type_deleted",
+    "userTypeBot": "types._user_type_bot",
+    "userTypeUnknown": "types._user_type_unknown",
+    "botCommand": "types._bot_command",
+    "botInfo": "types._bot_info",
+    "user": "types._user",
+    "userFullInfo": "types._user_full_info",
+    "userProfilePhotos": "types._user_profile_photos",
+    "users": "types._users",
+    "chatMemberStatusCreator": "types._chat_member_status_creator",
+    "chatMemberStatusAdministrator": "types._chat_member_status_administrator",
+    "chatMemberStatusMember": "types._chat_member_status_member",
+    "chatMemberStatusRestricted": "types._chat_member_status_restricted",
+    "chatMemberStatusLeft": "types._chat_member_status_left",
+    "chatMemberStatusBanned": "types._chat_member_status_banned",
+    "chatMember": "types._chat_member",
+    "chatMembers": "types._chat_members",
+    "supergroupMembersFilterRecent": "types._supergroup_members_filter_recent",
+    "supergroupMembersFilterAdministrators": "types._supergroup_members_filter_administrators",
+    "supergroupMembersFilterSearch": "types._supergroup_members_filter_search",
+    "supergroupMembersFilterRestricted": "types._supergroup_members_filter_restricted",
+    "supergroupMembersFilterBanned": "types._supergroup_members_filter_banned",
+    "supergroupMembersFilterBots": "types._supergroup_members_filter_bots",
+    "basicGroup": "types._basic_group",
+    "basicGroupFullInfo": "types._basic_group_full_info",
+    "supergroup": "types._supergroup",
+    "supergroupFullInfo": "types._supergroup_full_info",
+    "secretChatStatePending": "types._secret_chat_state_pending",
+    "secretChatStateReady": "types._secret_chat_state_ready",
+    "secretChatStateClosed": "types._secret_chat_state_closed",
+    "secretChat": "types._secret_chat",
+    "messageForwardedFromUser": "types._message_forwarded_from_user",
+    "messageForwardedPost": "types._message_forwarded_post",
+    "messageSendingStatePending": "types._message_sending_state_pending",
+    "messageSendingStateFailed": "types._message_sending_state_failed",
+    "message": "types._message",
+    "messages": "types._messages",
+    "foundMessages": "types._found_messages",
+    "notificationSettingsScopeChat": "types._notification_settings_scope_chat",
+    "notificationSettingsScopePrivateChats": "types._notification_settings_scope_private_chats",
+    "notificationSettingsScopeBasicGroupChats": "types._notification_settings_scope_basic_group_chats",
+    "notificationSettingsScopeAllChats": "types._notification_settings_scope_all_chats",
+    "notificationSettings": "types._notification_settings",
+    "draftMessage": "types._draft_message",
+    "chatTypePrivate": "types._chat_type_private",
+    "chatTypeBasicGroup": "types._chat_type_basic_group",
+    "chatTypeSupergroup": "types._chat_type_supergroup",
+    "chatTypeSecret": "types._chat_type_secret",
+    "chat": "types._chat",
+    "chats": "types._chats",
+    "chatInviteLink": "types._chat_invite_link",
+    "chatInviteLinkInfo": "types._chat_invite_link_info",
+    "keyboardButtonTypeText": "types._keyboard_button_type_text",
+    "keyboardButtonTypeRequestPhoneNumber": "types._keyboard_button_type_request_phone_number",
+    "keyboardButtonTypeRequestLocation": "types._keyboard_button_type_request_location",
+    "keyboardButton": "types._keyboard_button",
+    "inlineKeyboardButtonTypeUrl": "types._inline_keyboard_button_type_url",
+    "inlineKeyboardButtonTypeCallback": "types._inline_keyboard_button_type_callback",
+    "inlineKeyboardButtonTypeCallbackGame": "types._inline_keyboard_button_type_callback_game",
+    "inlineKeyboardButtonTypeSwitchInline": "types._inline_keyboard_button_type_switch_inline",
+    "inlineKeyboardButtonTypeBuy": "types._inline_keyboard_button_type_buy",
+    "inlineKeyboardButton": "types._inline_keyboard_button",
+    "replyMarkupRemoveKeyboard": "types._reply_markup_remove_keyboard",
+    "replyMarkupForceReply": "types._reply_markup_force_reply",
+    "replyMarkupShowKeyboard": "types._reply_markup_show_keyboard",
+    "replyMarkupInlineKeyboard": "types._reply_markup_inline_keyboard",
+    "richTextPlain": "types._rich_text_plain",
+    "richTextBold": "types._rich_text_bold",
+    "richTextItalic": "types._rich_text_italic",
+    "richTextUnderline": "types._rich_text_underline",
+    "richTextStrikethrough": "types._rich_text_strikethrough",
+    "richTextFixed": "types._rich_text_fixed",
+    "richTextUrl": "types._rich_text_url",
+    "richTextEmailAddress": "types._rich_text_email_address",
+    "richTexts": "types._rich_texts",
+    "pageBlockTitle": "types._page_block_title",
+    "pageBlockSubtitle": "types._page_block_subtitle",
+    "pageBlockAuthorDate": "types._page_block_author_date",
+    "pageBlockHeader": "types._page_block_header",
+    "pageBlockSubheader": "types._page_block_subheader",
+    "pageBlockParagraph": "types._page_block_paragraph",
+    "pageBlockPreformatted": "types._page_block_preformatted",
+    "pageBlockFooter": "types._page_block_footer",
+    "pageBlockDivider": "types._page_block_divider",
+    "pageBlockAnchor": "types._page_block_anchor",
+    "pageBlockList": "types._page_block_list",
+    "pageBlockBlockQuote": "types._page_block_block_quote",
+    "pageBlockPullQuote": "types._page_block_pull_quote",
+    "pageBlockAnimation": "types._page_block_animation",
+    "pageBlockAudio": "types._page_block_audio",
+    "pageBlockPhoto": "types._page_block_photo",
+    "pageBlockVideo": "types._page_block_video",
+    "pageBlockCover": "types._page_block_cover",
+    "pageBlockEmbedded": "types._page_block_embedded",
+    "pageBlockEmbeddedPost": "types._page_block_embedded_post",
+    "pageBlockCollage": "types._page_block_collage",
+    "pageBlockSlideshow": "types._page_block_slideshow",
+    "pageBlockChatLink": "types._page_block_chat_link",
+    "webPageInstantView": "types._web_page_instant_view",
+    "webPage": "types._web_page",
+    "labeledPricePart": "types._labeled_price_part",
+    "invoice": "types._invoice",
+    "shippingAddress": "types._shipping_address",
+    "orderInfo": "types._order_info",
+    "shippingOption": "types._shipping_option",
+    "savedCredentials": "types._saved_credentials",
+    "inputCredentialsSaved": "types._input_credentials_saved",
+    "inputCredentialsNew": "types._input_credentials_new",
+    "inputCredentialsAndroidPay": "types._input_credentials_android_pay",
+    "inputCredentialsApplePay": "types._input_credentials_apple_pay",
+    "paymentsProviderStripe": "types._payments_provider_stripe",
+    "paymentForm": "types._payment_form",
+    "validatedOrderInfo": "types._validated_order_info",
+    "paymentResult": "types._payment_result",
+    "paymentReceipt": "types._payment_receipt",
+    "messageText": "types._message_text",
+    "messageAnimation": "types._message_animation",
+    "messageAudio": "types._message_audio",
+    "messageDocument": "types._message_document",
+    "messagePhoto": "types._message_photo",
+    "messageExpiredPhoto": "types._message_expired_photo",
+    "messageSticker": "types._message_sticker",
+    "messageVideo": "types._message_video",
+    "messageExpiredVideo": "types._message_expired_video",
+    "messageVideoNote": "types._message_video_note",
+    "messageVoiceNote": "types._message_voice_note",
+    "messageLocation": "types._message_location",
+    "messageVenue": "types._message_venue",
+    "messageContact": "types._message_contact",
+    "messageGame": "types._message_game",
+    "messageInvoice": "types._message_invoice",
+    "messageCall": "types._message_call",
+    "messageBasicGroupChatCreate": "types._message_basic_group_chat_create",
+    "messageSupergroupChatCreate": "types._message_supergroup_chat_create",
+    "messageChatChangeTitle": "types._message_chat_change_title",
+    "messageChatChangePhoto": "types._message_chat_change_photo",
+    "messageChatDeletePhoto": "types._message_chat_delete_photo",
+    "messageChatAddMembers": "types._message_chat_add_members",
+    "messageChatJoinByLink": "types._message_chat_join_by_link",
+    "messageChatDeleteMember": "types._message_chat_delete_member",
+    "messageChatUpgradeTo": "types._message_chat_upgrade_to",
+    "messageChatUpgradeFrom": "types._message_chat_upgrade_from",
+    "messagePinMessage": "types._message_pin_message",
+    "messageScreenshotTaken": "types._message_screenshot_taken",
+    "messageChatSetTtl": "types._message_chat_set_ttl",
+    "messageCustomServiceAction": "types._message_custom_service_action",
+    "messageGameScore": "types._message_game_score",
+    "messagePaymentSuccessful": "types._message_payment_successful",
+    "messagePaymentSuccessfulBot": "types._message_payment_successful_bot",
+    "messageContactRegistered": "types._message_contact_registered",
+    "messageUnsupported": "types._message_unsupported",
+    "textEntityTypeMention": "types._text_entity_type_mention",
+    "textEntityTypeHashtag": "types._text_entity_type_hashtag",
+    "textEntityTypeBotCommand": "types._text_entity_type_bot_command",
+    "textEntityTypeUrl": "types._text_entity_type_url",
+    "textEntityTypeEmailAddress": "types._text_entity_type_email_address",
+    "textEntityTypeBold": "types._text_entity_type_bold",
+    "textEntityTypeItalic": "types._text_entity_type_italic",
+    "textEntityTypeCode": "types._text_entity_type_code",
+    "textEntityTypePre": "types._text_entity_type_pre",
+    "textEntityTypePreCode": "types._text_entity_type_pre_code",
+    "textEntityTypeTextUrl": "types._text_entity_type_text_url",
+    "textEntityTypeMentionName": "types._text_entity_type_mention_name",
+    "inputThumbnail": "types._input_thumbnail",
+    "inputMessageText": "types._input_message_text",
+    "inputMessageAnimation": "types._input_message_animation",
+    "inputMessageAudio": "types._input_message_audio",
+    "inputMessageDocument": "types._input_message_document",
+    "inputMessagePhoto": "types._input_message_photo",
+    "inputMessageSticker": "types._input_message_sticker",
+    "inputMessageVideo": "types._input_message_video",
+    "inputMessageVideoNote": "types._input_message_video_note",
+    "inputMessageVoiceNote": "types._input_message_voice_note",
+    "inputMessageLocation": "types._input_message_location",
+    "inputMessageVenue": "types._input_message_venue",
+    "inputMessageContact": "types._input_message_contact",
+    "inputMessageGame": "types._input_message_game",
+    "inputMessageInvoice": "types._input_message_invoice",
+    "inputMessageForwarded": "types._input_message_forwarded",
+    "searchMessagesFilterEmpty": "types._search_messages_filter_empty",
+    "searchMessagesFilterAnimation": "types._search_messages_filter_animation",
+    "searchMessagesFilterAudio": "types._search_messages_filter_audio",
+    "searchMessagesFilterDocument": "types._search_messages_filter_document",
+    "searchMessagesFilterPhoto": "types._search_messages_filter_photo",
+    "searchMessagesFilterVideo": "types._search_messages_filter_video",
+    "searchMessagesFilterVoiceNote": "types._search_messages_filter_voice_note",
+    "searchMessagesFilterPhotoAndVideo": "types._search_messages_filter_photo_and_video",
+    "searchMessagesFilterUrl": "types._search_messages_filter_url",
+    "searchMessagesFilterChatPhoto": "types._search_messages_filter_chat_photo",
+    "searchMessagesFilterCall": "types._search_messages_filter_call",
+    "searchMessagesFilterMissedCall": "types._search_messages_filter_missed_call",
+    "searchMessagesFilterVideoNote": "types._search_messages_filter_video_note",
+    "searchMessagesFilterVoiceAndVideoNote": "types._search_messages_filter_voice_and_video_note",
+    "searchMessagesFilterMention": "types._search_messages_filter_mention",
+    "searchMessagesFilterUnreadMention": "types._search_messages_filter_unread_mention",
+    "chatActionTyping": "types._chat_action_typing",
+    "chatActionRecordingVideo": "types._chat_action_recording_video",
+    "chatActionUploadingVideo": "types._chat_action_uploading_video",
+    "chatActionRecordingVoiceNote": "types._chat_action_recording_voice_note",
+    "chatActionUploadingVoiceNote": "types._chat_action_uploading_voice_note",
+    "chatActionUploadingPhoto": "types._chat_action_uploading_photo",
+    "chatActionUploadingDocument": "types._chat_action_uploading_document",
+    "chatActionChoosingLocation": "types._chat_action_choosing_location",
+    "chatActionChoosingContact": "types._chat_action_choosing_contact",
+    "chatActionStartPlayingGame": "types._chat_action_start_playing_game",
+    "chatActionRecordingVideoNote": "types._chat_action_recording_video_note",
+    "chatActionUploadingVideoNote": "types._chat_action_uploading_video_note",
+    "chatActionCancel": "types._chat_action_cancel",
+    "userStatusEmpty": "types._user_status_empty",
+    "userStatusOnline": "types._user_status_online",
+    "userStatusOffline": "types._user_status_offline",
+    "userStatusRecently": "types._user_status_recently",
+    "userStatusLastWeek": "types._user_status_last_week",
+    "userStatusLastMonth": "types._user_status_last_month",
+    "stickers": "types._stickers",
+    "stickerEmojis": "types._sticker_emojis",
+    "stickerSet": "types._sticker_set",
+    "stickerSetInfo": "types._sticker_set_info",
+    "stickerSets": "types._sticker_sets",
+    "callDiscardReasonEmpty": "types._call_discard_reason_empty",
+    "callDiscardReasonMissed": "types._call_discard_reason_missed",
+    "callDiscardReasonDeclined": "types._call_discard_reason_declined",
+    "callDiscardReasonDisconnected": "types._call_discard_reason_disconnected",
+    "callDiscardReasonHungUp": "types._call_discard_reason_hung_up",
+    "callProtocol": "types._call_protocol",
+    "callConnection": "types._call_connection",
+    "callId": "types._call_id",
+    "callStatePending": "types._call_state_pending",
+    "callStateExchangingKeys": "types._call_state_exchanging_keys",
+    "callStateReady": "types._call_state_ready",
+    "callStateHangingUp": "types._call_state_hanging_up",
+    "callStateDiscarded": "types._call_state_discarded",
+    "callStateError": "types._call_state_error",
+    "call": "types._call",
+    "animations": "types._animations",
+    "importedContacts": "types._imported_contacts",
+    "inputInlineQueryResultAnimatedGif": "types._input_inline_query_result_animated_gif",
+    "inputInlineQueryResultAnimatedMpeg4": "types._input_inline_query_result_animated_mpeg4",
+    "inputInlineQueryResultArticle": "types._input_inline_query_result_article",
+    "inputInlineQueryResultAudio": "types._input_inline_query_result_audio",
+    "inputInlineQueryResultContact": "types._input_inline_query_result_contact",
+    "inputInlineQueryResultDocument": "types._input_inline_query_result_document",
+    "inputInlineQueryResultGame": "types._input_inline_query_result_game",
+    "inputInlineQueryResultLocation": "types._input_inline_query_result_location",
+    "inputInlineQueryResultPhoto": "types._input_inline_query_result_photo",
+    "inputInlineQueryResultSticker": "types._input_inline_query_result_sticker",
+    "inputInlineQueryResultVenue": "types._input_inline_query_result_venue",
+    "inputInlineQueryResultVideo": "types._input_inline_query_result_video",
+    "inputInlineQueryResultVoiceNote": "types._input_inline_query_result_voice_note",
+    "inlineQueryResultArticle": "types._inline_query_result_article",
+    "inlineQueryResultContact": "types._inline_query_result_contact",
+    "inlineQueryResultLocation": "types._inline_query_result_location",
+    "inlineQueryResultVenue": "types._inline_query_result_venue",
+    "inlineQueryResultGame": "types._inline_query_result_game",
+    "inlineQueryResultAnimation": "types._inline_query_result_animation",
+    "inlineQueryResultAudio": "types._inline_query_result_audio",
+    "inlineQueryResultDocument": "types._inline_query_result_document",
+    "inlineQueryResultPhoto": "types._inline_query_result_photo",
+    "inlineQueryResultSticker": "types._inline_query_result_sticker",
+    "inlineQueryResultVideo": "types._inline_query_result_video",
+    "inlineQueryResultVoiceNote": "types._inline_query_result_voice_note",
+    "inlineQueryResults": "types._inline_query_results",
+    "callbackQueryPayloadData": "types._callback_query_payload_data",
+    "callbackQueryPayloadGame": "types._callback_query_payload_game",
+    "callbackQueryAnswer": "types._callback_query_answer",
+    "customRequestResult": "types._custom_request_result",
+    "gameHighScore": "types._game_high_score",
+    "gameHighScores": "types._game_high_scores",
+    "chatEventMessageEdited": "types._chat_event_message_edited",
+    "chatEventMessageDeleted": "types._chat_event_message_deleted",
+    "chatEventMessagePinned": "types._chat_event_message_pinned",
+    "chatEventMessageUnpinned": "types._chat_event_message_unpinned",
+    "chatEventMemberJoined": "types._chat_event_member_joined",
+    "chatEventMemberLeft": "types._chat_event_member_left",
+    "chatEventMemberInvited": "types._chat_event_member_invited",
+    "chatEventMemberPromoted": "types._chat_event_member_promoted",
+    "chatEventMemberRestricted": "types._chat_event_member_restricted",
+    "chatEventTitleChanged": "types._chat_event_title_changed",
+    "chatEventDescriptionChanged": "types._chat_event_description_changed",
+    "chatEventUsernameChanged": "types._chat_event_username_changed",
+    "chatEventPhotoChanged": "types._chat_event_photo_changed",
+    "chatEventInvitesToggled": "types._chat_event_invites_toggled",
+    "chatEventSignMessagesToggled": "types._chat_event_sign_messages_toggled",
+    "chatEventStickerSetChanged": "types._chat_event_sticker_set_changed",
+    "chatEventIsAllHistoryAvailableToggled": "types._chat_event_is_all_history_available_toggled",
+    "chatEvent": "types._chat_event",
+    "chatEvents": "types._chat_events",
+    "chatEventLogFilters": "types._chat_event_log_filters",
+    "deviceTokenGoogleCloudMessaging": "types._device_token_google_cloud_messaging",
+    "deviceTokenApplePush": "types._device_token_apple_push",
+    "deviceTokenApplePushVoIP": "types._device_token_apple_push_vo_ip",
+    "deviceTokenWindowsPush": "types._device_token_windows_push",
+    "deviceTokenMicrosoftPush": "types._device_token_microsoft_push",
+    "deviceTokenMicrosoftPushVoIP": "types._device_token_microsoft_push_vo_ip",
+    "deviceTokenWebPush": "types._device_token_web_push",
+    "deviceTokenSimplePush": "types._device_token_simple_push",
+    "deviceTokenUbuntuPush": "types._device_token_ubuntu_push",
+    "deviceTokenBlackberryPush": "types._device_token_blackberry_push",
+    "deviceTokenTizenPush": "types._device_token_tizen_push",
+    "wallpaper": "types._wallpaper",
+    "wallpapers": "types._wallpapers",
+    "hashtags": "types._hashtags",
+    "optionValueBoolean": "types._option_value_boolean",
+    "optionValueEmpty": "types._option_value_empty",
+    "optionValueInteger": "types._option_value_integer",
+    "optionValueString": "types._option_value_string",
+    "userPrivacySettingRuleAllowAll": "types._user_privacy_setting_rule_allow_all",
+    "userPrivacySettingRuleAllowContacts": "types._user_privacy_setting_rule_allow_contacts",
+    "userPrivacySettingRuleAllowUsers": "types._user_privacy_setting_rule_allow_users",
+    "userPrivacySettingRuleRestrictAll": "types._user_privacy_setting_rule_restrict_all",
+    "userPrivacySettingRuleRestrictContacts": "types._user_privacy_setting_rule_restrict_contacts",
+    "userPrivacySettingRuleRestrictUsers": "types._user_privacy_setting_rule_restrict_users",
+    "userPrivacySettingRules": "types._user_privacy_setting_rules",
+    "userPrivacySettingShowStatus": "types._user_privacy_setting_show_status",
+    "userPrivacySettingAllowChatInvites": "types._user_privacy_setting_allow_chat_invites",
+    "userPrivacySettingAllowCalls": "types._user_privacy_setting_allow_calls",
+    "accountTtl": "types._account_ttl",
+    "session": "types._session",
+    "sessions": "types._sessions",
+    "chatReportSpamState": "types._chat_report_spam_state",
+    "chatReportReasonSpam": "types._chat_report_reason_spam",
+    "chatReportReasonViolence": "types._chat_report_reason_violence",
+    "chatReportReasonPornography": "types._chat_report_reason_pornography",
+    "chatReportReasonCustom": "types._chat_report_reason_custom",
+    "publicMessageLink": "types._public_message_link",
+    "fileTypeNone": "types._file_type_none",
+    "fileTypeAnimation": "types._file_type_animation",
+    "fileTypeAudio": "types._file_type_audio",
+    "fileTypeDocument": "types._file_type_document",
+    "fileTypePhoto": "types._file_type_photo",
+    "fileTypeProfilePhoto": "types._file_type_profile_photo",
+    "fileTypeSecret": "types._file_type_secret",
+    "fileTypeSticker": "types._file_type_sticker",
+    "fileTypeThumbnail": "types._file_type_thumbnail",
+    "fileTypeUnknown": "types._file_type_unknown",
+    "fileTypeVideo": "types._file_type_video",
+    "fileTypeVideoNote": "types._file_type_video_note",
+    "fileTypeVoiceNote": "types._file_type_voice_note",
+    "fileTypeWallpaper": "types._file_type_wallpaper",
+    "fileTypeSecretThumbnail": "types._file_type_secret_thumbnail",
+    "storageStatisticsByFileType": "types._storage_statistics_by_file_type",
+    "storageStatisticsByChat": "types._storage_statistics_by_chat",
+    "storageStatistics": "types._storage_statistics",
+    "storageStatisticsFast": "types._storage_statistics_fast",
+    "networkTypeNone": "types._network_type_none",
+    "networkTypeMobile": "types._network_type_mobile",
+    "networkTypeMobileRoaming": "types._network_type_mobile_roaming",
+    "networkTypeWiFi": "types._network_type_wi_fi",
+    "networkTypeOther": "types._network_type_other",
+    "networkStatisticsEntryFile": "types._network_statistics_entry_file",
+    "networkStatisticsEntryCall": "types._network_statistics_entry_call",
+    "networkStatistics": "types._network_statistics",
+    "connectionStateWaitingForNetwork": "types._connection_state_waiting_for_network",
+    "connectionStateConnectingToProxy": "types._connection_state_connecting_to_proxy",
+    "connectionStateConnecting": "types._connection_state_connecting",
+    "connectionStateUpdating": "types._connection_state_updating",
+    "connectionStateReady": "types._connection_state_ready",
+    "topChatCategoryUsers": "types._top_chat_category_users",
+    "topChatCategoryBots": "types._top_chat_category_bots",
+    "topChatCategoryGroups": "types._top_chat_category_groups",
+    "topChatCategoryChannels": "types._top_chat_category_channels",
+    "topChatCategoryInlineBots": "types._top_chat_category_inline_bots",
+    "topChatCategoryCalls": "types._top_chat_category_calls",
+    "tMeUrlTypeUser": "types._t_me_url_type_user",
+    "tMeUrlTypeSupergroup": "types._t_me_url_type_supergroup",
+    "tMeUrlTypeChatInvite": "types._t_me_url_type_chat_invite",
+    "tMeUrlTypeStickerSet": "types._t_me_url_type_sticker_set",
+    "tMeUrl": "types._t_me_url",
+    "tMeUrls": "types._t_me_urls",
+    "count": "types._count",
+    "text": "types._text",
+    "textParseModeMarkdown": "types._text_parse_mode_markdown",
+    "textParseModeHTML": "types._text_parse_mode_html",
+    "proxyEmpty": "types._proxy_empty",
+    "proxySocks5": "types._proxy_socks5",
+    "inputSticker": "types._input_sticker",
+    "updateAuthorizationState": "types._update_authorization_state",
+    "updateNewMessage": "types._update_new_message",
+    "updateMessageSendAcknowledged": "types._update_message_send_acknowledged",
+    "updateMessageSendSucceeded": "types._update_message_send_succeeded",
+    "updateMessageSendFailed": "types._update_message_send_failed",
+    "updateMessageContent": "types._update_message_content",
+    "updateMessageEdited": "types._update_message_edited",
+    "updateMessageViews": "types._update_message_views",
+    "updateMessageContentOpened": "types._update_message_content_opened",
+    "updateMessageMentionRead": "types._update_message_mention_read",
+    "updateNewChat": "types._update_new_chat",
+    "updateChatTitle": "types._update_chat_title",
+    "updateChatPhoto": "types._update_chat_photo",
+    "updateChatLastMessage": "types._update_chat_last_message",
+    "updateChatOrder": "types._update_chat_order",
+    "updateChatIsPinned": "types._update_chat_is_pinned",
+    "updateChatReadInbox": "types._update_chat_read_inbox",
+    "updateChatReadOutbox": "types._update_chat_read_outbox",
+    "updateChatUnreadMentionCount": "types._update_chat_unread_mention_count",
+    "updateNotificationSettings": "types._update_notification_settings",
+    "updateChatReplyMarkup": "types._update_chat_reply_markup",
+    "updateChatDraftMessage": "types._update_chat_draft_message",
+    "updateDeleteMessages": "types._update_delete_messages",
+    "updateUserChatAction": "types._update_user_chat_action",
+    "updateUserStatus": "types._update_user_status",
+    "updateUser": "types._update_user",
+    "updateBasicGroup": "types._update_basic_group",
+    "updateSupergroup": "types._update_supergroup",
+    "updateSecretChat": "types._update_secret_chat",
+    "updateUserFullInfo": "types._update_user_full_info",
+    "updateBasicGroupFullInfo": "types._update_basic_group_full_info",
+    "updateSupergroupFullInfo": "types._update_supergroup_full_info",
+    "updateServiceNotification": "types._update_service_notification",
+    "updateFile": "types._update_file",
+    "updateFileGenerationStart": "types._update_file_generation_start",
+    "updateFileGenerationStop": "types._update_file_generation_stop",
+    "updateCall": "types._update_call",
+    "updateUserPrivacySettingRules": "types._update_user_privacy_setting_rules",
+    "updateOption": "types._update_option",
+    "updateInstalledStickerSets": "types._update_installed_sticker_sets",
+    "updateTrendingStickerSets": "types._update_trending_sticker_sets",
+    "updateRecentStickers": "types._update_recent_stickers",
+    "updateFavoriteStickers": "types._update_favorite_stickers",
+    "updateSavedAnimations": "types._update_saved_animations",
+    "updateConnectionState": "types._update_connection_state",
+    "updateNewInlineQuery": "types._update_new_inline_query",
+    "updateNewChosenInlineResult": "types._update_new_chosen_inline_result",
+    "updateNewCallbackQuery": "types._update_new_callback_query",
+    "updateNewInlineCallbackQuery": "types._update_new_inline_callback_query",
+    "updateNewShippingQuery": "types._update_new_shipping_query",
+    "updateNewPreCheckoutQuery": "types._update_new_pre_checkout_query",
+    "updateNewCustomEvent": "types._update_new_custom_event",
+    "updateNewCustomQuery": "types._update_new_custom_query",
+    "testInt": "types._test_int",
+    "testString": "types._test_string",
+    "testBytes": "types._test_bytes",
+    "testVectorInt": "types._test_vector_int",
+    "testVectorIntObject": "types._test_vector_int_object",
+    "testVectorString": "types._test_vector_string",
+    "testVectorStringObject": "types._test_vector_string_object",
+    "DeviceToken": "types._device_token",
+    "UserType": "types._user_type",
+    "NetworkType": "types._network_type",
+    "Update": "types._update",
+    "CallState": "types._call_state",
+    "AuthorizationState": "types._authorization_state",
+    "TopChatCategory": "types._top_chat_category",
+    "OptionValue": "types._option_value",
+    "MessageContent": "types._message_content",
+    "FileType": "types._file_type",
+    "ChatEventAction": "types._chat_event_action",
+    "MessageForwardInfo": "types._message_forward_info",
+    "LinkState": "types._link_state",
+    "InlineKeyboardButtonType": "types._inline_keyboard_button_type",
+    "ChatType": "types._chat_type",
+    "MaskPoint": "types._mask_point",
+    "InputCredentials": "types._input_credentials",
+    "AuthenticationCodeType": "types._authentication_code_type",
+    "TextEntityType": "types._text_entity_type",
+    "CallbackQueryPayload": "types._callback_query_payload",
+    "UserStatus": "types._user_status",
+    "InlineQueryResult": "types._inline_query_result",
+    "InputFile": "types._input_file",
+    "KeyboardButtonType": "types._keyboard_button_type",
+    "RichText": "types._rich_text",
+    "SupergroupMembersFilter": "types._supergroup_members_filter",
+    "TextParseMode": "types._text_parse_mode",
+    "ChatAction": "types._chat_action",
+    "NotificationSettingsScope": "types._notification_settings_scope",
+    "CallDiscardReason": "types._call_discard_reason",
+    "TMeUrlType": "types._t_me_url_type",
+    "PageBlock": "types._page_block",
+    "MessageSendingState": "types._message_sending_state",
+    "InputInlineQueryResult": "types._input_inline_query_result",
+    "UserPrivacySettingRule": "types._user_privacy_setting_rule",
+    "ConnectionState": "types._connection_state",
+    "ChatReportReason": "types._chat_report_reason",
+    "SearchMessagesFilter": "types._search_messages_filter",
+    "ChatMemberStatus": "types._chat_member_status",
+    "ReplyMarkup": "types._reply_markup",
+    "Proxy": "types._proxy",
+    "SecretChatState": "types._secret_chat_state",
+    "NetworkStatisticsEntry": "types._network_statistics_entry",
+    "UserPrivacySetting": "types._user_privacy_setting",
+    "InputMessageContent": "types._input_message_content",
 }
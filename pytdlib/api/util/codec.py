@@ -0,0 +1,84 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JsonCodec:
+    name = "json"
+
+    @staticmethod
+    def loads(data: bytes) -> dict:
+        return json.loads(data)
+
+    @staticmethod
+    def dumps(data: dict) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode('utf-8')
+
+
+class UjsonCodec:
+    name = "ujson"
+
+    @staticmethod
+    def loads(data: bytes) -> dict:
+        return ujson.loads(data)
+
+    @staticmethod
+    def dumps(data: dict) -> bytes:
+        return ujson.dumps(data).encode('utf-8')
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    @staticmethod
+    def loads(data: bytes) -> dict:
+        return orjson.loads(data)
+
+    @staticmethod
+    def dumps(data: dict) -> bytes:
+        return orjson.dumps(data)
+
+
+codecs = {
+    "orjson": (OrjsonCodec, orjson),
+    "ujson": (UjsonCodec, ujson),
+    "json": (JsonCodec, json),
+}
+
+
+def get_codec(name: str = None):
+    if name is None:
+        return next(codec for codec, module in codecs.values() if module is not None)
+
+    codec, module = codecs[name]
+
+    if module is None:
+        raise ImportError("{} is not installed".format(name))
+
+    return codec
@@ -16,25 +16,95 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
 
-from collections import OrderedDict
 from json import JSONEncoder, dumps
+from .codec import get_codec
 
 
 class Object:
+    __slots__ = ()
     all = {}
+    codec = get_codec()
+    extra = None
+    LAZY_FIELDS = ()
 
-    def to_json(self):
-        return dumps(self, cls=Encoder).encode('utf-8')
+    def to_json(self) -> bytes:
+        return Object.codec.dumps(self.to_dict())
+
+    def to_dict(self) -> dict:
+        content = {"@type": self.ID}
+
+        for k in self.fields():
+            content[k] = Object.dump(getattr(self, k))
+
+        if self.extra is not None:
+            content["@extra"] = self.extra
+
+        return content
+
+    def fields(self) -> list:
+        return [i for i in self.__slots__ if i not in ("extra", "_raw")]
+
+    @staticmethod
+    def dump(value):
+        if isinstance(value, Object):
+            return value.to_dict()
+        elif isinstance(value, list):
+            return [Object.dump(i) for i in value]
+        return value
 
     @staticmethod
     def read(q: dict, *args):
         return Object.all[q["@type"]].read(q, *args)
 
+    @staticmethod
+    def read_lazy(q: dict, *args):
+        return Object.all[q["@type"]].read_lazy(q, *args)
+
+    @staticmethod
+    def load(value):
+        if isinstance(value, dict):
+            return Object.read_lazy(value)
+        elif isinstance(value, list):
+            return [Object.load(i) for i in value]
+        return value
+
+    def __getattr__(self, name: str):
+        if name not in self.LAZY_FIELDS:
+            raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
+
+        try:
+            raw = object.__getattribute__(self, "_raw")
+        except AttributeError:
+            raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
+
+        value = Object.load(raw[name]) if name in raw else ""
+        setattr(self, name, value)
+        return value
+
+    def __reduce__(self):
+        # Compact pickle form: the class and the field values in slot order, no field names
+        return Object.restore, (type(self), tuple(getattr(self, i) for i in self.fields()), self.extra)
+
+    @staticmethod
+    def restore(cls: type, values: tuple, extra=None):
+        obj = cls.__new__(cls)
+        obj.extra = extra
+
+        for name, value in zip(obj.fields(), values):
+            setattr(obj, name, value)
+
+        return obj
+
     def __str__(self) -> str:
         return dumps(self, cls=Encoder, indent=4)
 
     def __eq__(self, other) -> bool:
-        return self.__dict__ == other.__dict__
+        return type(self) is type(other) and all(
+            getattr(self, i) == getattr(other, i) for i in ("extra", *self.fields())
+        )
+
+    def __bool__(self) -> bool:
+        return True
 
     def __len__(self) -> int:
         return len(self.__str__())
@@ -45,8 +115,4 @@ class Object:
 
 class Encoder(JSONEncoder):
     def default(self, o: object):
-        content = o.__dict__
-        return OrderedDict(
-            [("@type", o.ID)]
-            + [("@extra", i[1]) if i[0] == "extra" else i for i in content.items()]
-        )
+        return o.to_dict()
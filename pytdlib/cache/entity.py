@@ -0,0 +1,97 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+from .lru import LRU
+
+
+class EntityCache:
+    """Users, chats, basic groups and supergroups kept up to date from the updates TDLib pushes.
+
+    Full objects come from ``updateUser``, ``updateNewChat``, ``updateBasicGroup``, ``updateSupergroup`` and
+    from ``getUser``/``getChat``/... responses. Partial updates such as ``updateChatTitle`` patch the cached
+    object in place, they are ignored for entities that aren't cached.
+
+    Args:
+        maxsize (:obj:`int`): Entries kept per entity kind.
+    """
+
+    TYPES = (
+        "updateUser", "updateUserStatus", "updateNewChat", "updateChatTitle", "updateChatPhoto",
+        "updateChatLastMessage", "updateChatOrder", "updateChatIsPinned", "updateChatReadInbox",
+        "updateChatReadOutbox", "updateChatUnreadMentionCount", "updateNotificationSettings",
+        "updateChatReplyMarkup", "updateChatDraftMessage", "updateBasicGroup", "updateSupergroup",
+    )
+
+    def __init__(self, maxsize: int = 10000):
+        self.users = LRU(maxsize)
+        self.chats = LRU(maxsize)
+        self.basic_groups = LRU(maxsize)
+        self.supergroups = LRU(maxsize)
+
+        self.handlers = {
+            "user": lambda u: self.users.put(u.id, u),
+            "chat": lambda u: self.chats.put(u.id, u),
+            "basicGroup": lambda u: self.basic_groups.put(u.id, u),
+            "supergroup": lambda u: self.supergroups.put(u.id, u),
+            "updateUser": lambda u: self.users.put(u.user.id, u.user),
+            "updateNewChat": lambda u: self.chats.put(u.chat.id, u.chat),
+            "updateBasicGroup": lambda u: self.basic_groups.put(u.basic_group.id, u.basic_group),
+            "updateSupergroup": lambda u: self.supergroups.put(u.supergroup.id, u.supergroup),
+            "updateUserStatus": lambda u: self.patch(self.users, u.user_id, status=u.status),
+            "updateChatTitle": lambda u: self.patch(self.chats, u.chat_id, title=u.title),
+            "updateChatPhoto": lambda u: self.patch(self.chats, u.chat_id, photo=u.photo),
+            "updateChatLastMessage": lambda u: self.patch(
+                self.chats, u.chat_id, last_message=u.last_message, order=u.order),
+            "updateChatOrder": lambda u: self.patch(self.chats, u.chat_id, order=u.order),
+            "updateChatIsPinned": lambda u: self.patch(self.chats, u.chat_id, is_pinned=u.is_pinned, order=u.order),
+            "updateChatReadInbox": lambda u: self.patch(
+                self.chats, u.chat_id, last_read_inbox_message_id=u.last_read_inbox_message_id,
+                unread_count=u.unread_count),
+            "updateChatReadOutbox": lambda u: self.patch(
+                self.chats, u.chat_id, last_read_outbox_message_id=u.last_read_outbox_message_id),
+            "updateChatUnreadMentionCount": lambda u: self.patch(
+                self.chats, u.chat_id, unread_mention_count=u.unread_mention_count),
+            "updateNotificationSettings": lambda u: self.patch(
+                self.chats, getattr(u.scope, "chat_id", None), notification_settings=u.notification_settings),
+            "updateChatReplyMarkup": lambda u: self.patch(
+                self.chats, u.chat_id, reply_markup_message_id=u.reply_markup_message_id),
+            "updateChatDraftMessage": lambda u: self.patch(
+                self.chats, u.chat_id, draft_message=u.draft_message, order=u.order),
+        }
+
+    @staticmethod
+    def patch(cache: LRU, key: int, **fields):
+        entity = cache.peek(key)
+
+        if entity is not None:
+            for name, value in fields.items():
+                setattr(entity, name, value)
+
+    def apply(self, update):
+        handler = self.handlers.get(update.ID)
+
+        if handler is not None:
+            handler(update)
+
+    def stats(self) -> dict:
+        return {
+            "users": self.users.stats(),
+            "chats": self.chats.stats(),
+            "basic_groups": self.basic_groups.stats(),
+            "supergroups": self.supergroups.stats(),
+        }
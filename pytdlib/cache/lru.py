@@ -0,0 +1,96 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+from threading import Lock
+from collections import OrderedDict
+
+
+class LRU:
+    """Thread safe mapping bounded to ``maxsize`` entries, evicting the least recently used one.
+
+    With a ``weigher`` the entries are also bounded by their summed weight, ``max_weight``.
+    """
+
+    def __init__(self, maxsize: int = 10000, max_weight: int = None, weigher: callable = None):
+        self.maxsize = maxsize
+        self.max_weight = max_weight
+        self.weigher = weigher
+        self.data = OrderedDict()
+        self.weights = {}
+        self.weight = 0
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __contains__(self, key) -> bool:
+        return key in self.data
+
+    def get(self, key, default=None):
+        with self.lock:
+            try:
+                value = self.data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self.data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key, default=None):
+        """Like :meth:`get` without touching recency or counters, used when applying updates."""
+        return self.data.get(key, default)
+
+    def put(self, key, value):
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+
+            if self.weigher is not None:
+                weight = self.weigher(value)
+                self.weight += weight - self.weights.get(key, 0)
+                self.weights[key] = weight
+
+            while len(self.data) > self.maxsize or (self.max_weight is not None and self.weight > self.max_weight):
+                self.weight -= self.weights.pop(self.data.popitem(last=False)[0], 0)
+
+    def pop(self, key, default=None):
+        with self.lock:
+            self.weight -= self.weights.pop(key, 0)
+            return self.data.pop(key, default)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+            self.weights.clear()
+            self.weight = 0
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+
+        return {
+            "size": len(self.data),
+            "maxsize": self.maxsize,
+            "weight": self.weight,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,86 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+from .lru import LRU
+
+
+def weigh(message) -> int:
+    """Rough memory footprint of a decoded message: fixed object overhead plus its text."""
+    content = message.content
+    text = getattr(content, "text", None) or getattr(content, "caption", None)
+    return MessageCache.BASE_WEIGHT + len(getattr(text, "text", None) or "")
+
+
+class MessageCache(LRU):
+    """Messages keyed by ``(chat_id, message_id)``, bounded by count and by estimated size.
+
+    Filled from ``updateNewMessage``, ``updateMessageSendSucceeded`` and ``message``/``messages`` responses
+    (``getMessage``, ``getMessages``, ``getChatHistory``...), patched in place on ``updateMessageContent``,
+    ``updateMessageEdited`` and ``updateMessageViews`` and evicted on ``updateDeleteMessages``.
+
+    Args:
+        maxsize (:obj:`int`): Messages kept at most.
+        max_bytes (:obj:`int`): Bound on the estimated size of all cached messages.
+    """
+
+    BASE_WEIGHT = 1024
+    TYPES = (
+        "updateNewMessage", "updateMessageSendSucceeded", "updateMessageSendFailed", "updateMessageContent",
+        "updateMessageEdited", "updateMessageViews", "updateDeleteMessages",
+    )
+
+    def __init__(self, maxsize: int = 50000, max_bytes: int = 64 * 1024 * 1024):
+        super().__init__(maxsize, max_bytes, weigh)
+
+        self.handlers = {
+            "message": self.add,
+            "messages": lambda u: [self.add(i) for i in u.messages if i],
+            "updateNewMessage": lambda u: self.add(u.message),
+            "updateMessageSendSucceeded": self.replace,
+            "updateMessageSendFailed": self.replace,
+            "updateMessageContent": lambda u: self.patch(u.chat_id, u.message_id, content=u.new_content),
+            "updateMessageEdited": lambda u: self.patch(
+                u.chat_id, u.message_id, edit_date=u.edit_date, reply_markup=u.reply_markup),
+            "updateMessageViews": lambda u: self.patch(u.chat_id, u.message_id, views=u.views),
+            "updateDeleteMessages": lambda u: [self.pop((u.chat_id, i)) for i in u.message_ids],
+        }
+
+    def add(self, message):
+        self.put((message.chat_id, message.id), message)
+
+    def replace(self, update):
+        # The temporary id of a message being sent is replaced by the server assigned one
+        self.pop((update.message.chat_id, update.old_message_id))
+        self.add(update.message)
+
+    def patch(self, chat_id: int, message_id: int, **fields):
+        message = self.peek((chat_id, message_id))
+
+        if message is not None:
+            for name, value in fields.items():
+                setattr(message, name, value)
+
+            if "content" in fields:
+                # Re-put so the size estimate follows the new content
+                self.put((chat_id, message_id), message)
+
+    def apply(self, update):
+        handler = self.handlers.get(update.ID)
+
+        if handler is not None:
+            handler(update)
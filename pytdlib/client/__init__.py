@@ -17,3 +17,8 @@
 # along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
 
 from .client import Client
+from .async_client import AsyncClient
+from .scheduler import Scheduler
+from .lanes import UpdateLanes
+from .shards import ShardedQueue
+from .process import ProcessPool, in_process
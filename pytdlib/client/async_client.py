@@ -0,0 +1,287 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+from time import perf_counter
+from inspect import isawaitable
+from signal import signal, SIGINT, SIGTERM, SIGABRT
+
+from .client import Client
+from .scheduler import Scheduler
+from .lanes import UpdateLanes
+from pytdlib.session import AsyncSession
+from pytdlib.metrics import Hooks
+from pytdlib.api.types import (InputMessageContent, inputMessageText, ReplyMarkup, formattedText,
+                               textParseModeMarkdown, textParseModeHTML, chatActionTyping)
+from pytdlib.api.functions import (parseTextEntities, sendMessage, sendChatAction, forwardMessages, getUser, getChat,
+                                   getBasicGroup, getSupergroup, getMessage)
+
+
+class AsyncClient(Client):
+    """Asyncio flavour of :class:`Client`: handlers may be coroutines and run on the event loop.
+
+    Update lanes, sharded dispatch, :class:`pytdlib.SessionHub` and ``in_process`` handlers are thread based and
+    not supported.
+    """
+    session_class = AsyncSession
+
+    def __init__(self, *args, **kwargs):
+        super(AsyncClient, self).__init__(*args, **kwargs)
+
+        if isinstance(self.update_queue, UpdateLanes):
+            raise ValueError("update_lanes are not supported by AsyncClient")
+
+    def set_update_handler(self, callback: callable, update_types: list = None):
+        if getattr(callback, "in_process", False):
+            # The process pool proxies blocking sync calls and blocks on submit, neither fits the event loop
+            raise ValueError("in_process handlers are not supported by AsyncClient")
+
+        super(AsyncClient, self).set_update_handler(callback, update_types)
+
+    async def start(self,
+                    login: bool = False,
+                    token_key: str = None,
+                    phone_number: str = None,
+                    phone_code: str or callable = None,
+                    password: str = None,
+                    first_name: str = None,
+                    last_name: str = None,
+                    workers: int = 2,
+                    single_stage: bool = False,
+                    hub=None,
+                    sharded: bool = False):
+
+        if hub is not None or sharded:
+            raise ValueError("hub and sharded dispatch are not supported by AsyncClient")
+
+        self.login = login
+        self.token_key = token_key
+        self.phone_number = phone_number
+        self.password = password
+        self.phone_code = phone_code
+        self.first_name = first_name
+        self.last_name = last_name
+
+        self.workers = workers
+        self.updates_queue = asyncio.Queue()
+
+        for i in range(self.workers):
+            asyncio.ensure_future(self.update_worker())
+
+        if self.scheduler is not None:
+            self.scheduler.start(self.session.send_threadsafe, self.session.retry_policy)
+
+        await self.session.start(self.updates_queue, self.workers, single_stage)
+
+    async def update_worker(self):
+
+        while True:
+            update = await self.updates_queue.get()
+
+            if update is None:
+                break
+
+            try:
+                if isinstance(update, self.AUTH_TYPES):
+                    await self.auth(update)
+
+                if self.logged_in and self.update_handler:
+                    await self.call_handler(update)
+            except Exception as e:
+                print(e)
+
+    async def call_handler(self, update):
+        if self.hooks is not None:
+            token = self.hooks.enter(Hooks.HANDLER, update.ID)
+
+        start = perf_counter()
+
+        try:
+            result = self.update_handler(update)
+
+            if isawaitable(result):
+                await result
+        finally:
+            if self.metrics is not None:
+                self.metrics.handlers.observe(update.ID, perf_counter() - start)
+
+            if self.hooks is not None:
+                self.hooks.exit(Hooks.HANDLER, update.ID, token)
+
+    async def replay(self, path: str, speed: float = None) -> dict:
+        """Like :meth:`Client.replay`, decoding runs in the default executor and handlers on the loop."""
+        if self.session.is_runnig:
+            raise RuntimeError("Can't replay on a running client, stop it first")
+
+        loop = asyncio.get_event_loop()
+        queue = asyncio.Queue()
+        updates_queue, session_loop = self.session.updates_queue, self.session.loop
+        self.session.updates_queue, self.session.loop = queue, loop
+
+        replay = loop.run_in_executor(None, self.session.replay, path, speed)
+        # Queued after every update put_update scheduled, call_soon_threadsafe keeps the order
+        replay.add_done_callback(lambda f: queue.put_nowait(None))
+
+        try:
+            while True:
+                update = await queue.get()
+
+                if update is None:
+                    break
+
+                if self.update_handler:
+                    await self.call_handler(update)
+
+            return await replay
+        finally:
+            self.session.updates_queue, self.session.loop = updates_queue, session_loop
+
+    async def idle(self, stop_signals: tuple = (SIGINT, SIGTERM, SIGABRT)):
+
+        for s in stop_signals:
+            signal(s, self.signal_handler)
+
+        self.is_idle = True
+
+        while self.is_idle:
+            await asyncio.sleep(1)
+
+    async def send(self, data: object, wait_response: bool = True):
+        return await self.session.send(data, wait_response)
+
+    def send_async(self, data: object):
+        return self.session.send_async(data)
+
+    async def send_many(self, requests: list, return_exceptions: bool = False):
+        return await self.session.send_many(requests, return_exceptions)
+
+    async def send_to_chat(self, chat_id: int, data: object, priority: int = Scheduler.NORMAL):
+        if self.scheduler is None:
+            return await self.send(data)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(self.scheduler.submit(chat_id, data, priority)),
+                                          self.session.send_timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def auth(self, data):
+        request = self.auth_request(data)
+
+        if request is not None:
+            try:
+                return await self.send(request)
+            except Exception as e:
+                print(e)
+                self.stop()
+
+    async def cached(self, cache: str, key, request: object):
+        lru = self.caches.get(cache)
+
+        if lru is None:
+            return await self.send(request)
+
+        entity = lru.get(key)
+
+        if entity is None:
+            entity = await self.send(request)
+
+            if entity is not None:
+                lru.put(key, entity)
+
+        return entity
+
+    async def get_user(self, user_id: int):
+        return await self.cached("users", user_id, getUser(user_id))
+
+    async def get_chat(self, chat_id: int):
+        return await self.cached("chats", chat_id, getChat(chat_id))
+
+    async def get_basic_group(self, basic_group_id: int):
+        return await self.cached("basic_groups", basic_group_id, getBasicGroup(basic_group_id))
+
+    async def get_supergroup(self, supergroup_id: int):
+        return await self.cached("supergroups", supergroup_id, getSupergroup(supergroup_id))
+
+    async def get_message(self, chat_id: int, message_id: int):
+        return await self.cached("messages", (chat_id, message_id), getMessage(chat_id, message_id))
+
+    async def get_reply_message(self, message):
+        if message.reply_to_message_id:
+            return await self.get_message(message.chat_id, message.reply_to_message_id)
+
+    async def send_msg(self, chat_id: int, reply_to_message_id: int, disable_notification: bool,
+                       from_background: bool, reply_markup: ReplyMarkup, input_message_content: InputMessageContent,
+                       priority: int = None):
+        if priority is None:
+            priority = Scheduler.REPLY if reply_to_message_id else Scheduler.NORMAL
+
+        return await self.send_to_chat(
+            chat_id,
+            sendMessage(
+                chat_id,
+                reply_to_message_id,
+                disable_notification,
+                from_background,
+                reply_markup,
+                input_message_content
+            ),
+            priority
+        )
+
+    async def send_message(self, chat_id: int, text: str, reply_to_message_id: int = 0, parse_mode: str = None,
+                           disable_notification: bool = False, from_background: bool = False,
+                           reply_markup: ReplyMarkup = None, disable_web_page_preview: bool = False,
+                           action: bool = True, priority: int = None):
+
+        if action:
+            await self.send(sendChatAction(chat_id, chatActionTyping()), False)
+
+        if parse_mode is not None:
+            parse_mode = textParseModeMarkdown() if parse_mode.lower() in ["md", "markdown"] else textParseModeHTML()
+            formatted_text = self.execute(parseTextEntities(text, parse_mode))
+        else:
+            formatted_text = formattedText(text, [])
+
+        return await self.send_msg(
+            chat_id,
+            reply_to_message_id,
+            disable_notification,
+            from_background,
+            reply_markup,
+            inputMessageText(
+                formatted_text,
+                disable_web_page_preview,
+                True
+            ),
+            priority
+        )
+
+    async def forward_messages(self, chat_id: int or str, from_chat_id: int or str, message_ids: list,
+                               priority: int = Scheduler.NORMAL):
+        return await self.send_to_chat(
+            chat_id,
+            forwardMessages(
+                chat_id,
+                from_chat_id,
+                message_ids,
+                False,
+                False
+            ),
+            priority
+        )
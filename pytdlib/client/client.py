@@ -21,7 +21,13 @@ import traceback
 from ctypes import CDLL
 from ctypes.util import find_library
 from pytdlib.log import SetLogPath, SetLogSize, SetLogLevel, SetLogErrorCallback
-from pytdlib.session import Session
+from pytdlib.session import Session, SessionHub, RetryPolicy, Recorder
+from pytdlib.session.recorder import CallQueue
+from .scheduler import Scheduler
+from .lanes import UpdateLanes
+from .shards import ShardedQueue
+from pytdlib.cache import EntityCache, MessageCache, ExecuteCache
+from pytdlib.metrics import Metrics, Hooks
 
 import time
 import re
@@ -34,22 +40,40 @@ from pytdlib.api.types import (updateAuthorizationState, authorizationStateWaitT
 from pytdlib.api.functions import (checkAuthenticationBotToken, setAuthenticationPhoneNumber,
                                    checkAuthenticationBotToken, checkAuthenticationCode,
                                    checkAuthenticationPassword, parseTextEntities,
-                                   sendMessage, sendChatAction, forwardMessages)
+                                   sendMessage, sendChatAction, forwardMessages, getUser, getChat,
+                                   getBasicGroup, getSupergroup, getMessage)
 import os
 import libconf
 import threading
 from queue import Queue
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from threading import Thread, Event
 from signal import signal, SIGINT, SIGTERM, SIGABRT
 
 
 class Client:
+    AUTH_TYPES = (updateAuthorizationState, authorizationStateWaitTdlibParameters,
+                  authorizationStateWaitEncryptionKey, authorizationStateWaitPhoneNumber,
+                  authorizationStateWaitCode, authorizationStateWaitPassword,
+                  authorizationStateReady)
+    session_class = Session
 
     def __init__(self,
                  tdjson_path: str = find_library("tdjson") or "lib/libtdjson.so",
                  profile: str = None,
-                 config: str = None):
-        self.tdjson = CDLL(tdjson_path)
+                 config: str = None,
+                 tdjson: CDLL = None,
+                 lazy: bool = False,
+                 retry_policy: RetryPolicy = None,
+                 scheduler: Scheduler = None,
+                 update_lanes: UpdateLanes = None,
+                 entity_cache: EntityCache = None,
+                 message_cache: MessageCache = None,
+                 execute_cache: ExecuteCache = None,
+                 metrics: Metrics = None,
+                 hooks: Hooks = None,
+                 recorder: Recorder = None):
+        self.tdjson = tdjson if tdjson is not None else CDLL(tdjson_path)
 
         self.set_log_path = SetLogPath(self.tdjson)
         self.set_log_size = SetLogSize(self.tdjson)
@@ -57,12 +81,15 @@ class Client:
         self.set_log_level(0)
         self.set_log_error = SetLogErrorCallback(self.tdjson)
 
-        self.session = Session(self.tdjson, profile=profile, config=config)
+        self.session = self.session_class(self.tdjson, profile=profile, config=config, lazy=lazy,
+                                          retry_policy=retry_policy)
+
+        self.execute_cache = self.session.execute_cache = execute_cache
 
         self.send = self.session.send
         self.execute = self.session.execute
 
-        self.update_queue = Queue()
+        self.update_queue = update_lanes if update_lanes is not None else Queue()
         self.update_handler = None
         self.updates_queue = Queue()
         self.is_idle = None
@@ -75,6 +102,34 @@ class Client:
         self.first_name = None
         self.last_name = None
         self.logged_in = False
+        self.hub = None
+        self.scheduler = scheduler
+        self.process_pool = None
+        self.entity_cache = entity_cache
+        self.message_cache = message_cache
+        self.caches = {}
+        self.metrics = self.session.metrics = metrics
+        self.hooks = hooks
+        self.recorder = self.session.recorder = recorder
+
+        if hooks is not None:
+            self.session.set_hooks(hooks)
+
+        if metrics is not None:
+            # Sampled through lambdas, start() may swap the queues
+            metrics.track_queue("recv_queue", lambda: self.session.recv_queue.qsize())
+            metrics.track_queue("updates_queue", lambda: self.updates_queue.qsize())
+            metrics.track_queue("update_queue", lambda: self.update_queue.qsize())
+            metrics.track_queue("in_flight", lambda: self.session.in_flight)
+
+        if entity_cache is not None:
+            self.session.add_listener(entity_cache.apply, entity_cache.TYPES)
+            self.caches.update(users=entity_cache.users, chats=entity_cache.chats,
+                               basic_groups=entity_cache.basic_groups, supergroups=entity_cache.supergroups)
+
+        if message_cache is not None:
+            self.session.add_listener(message_cache.apply, message_cache.TYPES)
+            self.caches["messages"] = message_cache
 
     def start(self,
               login: bool = False,
@@ -84,7 +139,19 @@ class Client:
               password: str = None,
               first_name: str = None,
               last_name: str = None,
-              workers: int = 2):
+              workers: int = 2,
+              single_stage: bool = False,
+              hub: SessionHub = None,
+              sharded: bool = False):
+        """Connect and start the update workers.
+
+        ``single_stage`` decodes on the receive thread and hands updates straight to ``workers`` dispatch threads.
+        ``sharded`` gives every dispatch worker its own queue keyed by chat, keeping per-chat order; it implies
+        ``single_stage`` and can't be combined with ``update_lanes``. ``hub`` runs the session on a shared
+        :class:`pytdlib.SessionHub` instead of threads of its own.
+        """
+        if sharded and isinstance(self.update_queue, UpdateLanes):
+            raise ValueError("sharded dispatch replaces the update queue, it can't be used with update_lanes")
 
         self.login = login
         self.token_key = token_key
@@ -96,7 +163,31 @@ class Client:
 
         self.workers = workers
 
-        self.session.start( self.updates_queue, self.workers)
+        if self.scheduler is not None:
+            self.scheduler.start(self.session.send_threadsafe, self.session.retry_policy)
+
+        if hub is not None:
+            self.hub = hub
+            self.session.hub = hub
+            hub.start()
+            self.session.start(hub.queue(self), 0)
+            return
+
+        if sharded:
+            # Per-chat order only holds if updates reach the shards in receive order, hence single stage
+            self.update_queue = ShardedQueue(self.workers)
+            single_stage = True
+
+        if single_stage:
+            self.session.start(self.update_queue, self.workers, True)
+
+            for i in range(self.workers):
+                queue = self.update_queue.shard(i) if sharded else self.update_queue
+                Thread(target=self.dispatch_worker, args=(queue,), name="DispatchWorker#{}".format(i + 1)).start()
+
+            return
+
+        self.session.start(self.updates_queue, self.workers)
 
         for i in range(self.workers):
             Thread(target=self.updates_worker, name="UpdatesWorker#{}".format(i + 1)).start()
@@ -105,8 +196,23 @@ class Client:
             Thread(target=self.update_worker, name="UpdateWorker#{}".format(i + 1)).start()
 
     def stop(self):
+        if self.scheduler is not None:
+            self.scheduler.stop()
+
         self.session.stop()
 
+        if self.process_pool is not None:
+            self.process_pool.stop()
+
+        if self.metrics is not None:
+            self.metrics.stop()
+
+        if self.hooks is not None:
+            self.hooks.close()
+
+        if self.recorder is not None:
+            self.recorder.close()
+
     def updates_worker(self):
 
         while True:
@@ -117,12 +223,7 @@ class Client:
                 self.update_queue.put(None)
                 break
 
-            if isinstance(update, (
-                    updateAuthorizationState, authorizationStateWaitTdlibParameters,
-                    authorizationStateWaitEncryptionKey, authorizationStateWaitPhoneNumber,
-                    authorizationStateWaitCode, authorizationStateWaitPassword,
-                    authorizationStateReady)
-                            ):
+            if isinstance(update, self.AUTH_TYPES):
                 self.auth(update)
             self.update_queue.put(update)
 
@@ -135,7 +236,76 @@ class Client:
                 break
 
             if self.logged_in and self.update_handler:
-                self.update_handler(update)
+                try:
+                    self.call_handler(update)
+                except Exception as e:
+                    print(e)
+
+    def dispatch_worker(self, queue: Queue = None):
+        queue = self.update_queue if queue is None else queue
+
+        while True:
+            update = queue.get()
+
+            if update is None:
+                break
+
+            try:
+                self.handle_update(update)
+            except Exception as e:
+                print(e)
+
+    def handle_update(self, update):
+
+        if isinstance(update, self.AUTH_TYPES):
+            self.auth(update)
+
+        if self.logged_in and self.update_handler:
+            self.call_handler(update)
+
+        if self.logged_in and self.hub is not None and self.hub.update_handler:
+            self.hub.update_handler(self, update)
+
+    def call_handler(self, update):
+        if self.metrics is None and self.hooks is None:
+            self.update_handler(update)
+            return
+
+        if self.hooks is not None:
+            token = self.hooks.enter(Hooks.HANDLER, update.ID)
+
+        start = time.perf_counter()
+
+        try:
+            self.update_handler(update)
+        finally:
+            if self.metrics is not None:
+                self.metrics.handlers.observe(update.ID, time.perf_counter() - start)
+
+            if self.hooks is not None:
+                self.hooks.exit(Hooks.HANDLER, update.ID, token)
+
+    def replay(self, path: str, speed: float = None) -> dict:
+        """Feed a :class:`pytdlib.session.Recorder` file through decoding, listeners and the update handler.
+
+        Runs on the calling thread without TDLib, on a client that isn't started (or was stopped): recorded auth
+        updates aren't acted upon and recorded responses never complete a pending request. ``speed`` as in
+        :meth:`pytdlib.session.Replayer.run`, returns its stats.
+        """
+        if self.session.is_runnig:
+            raise RuntimeError("Can't replay on a running client, stop it first")
+
+        updates_queue = self.session.updates_queue
+        self.session.updates_queue = CallQueue(self.replay_update)
+
+        try:
+            return self.session.replay(path, speed)
+        finally:
+            self.session.updates_queue = updates_queue
+
+    def replay_update(self, update):
+        if self.update_handler:
+            self.call_handler(update)
 
     def signal_handler(self, *args):
         self.stop()
@@ -151,35 +321,64 @@ class Client:
         while self.is_idle:
             time.sleep(1)
 
-    def set_update_handler(self, callback: callable):
+    def set_update_handler(self, callback: callable, update_types: list = None):
+        if getattr(callback, "in_process", False):
+            # Imported here, the process module builds its RemoteClient out of Client
+            from .process import ProcessPool
+
+            if self.process_pool is None:
+                self.process_pool = ProcessPool(self)
+
+            callback = self.process_pool.handler(callback)
+
         self.update_handler = callback
+        self.session.subscribe(
+            None if update_types is None else [getattr(i, "ID", i) for i in update_types]
+        )
 
     def send(self, data: object, wait_response: bool = True):
         return self.session.send(data, wait_response)
 
+    def send_async(self, data: object):
+        return self.session.send_async(data)
+
+    def send_many(self, requests: list, return_exceptions: bool = False):
+        return self.session.send_many(requests, return_exceptions)
+
+    def send_to_chat(self, chat_id: int, data: object, priority: int = Scheduler.NORMAL):
+        if self.scheduler is None:
+            return self.send(data)
+
+        future = self.scheduler.submit(chat_id, data, priority)
+
+        try:
+            return future.result(self.session.send_timeout)
+        except FutureTimeoutError:
+            # Same contract as send(): a request that timed out yields None, and leaves the queue
+            future.cancel()
+            return None
+
     def auth(self, data):
+        request = self.auth_request(data)
+
+        if request is not None:
+            try:
+                return self.send(request)
+            except Exception as e:
+                print(e)
+                self.stop()
+
+    def auth_request(self, data):
 
         if isinstance(data, updateAuthorizationState):
-            return self.auth(data.authorization_state)
+            return self.auth_request(data.authorization_state)
         elif isinstance(data, authorizationStateWaitPhoneNumber):
             if self.login:
                 if self.token_key is not None:
-                    try:
-                        return self.send(
-                            checkAuthenticationBotToken(self.token_key)
-                        )
-                    except Exception as e:
-                        self.stop()
-                        print(e)
+                    return checkAuthenticationBotToken(self.token_key)
 
                 elif self.phone_number is not None:
-                    try:
-                        return self.send(
-                            setAuthenticationPhoneNumber(self.phone_number, False, False)
-                        )
-                    except Exception as e:
-                        print(e)
-                        self.stop()
+                    return setAuthenticationPhoneNumber(self.phone_number, False, False)
 
                 else:
                     login_key = input("Enter phone number or bot token-key: ")
@@ -193,18 +392,10 @@ class Client:
                             login_key = input("Enter phone number or bot token-key: ")
 
                     is_token = re.search("(\d+):(\S+)", str(login_key))
-                    try:
-                        if is_token:
-                            return self.send(
-                                checkAuthenticationBotToken(str(login_key))
-                            )
-                        else:
-                            self.send(
-                                setAuthenticationPhoneNumber(str(login_key), False, False)
-                            )
-                    except Exception as e:
-                        print(e)
-                        self.stop()
+                    if is_token:
+                        return checkAuthenticationBotToken(str(login_key))
+                    else:
+                        return setAuthenticationPhoneNumber(str(login_key), False, False)
             else:
                 print("not logged in. Try running with login option")
                 self.stop()
@@ -220,13 +411,7 @@ class Client:
                 self.last_name = self.last_name if self.last_name is not None \
                     else "{}".format(input("last name: "))
 
-            try:
-                self.send(
-                    checkAuthenticationCode(self.phone_code, self.first_name, self.last_name)
-                )
-            except Exception as e:
-                print(e)
-                self.stop()
+            return checkAuthenticationCode(self.phone_code, self.first_name, self.last_name)
 
         elif isinstance(data, authorizationStateWaitPassword):
             print("Hint: {}".format(data.password_hint))
@@ -235,24 +420,58 @@ class Client:
                     self.password = self.password()
             else:
                 self.password = "{}".format(input("Enter password: "))
-                try:
-                    return self.send(
-                        checkAuthenticationPassword(self.password)
-                    )
-                except Exception as e:
-                    print(e)
-                    self.stop()
+
+            return checkAuthenticationPassword(self.password)
 
         elif isinstance(data, authorizationStateReady):
             self.password = None
             self.login = False
             self.logged_in = True
-            return print("logged in successfully\n")
+            print("logged in successfully\n")
+
+
+    def cached(self, cache: str, key, request: object):
+        lru = self.caches.get(cache)
+
+        if lru is None:
+            return self.send(request)
+
+        entity = lru.get(key)
+
+        if entity is None:
+            entity = self.send(request)
+
+            if entity is not None:
+                lru.put(key, entity)
 
+        return entity
+
+    def get_user(self, user_id: int):
+        return self.cached("users", user_id, getUser(user_id))
+
+    def get_chat(self, chat_id: int):
+        return self.cached("chats", chat_id, getChat(chat_id))
+
+    def get_basic_group(self, basic_group_id: int):
+        return self.cached("basic_groups", basic_group_id, getBasicGroup(basic_group_id))
+
+    def get_supergroup(self, supergroup_id: int):
+        return self.cached("supergroups", supergroup_id, getSupergroup(supergroup_id))
+
+    def get_message(self, chat_id: int, message_id: int):
+        return self.cached("messages", (chat_id, message_id), getMessage(chat_id, message_id))
+
+    def get_reply_message(self, message):
+        if message.reply_to_message_id:
+            return self.get_message(message.chat_id, message.reply_to_message_id)
 
     def send_msg(self, chat_id: int , reply_to_message_id: int, disable_notification: bool, from_background: bool,
-                     reply_markup: ReplyMarkup, input_message_content: InputMessageContent):
-        return self.send(
+                     reply_markup: ReplyMarkup, input_message_content: InputMessageContent, priority: int = None):
+        if priority is None:
+            priority = Scheduler.REPLY if reply_to_message_id else Scheduler.NORMAL
+
+        return self.send_to_chat(
+            chat_id,
             sendMessage(
                 chat_id,
                 reply_to_message_id,
@@ -260,12 +479,14 @@ class Client:
                 from_background,
                 reply_markup,
                 input_message_content
-            )
+            ),
+            priority
         )
 
     def send_message(self, chat_id: int , text: str, reply_to_message_id:int = 0, parse_mode: str = None,
                      disable_notification: bool = False, from_background: bool = False,
-                     reply_markup: ReplyMarkup = None, disable_web_page_preview: bool = False, action: bool = True):
+                     reply_markup: ReplyMarkup = None, disable_web_page_preview: bool = False, action: bool = True,
+                     priority: int = None):
 
         if action:
             self.send(sendChatAction(chat_id, chatActionTyping()), False)
@@ -287,17 +508,21 @@ class Client:
                 formatted_text,
                 disable_web_page_preview,
                 True
-            )
+            ),
+            priority
         )
 
-    def forward_messages(self, chat_id: int or str, from_chat_id: int or str, message_ids: list):
-        return self.send(
+    def forward_messages(self, chat_id: int or str, from_chat_id: int or str, message_ids: list,
+                         priority: int = Scheduler.NORMAL):
+        return self.send_to_chat(
+            chat_id,
             forwardMessages(
                 chat_id,
                 from_chat_id,
                 message_ids,
                 False,
                 False
-            )
+            ),
+            priority
         )
 
@@ -0,0 +1,127 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import deque
+from threading import Condition
+from time import monotonic
+
+
+class UpdateLanes:
+    """Drop-in replacement for the client update queue that serves updates by priority.
+
+    Every update goes to the lane its ``@type`` is configured for (``default`` when it isn't listed) and
+    :meth:`get` returns the oldest update of the highest priority non-empty lane. Each time a lower lane is
+    passed over its skip counter grows, once it reaches ``max_skips`` that lane is served next, so background
+    lanes keep moving under a sustained burst of interactive updates.
+
+    Args:
+        lanes (``list``): One list of update types (classes or ``@type`` strings) per lane, highest first.
+        default (:obj:`int`): Lane of unlisted update types.
+        max_skips (:obj:`int`): Times a non-empty lane may be passed over before it is served.
+    """
+
+    LANES = (
+        ("updateAuthorizationState", "updateNewMessage", "updateNewCallbackQuery", "updateNewInlineQuery",
+         "updateNewChosenInlineResult", "updateNewInlineCallbackQuery", "updateNewShippingQuery",
+         "updateNewPreCheckoutQuery", "updateNewCustomEvent", "updateNewCustomQuery"),
+        (),
+        ("updateUserStatus", "updateUserChatAction", "updateChatOrder", "updateChatLastMessage",
+         "updateChatReadInbox", "updateChatReadOutbox", "updateChatIsPinned", "updateChatUnreadMentionCount",
+         "updateChatDraftMessage", "updateMessageViews", "updateFile", "updateOption", "updateConnectionState",
+         "updateInstalledStickerSets", "updateTrendingStickerSets", "updateRecentStickers",
+         "updateFavoriteStickers", "updateSavedAnimations"),
+    )
+
+    def __init__(self, lanes: list = LANES, default: int = 1, max_skips: int = 8):
+        self.lanes = [deque() for _ in lanes]
+        self.default = default
+        self.max_skips = max_skips
+        self.condition = Condition()
+
+        self.lane_of = {}
+
+        for i, types in enumerate(lanes):
+            for update_type in types:
+                self.lane_of[getattr(update_type, "ID", update_type)] = i
+
+        self.skips = [0] * len(lanes)
+        self.served = [0] * len(lanes)
+        self.latency_total = [0.0] * len(lanes)
+        self.latency_max = [0.0] * len(lanes)
+
+    def put(self, update):
+        # The stop sentinel jumps every lane
+        lane = 0 if update is None else self.lane_of.get(update.ID, self.default)
+
+        with self.condition:
+            self.lanes[lane].append((monotonic(), update))
+            self.condition.notify()
+
+    def get(self):
+        with self.condition:
+            while True:
+                lane = self.pick()
+
+                if lane is not None:
+                    break
+
+                self.condition.wait()
+
+            stamp, update = self.lanes[lane].popleft()
+            latency = monotonic() - stamp
+
+            self.served[lane] += 1
+            self.latency_total[lane] += latency
+            self.latency_max[lane] = max(self.latency_max[lane], latency)
+
+            return update
+
+    def pick(self) -> int:
+        first = None
+
+        for i, lane in enumerate(self.lanes):
+            if not lane:
+                continue
+
+            if first is None:
+                first = i
+            elif self.skips[i] >= self.max_skips:
+                self.skips[i] = 0
+                return i
+            else:
+                self.skips[i] += 1
+
+        if first is not None:
+            self.skips[first] = 0
+
+        return first
+
+    def qsize(self) -> int:
+        return sum(len(i) for i in self.lanes)
+
+    def stats(self) -> list:
+        with self.condition:
+            return [
+                {
+                    "depth": len(lane),
+                    "served": self.served[i],
+                    "latency_avg": self.latency_total[i] / self.served[i] if self.served[i] else 0.0,
+                    "latency_max": self.latency_max[i],
+                }
+                for i, lane in enumerate(self.lanes)
+            ]
@@ -0,0 +1,173 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import traceback
+from threading import Thread, BoundedSemaphore
+from multiprocessing import get_all_start_methods, get_context
+from multiprocessing.managers import BaseManager
+from concurrent.futures import ProcessPoolExecutor
+from .client import Client
+
+# Set in every pool process by connect()
+client = None
+
+
+def in_process(handler: callable) -> callable:
+    """Mark an update handler to run in the client's process pool instead of a dispatch thread.
+
+    The handler must be importable by the worker processes (a module level function) and is called as
+    ``handler(client, update)``, where ``client`` is a :class:`RemoteClient` whose requests are sent by the
+    parent session. Only :class:`pytdlib.Client` supports it, :class:`pytdlib.AsyncClient` rejects such handlers.
+    """
+    handler.in_process = True
+    return handler
+
+
+class ClientFacade:
+    """Parent side of :class:`RemoteClient`, served to the pool processes by the manager."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def send(self, data, wait_response: bool = True):
+        return self.client.send(data, wait_response)
+
+    def send_many(self, requests: list, return_exceptions: bool = False):
+        return self.client.send_many(requests, return_exceptions)
+
+    def send_to_chat(self, chat_id: int, data, priority: int):
+        return self.client.send_to_chat(chat_id, data, priority)
+
+    def execute(self, data):
+        return self.client.execute(data)
+
+    def cached(self, cache: str, key: int, request):
+        return self.client.cached(cache, key, request)
+
+
+class RemoteClient:
+    """Client handed to process pool handlers, every request goes through the parent session."""
+
+    scheduler = None
+
+    def __init__(self, proxy):
+        self.proxy = proxy
+
+    def send(self, data, wait_response: bool = True):
+        return self.proxy.send(data, wait_response)
+
+    def send_many(self, requests: list, return_exceptions: bool = False):
+        return self.proxy.send_many(requests, return_exceptions)
+
+    def send_to_chat(self, chat_id: int, data, priority: int = 1):
+        return self.proxy.send_to_chat(chat_id, data, priority)
+
+    def execute(self, data):
+        return self.proxy.execute(data)
+
+    def cached(self, cache: str, key: int, request):
+        return self.proxy.cached(cache, key, request)
+
+    get_user = Client.get_user
+    get_chat = Client.get_chat
+    get_basic_group = Client.get_basic_group
+    get_supergroup = Client.get_supergroup
+    get_message = Client.get_message
+    get_reply_message = Client.get_reply_message
+    send_msg = Client.send_msg
+    send_message = Client.send_message
+    forward_messages = Client.forward_messages
+
+
+class Manager(BaseManager):
+    pass
+
+
+def connect(address, authkey: bytes):
+    global client
+
+    Manager.register("client")
+    manager = Manager(address=address, authkey=authkey)
+    manager.connect()
+    client = RemoteClient(manager.client())
+
+
+def call(handler: callable, update):
+    return handler(client, update)
+
+
+class ProcessPool:
+    """Runs :func:`in_process` handlers on a :class:`concurrent.futures.ProcessPoolExecutor`.
+
+    Updates are pickled in the compact :meth:`Object.__reduce__` form. At most ``max_pending`` updates are
+    queued to the pool, past that the dispatch worker submitting the next one blocks until a slot frees up.
+
+    Args:
+        client (:class:`pytdlib.Client`): Client whose session serves the workers' requests.
+        workers (:obj:`int`): Pool processes, defaults to the number of CPUs.
+        max_pending (:obj:`int`): Updates queued to the pool at once, defaults to ``workers * 4``.
+        mp_context: Multiprocessing context, defaults to ``forkserver`` where available since forking a process
+            with running client threads is unsafe.
+    """
+
+    def __init__(self, client, workers: int = None, max_pending: int = None, mp_context=None):
+        self.workers = workers or os.cpu_count()
+        self.slots = BoundedSemaphore(max_pending or self.workers * 4)
+
+        authkey = os.urandom(32)
+        facade = ClientFacade(client)
+
+        Manager.register("client", callable=lambda: facade)
+        self.server = Manager(address=("127.0.0.1", 0), authkey=authkey).get_server()
+        Thread(target=self.server.serve_forever, name="ProcessPoolServer", daemon=True).start()
+
+        if mp_context is None and "forkserver" in get_all_start_methods():
+            mp_context = get_context("forkserver")
+
+        self.executor = ProcessPoolExecutor(
+            self.workers, mp_context=mp_context, initializer=connect, initargs=(self.server.address, authkey)
+        )
+
+    def handler(self, handler: callable) -> callable:
+        def submit(update):
+            self.slots.acquire()
+
+            try:
+                future = self.executor.submit(call, handler, update)
+            except RuntimeError:
+                # The pool was shut down while this update was being dispatched
+                self.slots.release()
+                return
+
+            future.add_done_callback(self.done)
+
+        return submit
+
+    def done(self, future):
+        self.slots.release()
+
+        if not future.cancelled() and future.exception() is not None:
+            error = future.exception()
+            print("".join(traceback.format_exception(type(error), error, error.__traceback__)))
+
+    def stop(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+        if getattr(self.server, "stop_event", None) is not None:
+            self.server.stop_event.set()
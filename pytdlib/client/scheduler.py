@@ -0,0 +1,310 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import OrderedDict, deque
+from concurrent.futures import Future, InvalidStateError
+from threading import Thread, Condition
+from time import monotonic
+from pytdlib.api.errors import Error
+
+
+class TokenBucket:
+
+    __slots__ = ("rate", "capacity", "tokens", "stamp")
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.stamp = now
+
+    def refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+
+    def delay(self, now: float) -> float:
+        self.refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+
+class Job:
+
+    __slots__ = ("chat_id", "request", "priority", "future", "enqueued", "attempt", "not_before")
+
+    def __init__(self, chat_id: int, request, priority: int, now: float):
+        self.chat_id = chat_id
+        self.request = request
+        self.priority = priority
+        self.future = Future()
+        self.enqueued = now
+        self.attempt = 0
+        self.not_before = 0.0
+
+
+class Scheduler:
+    """Rate limits outgoing chat requests before they reach the session.
+
+    A request leaves the queue only when both the global bucket and the bucket of its chat hold a token.
+    Lower priority classes are served only when no higher class has a sendable request, and chats within a
+    class are served round-robin so one busy chat can't hold back the others. Failed requests go through the
+    retry policy like :meth:`pytdlib.session.Session.send`: a FLOOD_WAIT is recorded for its scope and timeouts or
+    :obj:`OSError` back off, then the request is put back at the head of its chat queue. Once retries are
+    exhausted an :class:`pytdlib.Error` fails the future, a timeout or :obj:`OSError` resolves it to ``None``.
+
+    A future cancelled by its caller is dropped from the queue, :meth:`stop` cancels every queued one.
+
+    Args:
+        rate (:obj:`float`): Global requests per second.
+        burst (:obj:`int`): Global bucket capacity.
+        chat_rate (:obj:`float`): Requests per second for a single chat.
+        chat_burst (:obj:`int`): Per-chat bucket capacity.
+    """
+
+    REPLY = 0
+    NORMAL = 1
+    BROADCAST = 2
+    PRIORITIES = (REPLY, NORMAL, BROADCAST)
+    IDLE_TIMEOUT = 1.0
+    PRUNE_INTERVAL = 60.0
+
+    def __init__(self, rate: float = 30, burst: int = 30, chat_rate: float = 1, chat_burst: int = 3):
+        self.rate = rate
+        self.chat_rate = chat_rate
+        self.chat_burst = chat_burst
+
+        self.bucket = TokenBucket(rate, burst, monotonic())
+        self.chat_buckets = {}
+        self.pruned = monotonic()
+        self.queues = {i: OrderedDict() for i in self.PRIORITIES}
+        self.condition = Condition()
+
+        self.sender = None
+        self.retry_policy = None
+        self.is_runnig = False
+
+        self.depth = 0
+        self.sent = {i: 0 for i in self.PRIORITIES}
+        self.wait_total = {i: 0.0 for i in self.PRIORITIES}
+        self.wait_max = {i: 0.0 for i in self.PRIORITIES}
+
+    def start(self, sender: callable, retry_policy=None):
+        self.sender = sender
+        self.retry_policy = retry_policy
+
+        if not self.is_runnig:
+            self.is_runnig = True
+            Thread(target=self.worker, name="SchedulerThread").start()
+
+    def stop(self):
+        with self.condition:
+            self.is_runnig = False
+            jobs = [job for queue in self.queues.values() for chat in queue.values() for job in chat]
+
+            for queue in self.queues.values():
+                queue.clear()
+
+            self.depth = 0
+            self.condition.notify()
+
+        for job in jobs:
+            job.future.cancel()
+
+    def submit(self, chat_id: int, request, priority: int = NORMAL) -> Future:
+        """Queue a request for ``chat_id`` and return a future for its response."""
+        job = Job(chat_id, request, priority, monotonic())
+
+        with self.condition:
+            self.enqueue(job)
+            self.condition.notify()
+
+        return job.future
+
+    def enqueue(self, job: Job, front: bool = False):
+        queue = self.queues[job.priority]
+        jobs = queue.get(job.chat_id)
+
+        if jobs is None:
+            jobs = queue[job.chat_id] = deque()
+
+        if front:
+            jobs.appendleft(job)
+        else:
+            jobs.append(job)
+
+        self.depth += 1
+
+    def chat_bucket(self, chat_id: int, now: float) -> TokenBucket:
+        bucket = self.chat_buckets.get(chat_id)
+
+        if bucket is None:
+            bucket = self.chat_buckets[chat_id] = TokenBucket(self.chat_rate, self.chat_burst, now)
+
+        return bucket
+
+    def next_job(self, now: float) -> tuple:
+        """Pop the next sendable job, or return ``None`` and how long until one may become sendable."""
+        wait = self.bucket.delay(now)
+
+        if wait:
+            return None, wait
+
+        wait = self.IDLE_TIMEOUT
+
+        for priority in self.PRIORITIES:
+            queue = self.queues[priority]
+
+            for chat_id in list(queue):
+                jobs = queue[chat_id]
+
+                while jobs and jobs[0].future.cancelled():
+                    jobs.popleft()
+                    self.depth -= 1
+
+                if not jobs:
+                    del queue[chat_id]
+                    continue
+
+                delay = self.chat_bucket(chat_id, now).delay(now)
+
+                if not delay:
+                    delay = max(0.0, jobs[0].not_before - now)
+
+                if not delay and self.retry_policy is not None:
+                    delay = self.retry_policy.flood_wait(jobs[0].request)
+
+                if delay:
+                    wait = min(wait, delay)
+                    continue
+
+                job = jobs.popleft()
+
+                if jobs:
+                    queue.move_to_end(chat_id)
+                else:
+                    del queue[chat_id]
+
+                self.chat_buckets[chat_id].tokens -= 1
+                self.bucket.tokens -= 1
+                self.depth -= 1
+
+                return job, 0.0
+
+        return None, wait
+
+    def worker(self):
+
+        while True:
+
+            with self.condition:
+                while self.is_runnig:
+                    now = monotonic()
+                    job, wait = self.next_job(now)
+
+                    if job is not None:
+                        break
+
+                    self.prune(now)
+                    self.condition.wait(wait)
+                else:
+                    break
+
+                waited = now - job.enqueued
+                self.sent[job.priority] += 1
+                self.wait_total[job.priority] += waited
+                self.wait_max[job.priority] = max(self.wait_max[job.priority], waited)
+
+            self.sender(job.request).add_done_callback(lambda f, job=job: self.done(job, f))
+
+    def done(self, job: Job, future: Future):
+
+        if future.cancelled():
+            job.future.cancel()
+            return
+
+        error = future.exception()
+
+        if error is None:
+            self.resolve(job, future.result())
+            return
+
+        if isinstance(error, (Error, OSError, TimeoutError)):
+            delay = None if self.retry_policy is None else self.retry_policy.on_error(job.request, error, job.attempt)
+
+            if delay is not None:
+                job.attempt += 1
+                job.not_before = monotonic() + delay
+
+                with self.condition:
+                    if self.is_runnig:
+                        self.enqueue(job, front=True)
+                        self.condition.notify()
+                        return
+
+                job.future.cancel()
+                return
+
+            if not isinstance(error, Error):
+                # Same contract as Session.send: exhausted timeouts and connection errors yield None
+                self.resolve(job, None)
+                return
+
+        self.resolve(job, error=error)
+
+    @staticmethod
+    def resolve(job: Job, result=None, error: Exception = None):
+        try:
+            if error is None:
+                job.future.set_result(result)
+            else:
+                job.future.set_exception(error)
+        except InvalidStateError:
+            # Cancelled by a caller that stopped waiting
+            pass
+
+    def prune(self, now: float):
+        # Idle chats with a full bucket behave exactly like new ones, so their bucket can go
+        if now - self.pruned < self.PRUNE_INTERVAL:
+            return
+
+        self.pruned = now
+        queued = set()
+
+        for queue in self.queues.values():
+            queued.update(queue)
+
+        for chat_id, bucket in list(self.chat_buckets.items()):
+            bucket.refill(now)
+
+            if chat_id not in queued and bucket.tokens >= bucket.capacity:
+                del self.chat_buckets[chat_id]
+
+    def stats(self) -> dict:
+        with self.condition:
+            return {
+                "depth": self.depth,
+                "chats": sum(len(i) for i in self.queues.values()),
+                "priorities": {
+                    priority: {
+                        "depth": sum(len(i) for i in self.queues[priority].values()),
+                        "sent": self.sent[priority],
+                        "wait_avg": self.wait_total[priority] / self.sent[priority] if self.sent[priority] else 0.0,
+                        "wait_max": self.wait_max[priority],
+                    }
+                    for priority in self.PRIORITIES
+                }
+            }
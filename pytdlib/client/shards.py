@@ -0,0 +1,63 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+from queue import Queue
+from itertools import count
+
+
+class ShardedQueue:
+    """Update queue that pins every chat to one worker.
+
+    Updates are hashed by ``chat_id`` (``user_id`` for user scoped updates, then the id of an embedded message,
+    chat or user) onto one of ``shards`` queues, each drained by a single worker. Updates of one chat are
+    therefore handled one at a time and in the order they arrived, while different chats run in parallel.
+    Updates without a chat or user are sharded by their type.
+    """
+
+    def __init__(self, shards: int):
+        self.shards = [Queue() for _ in range(shards)]
+        self.sentinels = count()
+
+    @staticmethod
+    def key(update) -> int:
+        for name in ("chat_id", "user_id"):
+            value = getattr(update, name, None)
+
+            if value:
+                return value
+
+        for name, field in (("message", "chat_id"), ("chat", "id"), ("user", "id")):
+            value = getattr(getattr(update, name, None), field, None)
+
+            if value:
+                return value
+
+        return hash(update.ID)
+
+    def shard(self, index: int) -> Queue:
+        return self.shards[index]
+
+    def put(self, update):
+        if update is None:
+            # Stop sentinels go round-robin so every worker receives one
+            self.shards[next(self.sentinels) % len(self.shards)].put(None)
+        else:
+            self.shards[self.key(update) % len(self.shards)].put(update)
+
+    def qsize(self) -> int:
+        return sum(i.qsize() for i in self.shards)
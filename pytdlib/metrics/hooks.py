@@ -0,0 +1,135 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+from threading import Lock
+from time import perf_counter, thread_time
+
+
+class Hooks:
+    """Profiling hook points on the hot paths, pass an instance as ``Client(hooks=...)``.
+
+    Every point calls ``token = enter(point, key)`` right before the measured call and ``exit(point, key, token)``
+    right after it, on the thread doing the work. ``key`` is the TL type involved; at ``RECEIVE`` and ``LOADS`` it
+    is only known once the call returned, so ``enter`` gets ``None`` there. A deterministic profiler accumulates
+    between the two calls, a sampling one records what each thread is in at ``enter`` and clears it at ``exit``.
+
+    Points:
+
+    * ``RECEIVE``: ``td_json_client_receive`` ctypes call, keyed by the received type (``None`` when idle)
+    * ``SEND``: ``td_json_client_send`` ctypes call, keyed by the request type
+    * ``LOADS``: JSON decode of a received event
+    * ``READ``: ``Object.read`` (or ``read_lazy``) of a decoded event
+    * ``HANDLER``: the update handler call of a client
+    * ``REQUEST``: ``Session._send``, a request round trip
+
+    Sessions check ``self.hooks is not None`` before calling into them, without hooks nothing is wrapped.
+    """
+
+    RECEIVE = "receive"
+    SEND = "send"
+    LOADS = "loads"
+    READ = "read"
+    HANDLER = "handler"
+    REQUEST = "request"
+
+    def enter(self, point: str, key: str = None):
+        pass
+
+    def exit(self, point: str, key: str, token):
+        pass
+
+    def close(self):
+        pass
+
+
+def event_type(event: bytes) -> str:
+    # TDLib and the generated to_json both put "@type" first
+    if event and event.startswith(b'{"@type":"'):
+        return event[10:event.index(b'"', 10)].decode("utf-8")
+
+
+class Hooked:
+    """Wraps an :class:`pytdlib.actor.Actor` ctypes call so it reports to ``hooks``."""
+
+    def __init__(self, call, hooks: Hooks, point: str):
+        self.call = call
+        self.hooks = hooks
+        self.point = point
+
+    def __call__(self, *args, **kwargs):
+        if self.point == Hooks.SEND:
+            key = event_type(args[0])
+            token = self.hooks.enter(self.point, key)
+            result = self.call(*args, **kwargs)
+        else:
+            token = self.hooks.enter(self.point)
+            result = self.call(*args, **kwargs)
+            key = event_type(result)
+
+        self.hooks.exit(self.point, key, token)
+        return result
+
+    def __getattr__(self, name: str):
+        return getattr(self.call, name)
+
+
+class CostProfiler(Hooks):
+    """Accumulates thread CPU time and wall time per hook point and type, the table is written on close.
+
+    CPU time comes from :func:`time.thread_time`, so waiting (in ``receive`` or for a response) shows up as wall time
+    only.
+    """
+
+    def __init__(self, path: str = "pytdlib-profile.txt"):
+        self.path = path
+        self.costs = {}
+        self.lock = Lock()
+
+    def enter(self, point: str, key: str = None):
+        return thread_time(), perf_counter()
+
+    def exit(self, point: str, key: str, token):
+        cpu = thread_time() - token[0]
+        wall = perf_counter() - token[1]
+
+        with self.lock:
+            cost = self.costs.get((point, key))
+
+            if cost is None:
+                cost = self.costs[(point, key)] = [0, 0.0, 0.0]
+
+            cost[0] += 1
+            cost[1] += cpu
+            cost[2] += wall
+
+    def table(self) -> str:
+        with self.lock:
+            costs = sorted(self.costs.items(), key=lambda i: i[1][1], reverse=True)
+
+        lines = ["{:<10} {:<48} {:>10} {:>12} {:>12} {:>12}".format(
+            "point", "type", "calls", "cpu ms", "cpu us/call", "wall ms")]
+
+        for (point, key), (calls, cpu, wall) in costs:
+            lines.append("{:<10} {:<48} {:>10} {:>12.3f} {:>12.2f} {:>12.3f}".format(
+                point, str(key), calls, cpu * 1000, cpu * 1e6 / calls, wall * 1000))
+
+        return "\n".join(lines) + "\n"
+
+    def close(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(self.table())
@@ -0,0 +1,196 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+from bisect import bisect_left
+from threading import Thread, Lock, Event
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DECODE_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01)
+
+
+def escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Counter:
+
+    def __init__(self, name: str, help: str, label: str):
+        self.name = name
+        self.help = help
+        self.label = label
+        self.values = {}
+        self.lock = Lock()
+
+    def inc(self, label: str, value: float = 1):
+        with self.lock:
+            self.values[label] = self.values.get(label, 0) + value
+
+    def render(self) -> list:
+        lines = ["# HELP {} {}".format(self.name, self.help), "# TYPE {} counter".format(self.name)]
+
+        with self.lock:
+            for label, value in sorted(self.values.items()):
+                lines.append('{}{{{}="{}"}} {}'.format(self.name, self.label, escape(label), value))
+
+        return lines
+
+
+class Histogram:
+
+    def __init__(self, name: str, help: str, label: str, buckets: tuple = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.label = label
+        self.buckets = buckets
+        self.values = {}
+        self.lock = Lock()
+
+    def observe(self, label: str, value: float):
+        with self.lock:
+            series = self.values.get(label)
+
+            if series is None:
+                # Per bucket counts (the last one is +Inf), sum, count
+                series = self.values[label] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+
+            series[0][bisect_left(self.buckets, value)] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> list:
+        lines = ["# HELP {} {}".format(self.name, self.help), "# TYPE {} histogram".format(self.name)]
+
+        with self.lock:
+            for label, (counts, total, count) in sorted(self.values.items()):
+                label = '{}="{}"'.format(self.label, escape(label))
+                cumulative = 0
+
+                for bound, n in zip(self.buckets + ("+Inf",), counts):
+                    cumulative += n
+                    lines.append('{}_bucket{{{},le="{}"}} {}'.format(self.name, label, bound, cumulative))
+
+                lines.append("{}_sum{{{}}} {}".format(self.name, label, total))
+                lines.append("{}_count{{{}}} {}".format(self.name, label, count))
+
+        return lines
+
+
+class Metrics:
+    """Runtime metrics of a client, exported in the Prometheus text format.
+
+    Pass an instance as ``Client(metrics=...)``. Sessions and clients check ``self.metrics is not None`` before
+    taking any timestamp, so leaving it out costs a single attribute test per event.
+
+    Collected series:
+
+    * ``pytdlib_request_seconds{type}``: request latency from send to result, per function
+    * ``pytdlib_request_timeouts_total{type}``, ``pytdlib_request_errors_total{type}``
+    * ``pytdlib_retries_total{type}``: retries made by the retry policy
+    * ``pytdlib_decode_seconds{type}``: JSON decode plus object read, per update type
+    * ``pytdlib_handler_seconds{type}``: update handler time, per update type
+    * ``pytdlib_queue_depth{queue}``: recv_queue, updates_queue, update_queue and in-flight requests
+    """
+
+    def __init__(self):
+        self.requests = Histogram("pytdlib_request_seconds", "Request latency from send to result.", "type")
+        self.timeouts = Counter("pytdlib_request_timeouts_total", "Requests that timed out.", "type")
+        self.errors = Counter("pytdlib_request_errors_total", "Requests answered with an error.", "type")
+        self.retries = Counter("pytdlib_retries_total", "Requests sent again by the retry policy.", "type")
+        self.decode = Histogram("pytdlib_decode_seconds", "Update decode time.", "type", DECODE_BUCKETS)
+        self.handlers = Histogram("pytdlib_handler_seconds", "Update handler execution time.", "type")
+        self.queues = {}
+
+        self.server = None
+        self.stopped = Event()
+
+    def request_done(self, request_type: str, elapsed: float, future):
+        if future.cancelled():
+            return
+
+        error = future.exception()
+
+        if error is None:
+            self.requests.observe(request_type, elapsed)
+        elif isinstance(error, TimeoutError):
+            self.timeouts.inc(request_type)
+        else:
+            self.requests.observe(request_type, elapsed)
+            self.errors.inc(request_type)
+
+    def track_queue(self, name: str, depth: callable):
+        """Report ``depth()`` as the ``pytdlib_queue_depth`` of ``name``, sampled at export time."""
+        self.queues[name] = depth
+
+    def render(self) -> str:
+        lines = []
+
+        for metric in (self.requests, self.timeouts, self.errors, self.retries, self.decode, self.handlers):
+            lines.extend(metric.render())
+
+        lines.append("# HELP pytdlib_queue_depth Items waiting in an internal queue.")
+        lines.append("# TYPE pytdlib_queue_depth gauge")
+
+        for name, depth in sorted(self.queues.items()):
+            lines.append('pytdlib_queue_depth{{queue="{}"}} {}'.format(escape(name), depth()))
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        # Written aside and renamed so a scraper never reads a partial file
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            f.write(self.render())
+
+        os.replace(path + ".tmp", path)
+
+    def export(self, path: str = None, port: int = None, interval: float = 15.0, host: str = "127.0.0.1"):
+        """Export to a text file rewritten every ``interval`` seconds (node exporter textfile style) and/or serve
+        it over HTTP on ``host:port``."""
+        if path is not None:
+            Thread(target=self.file_exporter, args=(path, interval), name="MetricsExporter", daemon=True).start()
+
+        if port is not None:
+            metrics = self
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    body = metrics.render().encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/plain; version=0.0.4")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, *args):
+                    pass
+
+            self.server = ThreadingHTTPServer((host, port), Handler)
+            Thread(target=self.server.serve_forever, name="MetricsServer", daemon=True).start()
+
+    def file_exporter(self, path: str, interval: float):
+        while not self.stopped.wait(interval):
+            self.write(path)
+
+        self.write(path)
+
+    def stop(self):
+        self.stopped.set()
+
+        if self.server is not None:
+            self.server.shutdown()
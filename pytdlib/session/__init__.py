@@ -17,3 +17,7 @@
 # along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
 
 from .session import Session
+from .async_session import AsyncSession
+from .hub import SessionHub
+from .retry import RetryPolicy
+from .recorder import Recorder, Replayer
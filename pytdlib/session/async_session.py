@@ -0,0 +1,149 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+from concurrent.futures import Future
+from .msg_id import MsgId
+from .session import Session
+from pytdlib.api.util import Object
+from pytdlib.api.errors import Error
+from pytdlib.metrics.hooks import Hooks
+from pytdlib.api.functions import setTdlibParameters, checkDatabaseEncryptionKey
+
+
+class AsyncSession(Session):
+
+    def __init__(self, *args, **kwargs):
+        super(AsyncSession, self).__init__(*args, **kwargs)
+
+        self.loop = None
+        self.pending.expire = self.expire
+
+    async def start(self, updates_queue: asyncio.Queue, main_workers: int, single_stage: bool = False):
+        self.loop = asyncio.get_event_loop()
+        self.main_workers = main_workers
+        self.updates_queue = updates_queue
+        self.single_stage = single_stage
+
+        self.connect()
+
+        try:
+            await self.send(setTdlibParameters(self.tdlib_parameters()))
+            await self.send(checkDatabaseEncryptionKey(""))
+        except Exception as e:
+            print(e)
+            self.stop()
+
+    async def restart(self):
+        self.stop()
+        await self.start(self.updates_queue, self.main_workers, self.single_stage)
+
+    def set_result(self, msg_id: int, data: Object):
+        future = self.pending.get(msg_id)
+
+        if future is not None:
+            self.loop.call_soon_threadsafe(self.complete, future, data)
+
+    def put_update(self, update: Object):
+        self.loop.call_soon_threadsafe(self.updates_queue.put_nowait, update)
+
+    def send_async(self, data) -> asyncio.Future:
+        """Put a request on the wire and return an :class:`asyncio.Future` for its response."""
+        msg_id = MsgId()
+        data.extra = msg_id
+        future = self.pending.add(msg_id, self.loop.create_future())
+
+        if self.metrics is not None:
+            self.track(data.ID, future)
+
+        try:
+            self.Send(data.to_json())
+        except OSError as e:
+            future.set_exception(e)
+
+        return future
+
+    def send_threadsafe(self, data) -> Future:
+        """Send from any thread, the returned :class:`concurrent.futures.Future` resolves like :meth:`send_async`."""
+        return asyncio.run_coroutine_threadsafe(self._send(data, True), self.loop)
+
+    async def _send(self, data, wait_response: bool):
+
+        if not wait_response:
+            self.Send(data.to_json())
+            return
+
+        if self.hooks is None:
+            return await self.wait(data)
+
+        token = self.hooks.enter(Hooks.REQUEST, data.ID)
+
+        try:
+            return await self.wait(data)
+        finally:
+            self.hooks.exit(Hooks.REQUEST, data.ID, token)
+
+    async def wait(self, data):
+        try:
+            return await asyncio.wait_for(self.send_async(data), self.pending.timeout + self.WAIT_GRACE)
+        except asyncio.TimeoutError:
+            # Raised by the local bound (wait_for cancelled the future) or by the pending table
+            raise TimeoutError()
+
+    async def send(self, data, wait_response: bool = True):
+        attempt = 0
+
+        while True:
+            wait = self.retry_policy.flood_wait(data)
+
+            if wait:
+                await asyncio.sleep(wait)
+
+            try:
+                return await self._send(data, wait_response)
+            except (Error, OSError, TimeoutError) as e:
+                delay = self.retry_policy.on_error(data, e, attempt)
+
+                if delay is None:
+                    if isinstance(e, Error):
+                        raise
+                    return None
+
+            if self.metrics is not None:
+                self.metrics.retries.inc(data.ID)
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def send_many(self, requests: list, return_exceptions: bool = False) -> list:
+        futures = [self.send_async(i) for i in requests]
+
+        try:
+            return await asyncio.gather(*futures, return_exceptions=return_exceptions)
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+
+    def expire(self, future: asyncio.Future):
+        self.loop.call_soon_threadsafe(self.fail, future, TimeoutError())
+
+    @staticmethod
+    def fail(future: asyncio.Future, exception: Exception):
+        if not future.done():
+            future.set_exception(exception)
@@ -0,0 +1,169 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+from queue import Queue
+from threading import Thread, Lock
+from signal import signal, SIGINT, SIGTERM, SIGABRT
+
+
+class AccountQueue:
+    """Queue facade handed to a hub attached session, tags every update with its account."""
+
+    def __init__(self, queue: Queue, account):
+        self.queue = queue
+        self.account = account
+
+    def put(self, update):
+        if update is not None:
+            self.queue.put((self.account, update))
+
+
+class SessionHub:
+    """Runs many sessions over one receive loop and shared worker pools.
+
+    Every attached session keeps its own TDLib client instance, but none of them start threads of their own:
+    a single ``HubReceiveThread`` polls all clients, ``workers`` threads decode events for any account and
+    ``dispatch_workers`` threads run the account handlers. The thread count stays flat however many accounts
+    are attached.
+
+    Args:
+        workers (:obj:`int`): Decode workers shared by all sessions.
+        dispatch_workers (:obj:`int`): Handler workers shared by all accounts.
+    """
+
+    POLL_TIMEOUT = 0.01
+
+    def __init__(self, workers: int = 2, dispatch_workers: int = 4):
+        self.workers = workers
+        self.dispatch_workers = dispatch_workers
+
+        self.sessions = []
+        self.lock = Lock()
+        self.recv_queue = Queue()
+        self.dispatch_queue = Queue()
+        self.update_handler = None
+        self.is_idle = None
+        self.is_runnig = False
+
+    def start(self):
+        if self.is_runnig:
+            return
+
+        self.is_runnig = True
+
+        for i in range(self.workers):
+            Thread(target=self.update_worker, name="HubUpdateWorker#{}".format(i + 1)).start()
+
+        for i in range(self.dispatch_workers):
+            Thread(target=self.dispatch_worker, name="HubDispatchWorker#{}".format(i + 1)).start()
+
+        Thread(target=self.receive_updates, name="HubReceiveThread").start()
+
+    def stop(self):
+        for session in self.sessions:
+            session.stop()
+
+        self.is_runnig = False
+
+        for _ in range(self.workers):
+            self.recv_queue.put(None)
+
+        for _ in range(self.dispatch_workers):
+            self.dispatch_queue.put(None)
+
+    def attach(self, session):
+        with self.lock:
+            if session not in self.sessions:
+                self.sessions = self.sessions + [session]
+
+    def detach(self, session):
+        with self.lock:
+            self.sessions = [i for i in self.sessions if i is not session]
+
+    def queue(self, account) -> AccountQueue:
+        return AccountQueue(self.dispatch_queue, account)
+
+    def set_update_handler(self, callback: callable):
+        """Handler called as ``callback(client, update)`` for every logged in account."""
+        self.update_handler = callback
+
+    def receive_updates(self):
+
+        while self.is_runnig:
+            received = False
+
+            # Copy-on-write list: attach/detach swap it, so it is iterated without the lock.
+            for session in self.sessions:
+
+                if not session.is_runnig:
+                    continue
+
+                event = session.receive(timeout=0.0)
+
+                if event:
+                    received = True
+
+                    if session.recorder is not None:
+                        session.recorder.record(event)
+
+                    if session.is_wanted(event):
+                        self.recv_queue.put((session, event))
+
+            if not received:
+                time.sleep(self.POLL_TIMEOUT)
+
+    def update_worker(self):
+
+        while True:
+            item = self.recv_queue.get()
+
+            if item is None:
+                break
+
+            session, event = item
+            session.process_update(event)
+
+    def dispatch_worker(self):
+
+        while True:
+            item = self.dispatch_queue.get()
+
+            if item is None:
+                break
+
+            account, update = item
+
+            try:
+                account.handle_update(update)
+            except Exception as e:
+                print(e)
+
+    def signal_handler(self, *args):
+        self.stop()
+        self.is_idle = False
+
+    def idle(self, stop_signals: tuple = (SIGINT, SIGTERM, SIGABRT)):
+
+        for s in stop_signals:
+            signal(s, self.signal_handler)
+
+        self.is_idle = True
+
+        while self.is_idle:
+            time.sleep(1)
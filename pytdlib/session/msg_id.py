@@ -16,19 +16,12 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
 
-from threading import Lock
-from time import time
+from itertools import count
+
 
 class MsgId:
-    last_time = 0
-    offset = 0
-    lock = Lock()
+    # next() on itertools.count is atomic under the GIL, so ids are unique across threads without a lock.
+    counter = count(1)
 
     def __new__(cls) -> int:
-        with cls.lock:
-            now = time()
-            cls.offset = cls.offset + 4 if now == cls.last_time else 0
-            msg_id = int(now * 2 ** 32) + cls.offset
-            cls.last_time = now
-
-            return msg_id
\ No newline at end of file
+        return next(cls.counter)
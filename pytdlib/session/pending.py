@@ -0,0 +1,136 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+from math import ceil
+from threading import Thread, Lock
+from time import monotonic, sleep
+from concurrent.futures import InvalidStateError
+
+
+class TimerWheel:
+    """Expires deadlines of every pending table in the process from one thread.
+
+    Deadlines are hashed into ``SLOTS`` buckets of ``TICK`` seconds. Each tick drains one bucket and expires
+    everything that is due, entries further than one revolution away are put back for the next round.
+    Buckets are only ever appended to and popped from, so scheduling needs no lock.
+    """
+
+    TICK = 0.1
+    SLOTS = 1024
+
+    def __init__(self):
+        self.slots = [[] for _ in range(self.SLOTS)]
+        self.cursor = 0
+        self.lock = Lock()
+        self.thread = None
+
+    def schedule(self, deadline: float, table: "Pending", msg_id: int):
+        if self.thread is None:
+            self.run()
+
+        self.insert((deadline, table, msg_id), monotonic())
+
+    def insert(self, entry: tuple, now: float):
+        ticks = min(max(1, ceil((entry[0] - now) / self.TICK)), self.SLOTS - 1)
+        self.slots[(self.cursor + ticks) % self.SLOTS].append(entry)
+
+    def run(self):
+        with self.lock:
+            if self.thread is None:
+                self.thread = Thread(target=self.worker, name="TimerWheel", daemon=True)
+                self.thread.start()
+
+    def worker(self):
+        next_tick = monotonic()
+
+        while True:
+            next_tick += self.TICK
+            sleep(max(0.0, next_tick - monotonic()))
+
+            now = monotonic()
+            bucket = self.slots[self.cursor % self.SLOTS]
+
+            # The cursor only moves on once the bucket is empty: insert() places entries 1 to SLOTS - 1 ticks
+            # ahead of it, never back into the bucket being drained
+            while bucket:
+                entry = bucket.pop()
+
+                if entry[0] <= now:
+                    entry[1].expire_id(entry[2])
+                else:
+                    self.insert(entry, now)
+
+            self.cursor += 1
+
+
+class Pending:
+    """In-flight requests of one session, keyed by their ``@extra``.
+
+    Entries are removed as soon as their future is done, whether it was resolved, failed, cancelled or expired
+    by the shared :class:`TimerWheel`.
+    """
+
+    wheel = TimerWheel()
+
+    def __init__(self, timeout: float, expire: callable = None):
+        self.timeout = timeout
+        self.futures = {}
+
+        if expire is not None:
+            self.expire = expire
+
+    def __len__(self) -> int:
+        return len(self.futures)
+
+    def __contains__(self, msg_id: int) -> bool:
+        return msg_id in self.futures
+
+    @property
+    def in_flight(self) -> int:
+        return len(self.futures)
+
+    def add(self, msg_id: int, future, timeout: float = None):
+        self.futures[msg_id] = future
+        future.add_done_callback(lambda f: self.futures.pop(msg_id, None))
+        self.wheel.schedule(monotonic() + (self.timeout if timeout is None else timeout), self, msg_id)
+
+        return future
+
+    def get(self, msg_id: int):
+        return self.futures.get(msg_id)
+
+    def cancel(self, msg_id: int) -> bool:
+        future = self.futures.pop(msg_id, None)
+        return future is not None and future.cancel()
+
+    def cancel_all(self):
+        for msg_id in list(self.futures):
+            self.cancel(msg_id)
+
+    def expire_id(self, msg_id: int):
+        future = self.futures.pop(msg_id, None)
+
+        if future is not None and not future.done():
+            self.expire(future)
+
+    @staticmethod
+    def expire(future):
+        try:
+            future.set_exception(TimeoutError())
+        except InvalidStateError:
+            pass
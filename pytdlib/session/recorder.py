@@ -0,0 +1,128 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+import gzip
+from queue import Queue, Empty
+from threading import Thread
+from time import time, sleep, perf_counter
+
+
+class Recorder:
+    """Appends every raw event a session receives to a gzip file, pass it as ``Client(recorder=...)``.
+
+    Each event is one ``<unix time> <json>`` line. The receive thread only queues ``(time, event)``, a background
+    thread compresses and writes them in batches, flushing after each one so a crash loses at most the last
+    batch. Every run appends a new gzip member, which ``gzip`` reads back as one stream.
+    """
+
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(self, path: str):
+        self.path = path
+        self.queue = Queue()
+        self.thread = Thread(target=self.writer, name="Recorder", daemon=True)
+        self.thread.start()
+
+    def record(self, event: bytes):
+        self.queue.put_nowait((time(), event))
+
+    def writer(self):
+        with gzip.open(self.path, "ab") as f:
+            while True:
+                try:
+                    batch = [self.queue.get(timeout=self.FLUSH_INTERVAL)]
+                except Empty:
+                    continue
+
+                while True:
+                    try:
+                        batch.append(self.queue.get_nowait())
+                    except Empty:
+                        break
+
+                closed = batch[-1] is None
+
+                f.write(b"".join(b"%.6f %s\n" % item for item in batch if item is not None))
+                f.flush()
+
+                if closed:
+                    break
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+
+
+class Replayer:
+    """Reads a :class:`Recorder` file back and feeds its events to a callable, usually ``Session.process_update``."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __iter__(self):
+        with gzip.open(self.path, "rb") as f:
+            try:
+                for line in f:
+                    stamp, _, event = line.rstrip(b"\n").partition(b" ")
+
+                    if event:
+                        yield float(stamp), event
+            except EOFError:
+                # The last member of a recording cut short by a crash
+                return
+
+    def run(self, feed: callable, speed: float = None) -> dict:
+        """Call ``feed(event)`` for every recorded event.
+
+        With ``speed`` the recorded gaps are kept, divided by ``speed`` (``1.0`` is real time); without it events
+        go as fast as ``feed`` takes them.
+        """
+        count = 0
+        first = None
+        start = perf_counter()
+
+        for stamp, event in self:
+            if speed is not None:
+                if first is None:
+                    first = stamp
+
+                delay = (stamp - first) / speed - (perf_counter() - start)
+
+                if delay > 0:
+                    sleep(delay)
+
+            feed(event)
+            count += 1
+
+        elapsed = perf_counter() - start
+
+        return {"events": count, "seconds": elapsed, "events/s": count / elapsed if elapsed else 0.0}
+
+
+class CallQueue:
+    """Queue facade calling ``callback`` with every update put on it, replays dispatch on the feeding thread."""
+
+    def __init__(self, callback: callable):
+        self.callback = callback
+
+    def put(self, update):
+        if update is not None:
+            self.callback(update)
+
+    def qsize(self) -> int:
+        return 0
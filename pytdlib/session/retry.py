@@ -0,0 +1,156 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+import re
+from random import uniform
+from threading import Lock
+from time import monotonic
+from pytdlib.api.errors import Error, FloodWait
+
+RETRY_AFTER_RE = re.compile(r"retry after (\d+)")
+
+
+class RetryPolicy:
+    """Decides whether a failed request is sent again and how long to wait first.
+
+    * :obj:`OSError` and :obj:`TimeoutError` are retried with exponential backoff and full jitter.
+    * FLOOD_WAIT_X (and TDLib's ``429 retry after X``) sleeps the requested seconds and retries. The wait is
+      remembered for the method and ``chat_id`` that triggered it, so other requests to the same scope wait
+      before being sent instead of hitting the limit again. Expired waits are pruned as new ones come in and at
+      most ``MAX_FLOODS`` scopes are remembered, the one expiring first making room.
+    * Every retry spends one token from a budget refilled at ``budget`` tokens per ``budget_window`` seconds.
+      Once it is empty failures are reported immediately instead of piling retries onto a struggling server.
+
+    Args:
+        max_retries (:obj:`int`): Attempts per request, including the first one.
+        base_delay (:obj:`float`): Backoff of the first retry, doubled on each attempt.
+        max_delay (:obj:`float`): Backoff ceiling.
+        max_flood_wait (:obj:`int`): Longest FLOOD_WAIT slept through, longer ones are raised.
+        budget (:obj:`int`): Retries allowed per window, ``None`` for unlimited.
+        budget_window (:obj:`float`): Budget refill period in seconds.
+    """
+
+    def __init__(self,
+                 max_retries: int = 5,
+                 base_delay: float = 0.1,
+                 max_delay: float = 10.0,
+                 max_flood_wait: int = 60,
+                 budget: int = None,
+                 budget_window: float = 60.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_flood_wait = max_flood_wait
+        self.budget = budget
+        self.budget_window = budget_window
+
+        self.tokens = budget
+        self.refilled = monotonic()
+        self.floods = {}
+        self.pruned = monotonic()
+        self.lock = Lock()
+
+    MAX_FLOODS = 10000
+    PRUNE_INTERVAL = 60.0
+
+    @staticmethod
+    def scope(data) -> tuple:
+        return data.ID, getattr(data, "chat_id", None)
+
+    @staticmethod
+    def flood_seconds(error: Exception) -> int:
+        if isinstance(error, FloodWait):
+            return int(error.x or 0)
+
+        if isinstance(error, Error):
+            match = RETRY_AFTER_RE.search(str(error))
+
+            if match is not None:
+                return int(match.group(1))
+
+        return None
+
+    def backoff(self, attempt: int) -> float:
+        return uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def flood_wait(self, data) -> float:
+        """Seconds left on a FLOOD_WAIT recorded for the scope of ``data``."""
+        if not self.floods:
+            return 0.0
+
+        scope = self.scope(data)
+        until = self.floods.get(scope)
+
+        if until is None:
+            return 0.0
+
+        left = until - monotonic()
+
+        if left <= 0:
+            self.floods.pop(scope, None)
+            return 0.0
+
+        return left
+
+    def add_flood(self, scope: tuple, seconds: int):
+        with self.lock:
+            now = monotonic()
+
+            if len(self.floods) >= self.MAX_FLOODS or now - self.pruned >= self.PRUNE_INTERVAL:
+                # Rebound rather than mutated, flood_wait reads the dict without the lock
+                self.floods = {k: v for k, v in self.floods.items() if v > now}
+                self.pruned = now
+
+                while len(self.floods) >= self.MAX_FLOODS:
+                    del self.floods[min(self.floods, key=self.floods.get)]
+
+            self.floods[scope] = now + seconds
+
+    def spend(self) -> bool:
+        if self.budget is None:
+            return True
+
+        with self.lock:
+            now = monotonic()
+            self.tokens = min(self.budget, self.tokens + (now - self.refilled) * self.budget / self.budget_window)
+            self.refilled = now
+
+            if self.tokens < 1:
+                return False
+
+            self.tokens -= 1
+            return True
+
+    def on_error(self, data, error: Exception, attempt: int) -> float:
+        """Delay before the next attempt, or ``None`` when the request should fail with ``error``."""
+        if attempt + 1 >= self.max_retries:
+            return None
+
+        seconds = self.flood_seconds(error)
+
+        if seconds is not None:
+            if seconds > self.max_flood_wait or not self.spend():
+                return None
+
+            self.add_flood(self.scope(data), seconds)
+            return seconds
+
+        if isinstance(error, (OSError, TimeoutError)) and self.spend():
+            return self.backoff(attempt)
+
+        return None
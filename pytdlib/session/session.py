@@ -18,29 +18,32 @@
 
 import os
 import libconf
+from functools import partial
 import pytdlib
-from json import loads
 from queue import Queue
+from time import sleep, perf_counter
 from ctypes import CDLL
 from pathlib import Path
 from .msg_id import MsgId
+from .pending import Pending
+from .retry import RetryPolicy
+from .recorder import Replayer
 from pytdlib.actor import Actor
-from threading import Thread, Event
+from threading import Thread
+from concurrent.futures import Future, InvalidStateError, TimeoutError as FutureTimeoutError
 from pytdlib.api.util import Object
+from pytdlib.metrics.hooks import Hooks, Hooked
 from pytdlib.api.errors import Error
 from pytdlib.api.functions import setTdlibParameters, checkDatabaseEncryptionKey
 
 
-class Result:
-    def __init__(self):
-        self.value = None
-        self.event = Event()
-
-
 class Session(Actor):
     WAIT_TIMEOUT = 10
+    WAIT_GRACE = 1.0
     MAX_RETRIES = 5
     WORKERS = 2
+    REQUIRED_TYPES = ("updateAuthorizationState", "authorizationStateClosing", "authorizationStateClosed",
+                      "authorizationStateLoggingOut")
     config_name = "config"
     config_directory = "{0}/.telegram-bot".format(Path.home())
     login = False
@@ -57,9 +60,12 @@ class Session(Actor):
     api_id = 2899
     api_hash = "36722c72256a24c1225de00eb6a1ca74"
 
-    def __init__(self, tdjson: CDLL, profile: str = None, config: str = None):
+    def __init__(self, tdjson: CDLL, profile: str = None, config: str = None, lazy: bool = False,
+                 retry_policy: RetryPolicy = None):
         self.profile = profile
         self.config = config
+        self.lazy = lazy
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy(self.MAX_RETRIES)
         super(Session, self ).__init__(tdjson)
 
         self.load_config()
@@ -67,7 +73,7 @@ class Session(Actor):
         self.default_config = True
 
         self.recv_queue = Queue()
-        self.results = {}
+        self.pending = Pending(self.WAIT_TIMEOUT)
 
         self.token_key = None
         self.phone_number = None
@@ -77,65 +83,90 @@ class Session(Actor):
         self.last_name = None
         self.client_id = None
         self.main_workers = 0
+        self.workers = 0
+        self.single_stage = False
         self.updates_queue = None
+        self.update_types = None
+        self.wanted_types = None
+        self.listeners = []
+        self.listener_types = set()
+        self.execute_cache = None
+        self.metrics = None
+        self.hooks = None
+        self.recorder = None
         self.recv_thread = None
+        self.hub = None
         self.is_runnig = False
 
-    def start(self, updates_queue: Queue, main_workers: int):
+    def start(self, updates_queue: Queue, main_workers: int, single_stage: bool = False):
         self.main_workers = main_workers
         self.updates_queue = updates_queue
+        self.single_stage = single_stage
+
+        self.connect()
 
+        try:
+            self.send(setTdlibParameters(self.tdlib_parameters()))
+            self.send(checkDatabaseEncryptionKey(""))
+        except Exception as e:
+            print(e)
+            self.stop()
+
+    def connect(self):
         self.create()
 
-        for i in range(self.WORKERS):
+        if self.hub is not None:
+            self.workers = 0
+            self.is_runnig = True
+            self.hub.attach(self)
+            return
+
+        self.workers = 0 if self.single_stage else self.WORKERS
+
+        for i in range(self.workers):
             Thread(target=self.update_worker, name="UpdateWorker#{}".format(i + 1)).start()
 
         self.is_runnig = True
 
         Thread(target=self.receive_updates, name="ReceiveThread").start()
 
-        try:
-            self.send(
-                setTdlibParameters(
-                    Object.all["tdlibParameters"](
-                        self.test_mode,
-                        '{}/data'.format(self.config_directory),
-                        '{}/files'.format(self.config_directory),
-                        self.use_file_db,
-                        self.use_chat_info_db,
-                        self.use_message_db,
-                        self.use_secret_chats,
-                        self.api_id,
-                        self.api_hash,
-                        "en",
-                        "Unix/Console/Bot",
-                        "UNIX/??",
-                        '1.1.1',
-                        self.use_file_gc,
-                        self.file_readable_names
-                    )
-                )
-            )
-            self.send(checkDatabaseEncryptionKey(""))
-        except Exception as e:
-            print(e)
-            self.stop()
+    def tdlib_parameters(self):
+        return Object.all["tdlibParameters"](
+            self.test_mode,
+            '{}/data'.format(self.config_directory),
+            '{}/files'.format(self.config_directory),
+            self.use_file_db,
+            self.use_chat_info_db,
+            self.use_message_db,
+            self.use_secret_chats,
+            self.api_id,
+            self.api_hash,
+            "en",
+            "Unix/Console/Bot",
+            "UNIX/??",
+            '1.1.1',
+            self.use_file_gc,
+            self.file_readable_names
+        )
 
     def stop(self):
 
         self.is_runnig = False
 
-        for _ in range(self.WORKERS):
+        if self.hub is not None:
+            self.hub.detach(self)
+
+        for _ in range(self.workers):
             self.recv_queue.put(None)
 
         for _ in range(self.main_workers):
-            self.updates_queue.put(None)
+            self.put_update(None)
 
         self.destroy()
 
     def restart(self):
         self.stop()
-        self.start(self.updates_queue, self.main_workers)
+        self.start(self.updates_queue, self.main_workers, self.single_stage)
 
     def update_worker(self):
 
@@ -147,8 +178,19 @@ class Session(Actor):
 
             self.process_update(update)
 
-    def process_update(self, update: bytes):
-        data = loads(update.decode('utf-8'))
+    def process_update(self, update: bytes, replayed: bool = False):
+        hooks = self.hooks
+
+        if self.metrics is not None:
+            start = perf_counter()
+
+        if hooks is None:
+            data = Object.codec.loads(update)
+        else:
+            token = hooks.enter(Hooks.LOADS)
+            data = Object.codec.loads(update)
+            hooks.exit(Hooks.LOADS, data["@type"], token)
+
         msg_id = data["@extra"] if "@extra" in data else None
 
         if data["@type"] == "authorizationStateClosing":
@@ -160,14 +202,55 @@ class Session(Actor):
             print("Client logged out!")
             self.stop()
 
-        data = Object.read(data)
+        if hooks is None:
+            data = Object.read_lazy(data) if self.lazy else Object.read(data)
+        else:
+            token = hooks.enter(Hooks.READ, data["@type"])
+            data = Object.read_lazy(data) if self.lazy else Object.read(data)
+            hooks.exit(Hooks.READ, data.ID, token)
+
+        if self.metrics is not None:
+            self.metrics.decode.observe(data.ID, perf_counter() - start)
+
+        # Listeners (caches) see the object before the caller does, but a failing one must never lose a response
+        for listener in self.listeners:
+            try:
+                listener(data)
+            except Exception as e:
+                print("Listener {!r} failed on {}: {}".format(listener, data.ID, e))
+
+        # A recorded response's @extra belongs to another run and may collide with a live msg_id
+        if msg_id is not None and not replayed:
+            self.set_result(msg_id, data)
+
+        if self.updates_queue is not None and (self.update_types is None or data.ID in self.update_types):
+            self.put_update(data)
+
+    def set_result(self, msg_id: int, data: Object):
+        future = self.pending.get(msg_id)
+
+        if future is not None:
+            self.complete(future, data)
 
-        if msg_id in self.results:
-            self.results[msg_id].value = data
-            self.results[msg_id].event.set()
+    @staticmethod
+    def complete(future, data: Object):
+        if future.done():
+            return
+
+        try:
+            if isinstance(data, Object.all["error"]):
+                try:
+                    Error.raise_it(data.code, data.message)
+                except Error as e:
+                    future.set_exception(e)
+            else:
+                future.set_result(data)
+        except InvalidStateError:
+            # Expired or cancelled by another thread in the meantime
+            pass
 
-        if self.updates_queue is not None:
-            self.updates_queue.put(data)
+    def put_update(self, update: Object):
+        self.updates_queue.put(update)
 
     def receive_updates(self):
 
@@ -177,49 +260,194 @@ class Session(Actor):
                 break
 
             event = self.receive()
-            if event:
-                self.recv_queue.put(event)
+            if not event:
+                continue
 
+            if self.recorder is not None:
+                self.recorder.record(event)
 
-    def _send(self, data, wait_response: bool):
+            if self.is_wanted(event):
+                if self.single_stage:
+                    self.process_update(event)
+                else:
+                    self.recv_queue.put(event)
+
+
+    def subscribe(self, update_types: list = None):
+        if update_types is None:
+            self.update_types = None
+            self.wanted_types = None
+        else:
+            self.update_types = set(update_types) | set(self.REQUIRED_TYPES)
+            self.wanted_types = self.update_types | self.listener_types
 
-        if wait_response:
-            msg_id = MsgId()
-            data.extra = msg_id
-            self.results[msg_id] = Result()
+    def set_hooks(self, hooks: Hooks):
+        """Report the hot paths to ``hooks``, see :class:`pytdlib.metrics.Hooks` for the hook points."""
+        self.hooks = hooks
+        self.receive = Hooked(self.receive, hooks, Hooks.RECEIVE)
+        self.Send = Hooked(self.Send, hooks, Hooks.SEND)
+
+    def add_listener(self, listener: callable, update_types: list = ()):
+        """Call ``listener(object)`` with every decoded update and response, before handlers see it.
+
+        ``update_types`` are received even when the update handler isn't subscribed to them.
+        """
+        self.listeners.append(listener)
+        self.listener_types.update(update_types)
+        self.subscribe(self.update_types)
+
+    def is_wanted(self, event: bytes) -> bool:
+        if self.wanted_types is None or b'"@extra"' in event:
+            return True
+
+        if event.startswith(b'{"@type":"'):
+            return event[10:event.index(b'"', 10)].decode('utf-8') in self.wanted_types
+
+        return True
+
+    def send_async(self, data) -> Future:
+        """Put a request on the wire and return a :class:`concurrent.futures.Future` for its response.
+
+        The future resolves to the response object, or fails with the matching :class:`pytdlib.Error`.
+        """
+        msg_id = MsgId()
+        data.extra = msg_id
+        future = self.pending.add(msg_id, Future())
+
+        if self.metrics is not None:
+            self.track(data.ID, future)
 
         try:
             self.Send(data.to_json())
-        except OSError:
-            if wait_response:
-                self.results.pop(msg_id, None)
+        except OSError as e:
+            future.set_exception(e)
 
-        if wait_response:
+        return future
 
-            self.results[msg_id].event.wait(self.WAIT_TIMEOUT)
-            result = self.results.pop(msg_id).value
+    def send_threadsafe(self, data) -> Future:
+        return self.send_async(data)
 
-            if result is None:
-                raise TimeoutError
-            elif isinstance(result, Object.all["error"]):
-                Error.raise_it(result.code, result.message)
-            else:
-                return result
+    def track(self, request_type: str, future):
+        start = perf_counter()
+        metrics = self.metrics
+        future.add_done_callback(lambda f: metrics.request_done(request_type, perf_counter() - start, f))
+
+    def _send(self, data, wait_response: bool):
+
+        if not wait_response:
+            self.Send(data.to_json())
+            return
+
+        if self.hooks is None:
+            return self.wait(data)
+
+        token = self.hooks.enter(Hooks.REQUEST, data.ID)
+
+        try:
+            return self.wait(data)
+        finally:
+            self.hooks.exit(Hooks.REQUEST, data.ID, token)
+
+    def wait(self, data):
+        # Expiry is enforced by the pending table, which fails the future with TimeoutError. The local bound is a
+        # backstop so a caller never blocks forever should the timer wheel miss it.
+        future = self.send_async(data)
+
+        try:
+            return future.result(self.pending.timeout + self.WAIT_GRACE)
+        except FutureTimeoutError:
+            self.pending.cancel(data.extra)
+            raise TimeoutError()
 
     def send(self, data, wait_response: bool = True):
-        for i in range(self.MAX_RETRIES):
+        attempt = 0
+
+        while True:
+            wait = self.retry_policy.flood_wait(data)
+
+            if wait:
+                sleep(wait)
 
             try:
                 return self._send(data, wait_response)
-            except (OSError, TimeoutError):
-                continue
-        else:
-            return None
+            except (Error, OSError, TimeoutError) as e:
+                delay = self.retry_policy.on_error(data, e, attempt)
+
+                if delay is None:
+                    if isinstance(e, Error):
+                        raise
+                    return None
+
+            if self.metrics is not None:
+                self.metrics.retries.inc(data.ID)
+
+            attempt += 1
+            sleep(delay)
+
+    def send_many(self, requests: list, return_exceptions: bool = False) -> list:
+        """Send all requests at once and wait for every response.
+
+        Results are returned in request order. With ``return_exceptions`` a failed request yields its
+        :class:`pytdlib.Error` (or :obj:`TimeoutError`) in place of the result, otherwise the first one is raised.
+        """
+        futures = []
+
+        for request in requests:
+            future = self.send_async(request)
+            futures.append((request.extra, future))
+
+        results = []
+
+        try:
+            for msg_id, future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+        except Exception:
+            for msg_id, future in futures:
+                self.pending.cancel(msg_id)
+            raise
+
+        return results
+
+    def replay(self, path: str, speed: float = None) -> dict:
+        """Feed a :class:`pytdlib.session.Recorder` file through :meth:`process_update` on this thread.
+
+        Recorded responses are decoded and passed on like updates but never complete a pending request.
+        """
+        return Replayer(path).run(partial(self.process_update, replayed=True), speed)
+
+    @property
+    def send_timeout(self) -> float:
+        """Rough upper bound of a :meth:`send`, every attempt timing out."""
+        return self.pending.timeout * self.retry_policy.max_retries
+
+    @property
+    def in_flight(self) -> int:
+        return self.pending.in_flight
 
     def execute(self, data):
-        data =  self.Execute(data.to_json())
-        data = loads(data.decode('utf-8'))
-        return Object.all[data["@type"]].read(data)
+        cache = self.execute_cache
+
+        if cache is None or data.ID not in cache.FUNCTIONS:
+            data = self.Execute(data.to_json())
+            data = Object.codec.loads(data)
+            return Object.all[data["@type"]].read(data)
+
+        key = data.to_json()
+        result = cache.get(key)
+
+        if result is None:
+            data = Object.codec.loads(self.Execute(key))
+            result = Object.all[data["@type"]].read(data)
+
+            if result.ID != "error":
+                cache.put(key, result)
+
+        return result
 
     def load_config(self):
         if not self.config:
@@ -1,5 +1,7 @@
+import sys
+
 from generate.api import generator as api_generator
 from generate.error import generator as error_generator
 
-api_generator.start()
+api_generator.start(consolidated="--consolidated" in sys.argv)
 error_generator.start()
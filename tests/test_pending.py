@@ -0,0 +1,64 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from concurrent.futures import Future
+from time import sleep, process_time, monotonic
+
+from pytdlib.session.pending import TimerWheel, Pending
+
+
+class SmallWheel(TimerWheel):
+    TICK = 0.01
+    SLOTS = 8
+
+
+class TimerWheelTest(unittest.TestCase):
+
+    def setUp(self):
+        self.pending = Pending(0.05)
+        self.pending.wheel = SmallWheel()
+
+    def test_expires_beyond_one_revolution(self):
+        revolution = SmallWheel.TICK * SmallWheel.SLOTS
+        start, cpu = monotonic(), process_time()
+
+        long = self.pending.add(1, Future(), timeout=revolution * 3)
+        sleep(revolution * 1.5)
+        short = self.pending.add(2, Future())
+
+        self.assertIsInstance(short.exception(timeout=1.0), TimeoutError)
+        self.assertFalse(long.done())
+        self.assertIsInstance(long.exception(timeout=1.0), TimeoutError)
+        self.assertGreaterEqual(monotonic() - start, revolution * 3)
+        self.assertEqual(len(self.pending), 0)
+
+        # A wheel spinning on one bucket burns a whole CPU
+        self.assertLess(process_time() - cpu, (monotonic() - start) / 2)
+
+    def test_resolved_entries_leave_the_table(self):
+        future = self.pending.add(1, Future())
+        future.set_result(None)
+
+        self.assertNotIn(1, self.pending)
+        sleep(0.1)
+        self.assertIsNone(future.result())
+
+
+if "__main__" == __name__:
+    unittest.main()
@@ -0,0 +1,43 @@
+# Pytdlib - Python Bindings and Client for TDLib (Telegram database library).
+# Copyright (C) 2018-2019 Naji <https://github.com/i-naji>
+#
+# This file is part of Pytdlib.
+#
+# Pytdlib is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pytdlib is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Pytdlib.  If not, see <http://www.gnu.org/licenses/>.
+
+import pickle
+import unittest
+from importlib import import_module
+
+import pytdlib.api.types as types
+from pytdlib.api.util import Object
+from benchmarks.tdjson import message
+
+
+class LazyTypesTest(unittest.TestCase):
+
+    def test_submodule_import_keeps_the_class(self):
+        for name in ("message", "chat", "user", "file"):
+            import_module("pytdlib.api.types." + types.modules[name])
+            self.assertIsInstance(getattr(types, name), type)
+
+    def test_unpickled_object_matches_its_class(self):
+        obj = pickle.loads(pickle.dumps(Object.read(message(1))))
+        from pytdlib.api.types import message as cls
+
+        self.assertIsInstance(obj, cls)
+
+
+if "__main__" == __name__:
+    unittest.main()